@@ -0,0 +1 @@
+"""Local agents used by the serverless functions in api/."""
@@ -0,0 +1,190 @@
+"""
+Fixed Cost Recommender
+======================
+
+Recommends scheduled amounts for a user's fixed costs from their own
+expense history, and proposes fixed costs for recurring expenses that are
+not tracked yet. Detection runs locally (see recurring_expenses); Supabase
+is only used to read the history and to write the scheduled amounts back.
+
+run_recommendation_workflow(year_month, user_id) is the entry point used by
+api/recommend-fixed-costs.py.
+"""
+
+import hashlib
+import json
+import os
+from typing import Callable, List, Mapping, Optional, Sequence, Tuple
+
+from agents.recurring_expenses import detect_recurring_expenses, recommend_fixed_costs
+
+# Months of history scanned before the target month.
+HISTORY_MONTHS = 36
+# Supabase caps a select at 1000 rows; history is read in pages of this size.
+PAGE_SIZE = 1000
+
+
+def create_supabase_client():
+    try:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+    except ImportError:
+        pass
+    from supabase import create_client
+
+    url = os.environ.get("SUPABASE_URL") or os.environ.get("VITE_SUPABASE_URL")
+    key = (
+        os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+        or os.environ.get("SUPABASE_ANON_KEY")
+        or os.environ.get("VITE_SUPABASE_ANON_KEY")
+    )
+    if not url or not key:
+        raise RuntimeError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set")
+    return create_client(url, key)
+
+
+def _history_start(year_month: str) -> str:
+    year, month = (int(part) for part in year_month.split("-"))
+    index = year * 12 + month - 1 - HISTORY_MONTHS
+    return f"{index // 12:04d}-{index % 12 + 1:02d}-01"
+
+
+def _fetch_all(build_query: Callable[[], object]) -> List[dict]:
+    rows: List[dict] = []
+    while True:
+        page = build_query().range(len(rows), len(rows) + PAGE_SIZE - 1).execute().data or []
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            return rows
+
+
+def load_expenses(client, year_month: str, user_id: str) -> List[dict]:
+    """The user's expenses from HISTORY_MONTHS before ``year_month`` up to it."""
+    start, end = _history_start(year_month), f"{year_month}-01"
+    return _fetch_all(
+        lambda: client.table("expenses")
+        .select("id,category_id,date,amount,memo")
+        .eq("created_by", user_id)
+        .gte("date", start)
+        .lt("date", end)
+        .order("id")
+    )
+
+
+def load_fixed_costs(client, user_id: str) -> List[dict]:
+    return (
+        client.table("fixed_costs")
+        .select("id,name,category_id,amount,payment_day,is_fixed_amount,is_active")
+        .eq("created_by", user_id)
+        .eq("is_active", True)
+        .execute()
+        .data
+        or []
+    )
+
+
+def load_payment_keys(client, year_month: str, user_id: str) -> List[dict]:
+    """Ids and statuses of the month's payments; amounts are what we write."""
+    return (
+        client.table("fixed_cost_payments")
+        .select("id,fixed_cost_id,status")
+        .eq("created_by", user_id)
+        .eq("year_month", year_month)
+        .order("id")
+        .execute()
+        .data
+        or []
+    )
+
+
+def load_inputs(client, year_month: str, user_id: str) -> Tuple[List[dict], List[dict], List[dict]]:
+    """Everything a recommendation run depends on: expenses, fixed costs, payments."""
+    return (
+        load_expenses(client, year_month, user_id),
+        load_fixed_costs(client, user_id),
+        load_payment_keys(client, year_month, user_id),
+    )
+
+
+def input_fingerprint(*inputs: Sequence[Mapping]) -> str:
+    """Stable hash of the loaded inputs; equal fingerprints give equal results."""
+    digest = hashlib.sha256()
+    for rows in inputs:
+        for row in sorted(rows, key=lambda row: str(row.get("id"))):
+            digest.update(json.dumps(row, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+def build_recommendations(
+    year_month: str,
+    expenses: Sequence[Mapping],
+    fixed_costs: Sequence[Mapping],
+) -> List[dict]:
+    """Pure part of the workflow: history and fixed costs in, recommendations out."""
+    patterns = detect_recurring_expenses(expenses, year_month)
+    return recommend_fixed_costs(patterns, fixed_costs)
+
+
+def _apply_scheduled_amount(client, year_month: str, recommendation: dict) -> int:
+    """Set the month's still-scheduled payment to the recommended amount."""
+    result = (
+        client.table("fixed_cost_payments")
+        .update({"scheduled_amount": recommendation["recommended_amount"]})
+        .eq("fixed_cost_id", recommendation["fixed_cost_id"])
+        .eq("year_month", year_month)
+        .eq("status", "scheduled")
+        .execute()
+    )
+    return len(result.data or [])
+
+
+def run_recommendation_workflow(
+    year_month: str,
+    user_id: str,
+    client=None,
+    apply: bool = True,
+    expenses: Optional[Sequence[Mapping]] = None,
+    fixed_costs: Optional[Sequence[Mapping]] = None,
+) -> dict:
+    """Recommend fixed-cost amounts for ``year_month`` and apply them.
+
+    Only variable-amount fixed costs get their scheduled payment updated;
+    recommendations for fixed-amount costs and proposals for new fixed
+    costs are returned in ``details`` for the user to confirm.
+
+    ``expenses`` and ``fixed_costs`` may be passed in to skip loading them.
+    """
+    errors: List[str] = []
+    try:
+        if expenses is None or fixed_costs is None:
+            client = client or create_supabase_client()
+            if expenses is None:
+                expenses = load_expenses(client, year_month, user_id)
+            if fixed_costs is None:
+                fixed_costs = load_fixed_costs(client, user_id)
+        details = build_recommendations(year_month, expenses, fixed_costs)
+    except Exception as exc:
+        return {"success": False, "updated_count": 0, "details": [], "errors": [str(exc)]}
+
+    updated_count = 0
+    for recommendation in details:
+        recommendation["applied"] = False
+        if not apply or recommendation["action"] != "update" or recommendation["is_fixed_amount"]:
+            continue
+        try:
+            client = client or create_supabase_client()
+            applied = _apply_scheduled_amount(client, year_month, recommendation)
+        except Exception as exc:
+            errors.append(f"{recommendation['fixed_cost_name']}: {exc}")
+            continue
+        recommendation["applied"] = applied > 0
+        updated_count += applied
+
+    return {
+        "success": not errors,
+        "updated_count": updated_count,
+        "details": details,
+        "errors": errors,
+    }
@@ -0,0 +1,126 @@
+"""
+Recommendation Jobs
+===================
+
+Runs fixed-cost recommendations on a local worker pool so the HTTP request
+that asks for one returns immediately, and remembers finished results by
+(year_month, user_id, input fingerprint) so a rerun over unchanged data is
+answered without recomputing.
+
+Jobs and cached results live in process memory: they survive between
+requests served by the same (warm) function instance, not across instances.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
+from agents.fixed_cost_recommender import (
+    create_supabase_client,
+    input_fingerprint,
+    load_inputs,
+    run_recommendation_workflow,
+)
+
+WORKERS = 4
+MAX_JOBS = 256
+MAX_RESULTS = 128
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+class RecommendationJobs:
+    """Job registry, worker pool and result cache for recommendation runs."""
+
+    def __init__(
+        self,
+        client_factory: Callable[[], object] = create_supabase_client,
+        workers: int = WORKERS,
+    ):
+        self._client_factory = client_factory
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="recommend")
+        self._jobs: "OrderedDict[str, dict]" = OrderedDict()
+        self._active: dict = {}
+        self._results: "OrderedDict[Tuple[str, str, str], dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, year_month: str, user_id: str) -> dict:
+        """Queue a run, or return the run already queued for the same month and user."""
+        with self._lock:
+            active = self._jobs.get(self._active.get((year_month, user_id)))
+            if active is not None:
+                return dict(active)
+
+            job = {
+                "job_id": uuid.uuid4().hex,
+                "status": PENDING,
+                "year_month": year_month,
+                "user_id": user_id,
+                "cached": False,
+                "result": None,
+                "error": None,
+                "created_at": time.time(),
+                "finished_at": None,
+            }
+            self._jobs[job["job_id"]] = job
+            self._active[(year_month, user_id)] = job["job_id"]
+            while len(self._jobs) > MAX_JOBS:
+                self._jobs.popitem(last=False)
+            snapshot = dict(job)
+
+        self._executor.submit(self._run_job, job)
+        return snapshot
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def run(self, year_month: str, user_id: str) -> Tuple[dict, bool]:
+        """Run synchronously through the result cache; returns (result, cached)."""
+        client = self._client_factory()
+        expenses, fixed_costs, payments = load_inputs(client, year_month, user_id)
+        key = (year_month, user_id, input_fingerprint(expenses, fixed_costs, payments))
+
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                return cached, True
+
+        result = run_recommendation_workflow(
+            year_month, user_id, client=client, expenses=expenses, fixed_costs=fixed_costs
+        )
+        if result["success"]:
+            with self._lock:
+                self._results[key] = result
+                while len(self._results) > MAX_RESULTS:
+                    self._results.popitem(last=False)
+        return result, False
+
+    def _run_job(self, job: dict) -> None:
+        with self._lock:
+            job["status"] = RUNNING
+        try:
+            result, cached = self.run(job["year_month"], job["user_id"])
+            status, error = (COMPLETED, None) if result["success"] else (FAILED, "; ".join(result["errors"]))
+        except Exception as exc:
+            result, cached, status, error = None, False, FAILED, str(exc)
+        with self._lock:
+            job.update(
+                status=status,
+                result=result,
+                cached=cached,
+                error=error,
+                finished_at=time.time(),
+            )
+            self._active.pop((job["year_month"], job["user_id"]), None)
+
+
+jobs = RecommendationJobs()
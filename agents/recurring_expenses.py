@@ -0,0 +1,332 @@
+"""
+Recurring Expense Detection
+===========================
+
+Finds expenses that repeat once a month (rent, subscriptions, utility
+bills) in a user's expense history and matches them to fixed costs.
+
+Everything here is plain computation over rows that were already loaded:
+no database or network access. The history is turned into parallel
+columns once, sorted by (category, memo cluster, month), and every cluster
+is then summarised in a single pass, so years of history take a few
+milliseconds.
+"""
+
+import math
+import re
+import statistics
+from collections import Counter
+from dataclasses import asdict, dataclass
+from datetime import date
+from itertools import groupby
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+# A cluster needs at least this many distinct months to count as recurring.
+MIN_MONTHS = 3
+# More than this many expenses per active month is a habit, not a bill.
+MAX_PER_MONTH = 1.5
+# Amounts whose coefficient of variation stays below this are fixed.
+FIXED_AMOUNT_CV = 0.03
+# Expenses without a memo are clustered by amount bands of this ratio.
+AMOUNT_BAND = 1.15
+# Unmatched patterns are proposed as new fixed costs above this confidence.
+PROPOSE_CONFIDENCE = 0.6
+# Minimum match score between a fixed cost and a pattern.
+MATCH_THRESHOLD = 0.35
+
+_NOISE = re.compile(r"[\d\W_]+", re.UNICODE)
+# Dates and periods inside memos ("월세 12월", "관리비(3월분)", "2024-01").
+_DATE_TOKEN = re.compile(
+    r"\d{2,4}\s*[-./]\s*\d{1,2}(?:\s*[-./]\s*\d{1,2})?"
+    r"|\d{1,4}\s*(?:년|월분|월|일)"
+    r"|\(\s*\)|\[\s*\]",
+    re.UNICODE,
+)
+
+
+@dataclass
+class RecurringPattern:
+    category_id: str
+    label: str
+    memo_key: str
+    payment_day: int
+    typical_amount: float
+    recommended_amount: int
+    is_fixed_amount: bool
+    months_observed: int
+    coverage: float
+    last_month: str
+    confidence: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def normalize_memo(memo: Optional[str]) -> str:
+    """Lower-case a memo and drop digits, dates and punctuation."""
+    if not memo:
+        return ""
+    return " ".join(_NOISE.sub(" ", _DATE_TOKEN.sub(" ", memo.lower())).split())
+
+
+def memo_label(memo: str) -> str:
+    """A memo with its date and period tokens removed, for use as a name."""
+    label = _DATE_TOKEN.sub(" ", memo)
+    # Parentheses emptied by the first pass.
+    label = _DATE_TOKEN.sub(" ", label)
+    return " ".join(label.split()).strip(" -/.,")
+
+
+def _cluster_label(memos: Sequence[str]) -> str:
+    """The most common cleaned memo of a cluster; the latest wins ties."""
+    labels = [label for label in (memo_label(memo) for memo in memos) if label]
+    if not labels:
+        return ""
+    counts = Counter(labels)
+    best = max(counts.values())
+    return next(label for label in reversed(labels) if counts[label] == best)
+
+
+def _month_index(value: date) -> int:
+    return value.year * 12 + value.month - 1
+
+
+def _format_month_index(index: int) -> str:
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def _parse_month(year_month: str) -> int:
+    year, month = year_month.split("-")
+    return int(year) * 12 + int(month) - 1
+
+
+def _as_date(value) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(str(value)[:10])
+
+
+def _cluster_key(memo_key: str, amount: float) -> str:
+    if memo_key:
+        return memo_key
+    # No memo to go by: bucket amounts on a log scale so a 9,900 and a
+    # 10,000 subscription charge land together.
+    band = round(math.log(max(amount, 1.0)) / math.log(AMOUNT_BAND))
+    return f"#{band}"
+
+
+def _summarise_cluster(
+    category_id: str,
+    memo_key: str,
+    label: str,
+    months: Sequence[int],
+    days: Sequence[int],
+    amounts: Sequence[float],
+    target: int,
+) -> Optional[RecurringPattern]:
+    # Collapse to one (day, amount) per month; several charges in one month
+    # are summed, and the first day of the month is kept.
+    per_month: Dict[int, List] = {}
+    for month, day, amount in zip(months, days, amounts):
+        entry = per_month.get(month)
+        if entry is None:
+            per_month[month] = [day, amount, 1]
+        else:
+            entry[1] += amount
+            entry[2] += 1
+
+    observed = sorted(per_month)
+    count = len(observed)
+    if count < MIN_MONTHS or len(months) / count > MAX_PER_MONTH:
+        return None
+
+    span = observed[-1] - observed[0] + 1
+    coverage = count / span
+    gaps = [later - earlier for earlier, later in zip(observed, observed[1:])]
+    regularity = sum(1 for gap in gaps if gap == 1) / len(gaps)
+
+    month_days = [per_month[month][0] for month in observed]
+    payment_day = int(statistics.median(month_days))
+    day_spread = statistics.median(abs(day - payment_day) for day in month_days)
+    day_score = max(0.0, 1.0 - day_spread / 7.0)
+
+    monthly_amounts = [per_month[month][1] for month in observed]
+    mean_amount = statistics.fmean(monthly_amounts)
+    cv = statistics.pstdev(monthly_amounts) / mean_amount if mean_amount else 0.0
+    is_fixed = cv < FIXED_AMOUNT_CV
+    amount_score = 1.0 / (1.0 + cv)
+
+    months_since = target - observed[-1]
+    recency = 1.0 if months_since <= 1 else 0.5 ** (months_since - 1)
+    history = 1.0 - 0.5 ** (count - 1)
+
+    confidence = (
+        coverage
+        * math.sqrt(regularity)
+        * day_score
+        * recency
+        * history
+        * (0.7 + 0.3 * amount_score)
+    )
+
+    if is_fixed:
+        recommended = statistics.median(monthly_amounts[-3:])
+    else:
+        # Recent months weigh more for bills that drift (utilities, cards).
+        recent = monthly_amounts[-6:]
+        weights = range(1, len(recent) + 1)
+        recommended = sum(w * a for w, a in zip(weights, recent)) / sum(weights)
+
+    typical_amount = statistics.median(monthly_amounts)
+    return RecurringPattern(
+        category_id=category_id,
+        label=label or f"정기 지출 ({int(round(typical_amount)):,}원)",
+        memo_key=memo_key,
+        payment_day=payment_day,
+        typical_amount=round(typical_amount, 2),
+        recommended_amount=int(round(recommended)),
+        is_fixed_amount=is_fixed,
+        months_observed=count,
+        coverage=round(coverage, 3),
+        last_month=_format_month_index(observed[-1]),
+        confidence=round(confidence, 3),
+    )
+
+
+def detect_recurring_expenses(
+    expenses: Iterable[Mapping],
+    target_month: str,
+) -> List[RecurringPattern]:
+    """Monthly recurring patterns in ``expenses`` before ``target_month``.
+
+    Each expense needs ``category_id``, ``date``, ``amount`` and ``memo``.
+    Patterns are returned most confident first.
+    """
+    target = _parse_month(target_month)
+
+    # Column-wise view of the history.
+    categories: List[str] = []
+    keys: List[str] = []
+    labels: List[str] = []
+    months: List[int] = []
+    days: List[int] = []
+    amounts: List[float] = []
+    for expense in expenses:
+        spent_on = _as_date(expense["date"])
+        month = _month_index(spent_on)
+        if month >= target:
+            continue
+        amount = float(expense["amount"])
+        memo = expense.get("memo") or ""
+        categories.append(str(expense["category_id"]))
+        keys.append(_cluster_key(normalize_memo(memo), amount))
+        labels.append(memo.strip())
+        months.append(month)
+        days.append(spent_on.day)
+        amounts.append(amount)
+
+    order = sorted(range(len(months)), key=lambda i: (categories[i], keys[i], months[i], days[i]))
+
+    patterns = []
+    for (category_id, key), rows in groupby(order, key=lambda i: (categories[i], keys[i])):
+        rows = list(rows)
+        pattern = _summarise_cluster(
+            category_id,
+            "" if key.startswith("#") else key,
+            _cluster_label([labels[i] for i in rows]),
+            [months[i] for i in rows],
+            [days[i] for i in rows],
+            [amounts[i] for i in rows],
+            target,
+        )
+        if pattern is not None:
+            patterns.append(pattern)
+
+    patterns.sort(key=lambda pattern: pattern.confidence, reverse=True)
+    return patterns
+
+
+def _name_similarity(name: str, memo_key: str) -> float:
+    name_key = normalize_memo(name)
+    if not name_key or not memo_key:
+        return 0.0
+    if name_key in memo_key or memo_key in name_key:
+        return 1.0
+    name_tokens, memo_tokens = set(name_key.split()), set(memo_key.split())
+    return len(name_tokens & memo_tokens) / len(name_tokens | memo_tokens)
+
+
+def _match_score(fixed_cost: Mapping, pattern: RecurringPattern) -> float:
+    day_gap = abs(int(fixed_cost.get("payment_day") or pattern.payment_day) - pattern.payment_day)
+    day_score = max(0.0, 1.0 - day_gap / 10.0)
+    amount = float(fixed_cost.get("amount") or 0)
+    if amount > 0 and fixed_cost.get("is_fixed_amount", True):
+        amount_score = max(0.0, 1.0 - abs(amount - pattern.typical_amount) / amount)
+    else:
+        amount_score = 0.5
+    return 0.6 * _name_similarity(fixed_cost.get("name", ""), pattern.memo_key) + 0.2 * day_score + 0.2 * amount_score
+
+
+def _reason(pattern: RecurringPattern) -> str:
+    kind = "고정 금액" if pattern.is_fixed_amount else "변동 금액"
+    return (
+        f"최근 {pattern.months_observed}개월 동안 매월 {pattern.payment_day}일 전후로 "
+        f"약 {pattern.recommended_amount:,}원이 지출되었습니다 ({kind})."
+    )
+
+
+def recommend_fixed_costs(
+    patterns: Sequence[RecurringPattern],
+    fixed_costs: Iterable[Mapping],
+) -> List[dict]:
+    """Match patterns to existing fixed costs and propose new ones.
+
+    Returns ``update`` recommendations (a new scheduled amount for an
+    existing fixed cost) and ``create`` proposals for confident patterns no
+    fixed cost covers.
+    """
+    fixed_costs = [cost for cost in fixed_costs if cost.get("is_active", True)]
+    candidates = []
+    for cost_index, cost in enumerate(fixed_costs):
+        for pattern_index, pattern in enumerate(patterns):
+            if str(cost.get("category_id")) != pattern.category_id:
+                continue
+            score = _match_score(cost, pattern)
+            if score >= MATCH_THRESHOLD:
+                candidates.append((score, cost_index, pattern_index))
+
+    # Greedy one-to-one assignment, best matches first.
+    candidates.sort(reverse=True)
+    used_costs, used_patterns = set(), set()
+    recommendations = []
+    for score, cost_index, pattern_index in candidates:
+        if cost_index in used_costs or pattern_index in used_patterns:
+            continue
+        used_costs.add(cost_index)
+        used_patterns.add(pattern_index)
+        cost, pattern = fixed_costs[cost_index], patterns[pattern_index]
+        recommendations.append({
+            "action": "update",
+            "fixed_cost_id": cost["id"],
+            "fixed_cost_name": cost.get("name"),
+            "is_fixed_amount": bool(cost.get("is_fixed_amount", True)),
+            "current_amount": cost.get("amount"),
+            "recommended_amount": pattern.recommended_amount,
+            "confidence": round(pattern.confidence * min(1.0, score + 0.2), 3),
+            "reason": _reason(pattern),
+            "pattern": pattern.to_dict(),
+        })
+
+    for pattern_index, pattern in enumerate(patterns):
+        if pattern_index in used_patterns or pattern.confidence < PROPOSE_CONFIDENCE:
+            continue
+        recommendations.append({
+            "action": "create",
+            "name": pattern.label,
+            "category_id": pattern.category_id,
+            "amount": pattern.recommended_amount,
+            "payment_day": pattern.payment_day,
+            "is_fixed_amount": pattern.is_fixed_amount,
+            "confidence": pattern.confidence,
+            "reason": _reason(pattern),
+            "pattern": pattern.to_dict(),
+        })
+    return recommendations
@@ -0,0 +1,242 @@
+import importlib.util
+import json
+import threading
+import time
+from http.server import HTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from agents.recommendation_jobs import COMPLETED, FAILED, RecommendationJobs
+
+USER = "user-1"
+TARGET = "2024-07"
+API_PATH = Path(__file__).resolve().parents[2] / "api" / "recommend-fixed-costs.py"
+
+
+class FakeQuery:
+    """Just enough of the Supabase query builder for the recommender."""
+
+    def __init__(self, client, table):
+        self.client, self.table = client, table
+        self.columns, self.values = None, None
+        self.filters, self.bounds, self.order_by = [], None, None
+
+    def select(self, columns):
+        self.columns = columns.split(",")
+        return self
+
+    def update(self, values):
+        self.values = values
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def gte(self, column, value):
+        self.filters.append(lambda row: row.get(column) >= value)
+        return self
+
+    def lt(self, column, value):
+        self.filters.append(lambda row: row.get(column) < value)
+        return self
+
+    def order(self, column):
+        self.order_by = column
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end + 1)
+        return self
+
+    def execute(self):
+        rows = [row for row in self.client.tables.get(self.table, []) if all(f(row) for f in self.filters)]
+        if self.values is not None:
+            self.client.updates.append((self.table, self.values, len(rows)))
+            for row in rows:
+                row.update(self.values)
+            return SimpleNamespace(data=rows)
+        if self.order_by:
+            rows.sort(key=lambda row: row[self.order_by])
+        if self.bounds:
+            rows = rows[slice(*self.bounds)]
+        return SimpleNamespace(data=[{column: row.get(column) for column in self.columns} for row in rows])
+
+
+class FakeClient:
+    def __init__(self):
+        amounts = [42000, 55000, 48000, 61000, 52000, 58000]
+        self.tables = {
+            "expenses": [
+                {
+                    "id": f"e{month}", "category_id": "utilities", "date": f"2024-{month:02d}-10",
+                    "amount": amount, "memo": "전기요금", "created_by": USER,
+                }
+                for month, amount in enumerate(amounts, start=1)
+            ],
+            "fixed_costs": [{
+                "id": "cost-1", "name": "전기요금", "category_id": "utilities", "amount": 0,
+                "payment_day": 10, "is_fixed_amount": False, "is_active": True, "created_by": USER,
+            }],
+            "fixed_cost_payments": [{
+                "id": "p1", "fixed_cost_id": "cost-1", "year_month": TARGET, "status": "scheduled",
+                "scheduled_amount": 0, "created_by": USER,
+            }],
+        }
+        self.updates = []
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+
+class RejectingQuery(FakeQuery):
+    def update(self, values):
+        raise RuntimeError("permission denied")
+
+
+def wait_for(registry, job_id, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = registry.get(job_id)
+        if job["status"] in (COMPLETED, FAILED):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_run_applies_recommendation_then_answers_unchanged_inputs_from_cache():
+    client = FakeClient()
+    registry = RecommendationJobs(client_factory=lambda: client, workers=1)
+
+    result, cached = registry.run(TARGET, USER)
+    assert cached is False
+    assert result["success"] is True
+    assert result["updated_count"] == 1
+    assert len(client.updates) == 1
+
+    # Writing the scheduled amount does not touch the fingerprinted columns.
+    again, cached = registry.run(TARGET, USER)
+    assert cached is True
+    assert again is result
+    assert len(client.updates) == 1
+
+    client.tables["expenses"].append({
+        "id": "e7", "category_id": "utilities", "date": "2024-06-20",
+        "amount": 1000, "memo": "전기요금", "created_by": USER,
+    })
+    _, cached = registry.run(TARGET, USER)
+    assert cached is False
+
+
+def test_submit_returns_the_queued_job_for_the_same_month_and_user():
+    release = threading.Event()
+    client = FakeClient()
+
+    def client_factory():
+        release.wait(5)
+        return client
+
+    registry = RecommendationJobs(client_factory=client_factory, workers=1)
+    first = registry.submit(TARGET, USER)
+    second = registry.submit(TARGET, USER)
+    other = registry.submit("2024-08", USER)
+    assert second["job_id"] == first["job_id"]
+    assert other["job_id"] != first["job_id"]
+
+    release.set()
+    job = wait_for(registry, first["job_id"])
+    assert job["status"] == COMPLETED
+    assert job["result"]["updated_count"] == 1
+    wait_for(registry, other["job_id"])
+
+    # Once finished, the next submit is a new run, answered from the cache.
+    rerun = wait_for(registry, registry.submit(TARGET, USER)["job_id"])
+    assert rerun["job_id"] != first["job_id"]
+    assert rerun["cached"] is True
+
+
+def test_failed_runs_are_reported_and_not_cached():
+    def broken_factory():
+        raise RuntimeError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set")
+
+    registry = RecommendationJobs(client_factory=broken_factory, workers=1)
+    job = wait_for(registry, registry.submit(TARGET, USER)["job_id"])
+    assert job["status"] == FAILED
+    assert "SUPABASE_URL" in job["error"]
+    assert job["result"] is None
+    assert registry.get("missing") is None
+
+    client = FakeClient()
+    client.table = lambda name: RejectingQuery(client, name)
+    registry = RecommendationJobs(client_factory=lambda: client, workers=1)
+    job = wait_for(registry, registry.submit(TARGET, USER)["job_id"])
+    assert job["status"] == FAILED
+    assert job["error"] == "전기요금: permission denied"
+    assert job["result"]["success"] is False
+
+    _, cached = registry.run(TARGET, USER)
+    assert cached is False
+
+
+@pytest.fixture
+def api(monkeypatch):
+    spec = importlib.util.spec_from_file_location("recommend_fixed_costs_api", API_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    client = FakeClient()
+    monkeypatch.setattr(module, "recommendation_jobs", RecommendationJobs(client_factory=lambda: client, workers=1))
+
+    server = HTTPServer(("127.0.0.1", 0), module.handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield module, f"http://127.0.0.1:{server.server_port}/api/recommend-fixed-costs"
+    server.shutdown()
+    server.server_close()
+
+
+def call(url, body=None):
+    request = Request(url, data=json.dumps(body).encode("utf-8") if body is not None else None)
+    try:
+        with urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def test_get_requires_a_known_job_id(api):
+    module, url = api
+
+    status, body = call(url)
+    assert status == 400
+    assert body["error"] == "Missing required query parameter: job_id"
+
+    status, body = call(f"{url}?job_id=unknown")
+    assert status == 404
+    assert body["error"] == "Job not found"
+
+    job = module.recommendation_jobs.submit(TARGET, USER)
+    wait_for(module.recommendation_jobs, job["job_id"])
+    status, body = call(f"{url}?job_id={job['job_id']}")
+    assert status == 200
+    assert body["status"] == COMPLETED
+    assert body["result"]["updated_count"] == 1
+
+
+def test_post_runs_inline_by_default_on_serverless(api, monkeypatch):
+    module, url = api
+    body = {"year_month": TARGET, "user_id": USER}
+
+    monkeypatch.setattr(module, "ASYNC_DEFAULT", False)
+    status, result = call(url, body)
+    assert status == 200
+    assert result["updated_count"] == 1
+
+    monkeypatch.setattr(module, "ASYNC_DEFAULT", True)
+    status, job = call(url, body)
+    assert status == 202
+    assert job["status_url"] == f"/api/recommend-fixed-costs?job_id={job['job_id']}"
+    assert wait_for(module.recommendation_jobs, job["job_id"])["cached"] is True
@@ -0,0 +1,147 @@
+from datetime import date
+
+from agents.recurring_expenses import (
+    PROPOSE_CONFIDENCE,
+    detect_recurring_expenses,
+    recommend_fixed_costs,
+)
+
+HOUSING, UTILITIES, FOOD, SUBSCRIPTIONS = "housing", "utilities", "food", "subscriptions"
+MONTHS = [(2024, month) for month in range(1, 7)]
+TARGET = "2024-07"
+
+
+def expense(category_id, year, month, day, amount, memo):
+    return {"category_id": category_id, "date": date(year, month, day), "amount": amount, "memo": memo}
+
+
+def rent():
+    return [expense(HOUSING, year, month, 25, 500000, f"월세 {month}월") for year, month in MONTHS]
+
+
+def electricity():
+    amounts = [42000, 55000, 48000, 61000, 52000, 58000]
+    return [
+        expense(UTILITIES, year, month, 10 + index % 2, amount, "전기요금")
+        for index, ((year, month), amount) in enumerate(zip(MONTHS, amounts))
+    ]
+
+
+def coffee():
+    return [
+        expense(FOOD, year, month, day, 4500, "카페")
+        for year, month in MONTHS
+        for day in (3, 9, 17, 24)
+    ]
+
+
+def by_category(patterns):
+    return {pattern.category_id: pattern for pattern in patterns}
+
+
+def test_detects_fixed_bill_and_names_it_without_the_month():
+    (pattern,) = detect_recurring_expenses(rent(), TARGET)
+
+    assert pattern.label == "월세"
+    assert pattern.memo_key == "월세"
+    assert pattern.payment_day == 25
+    assert pattern.is_fixed_amount is True
+    assert pattern.recommended_amount == 500000
+    assert pattern.months_observed == 6
+    assert pattern.last_month == "2024-06"
+    assert pattern.confidence >= PROPOSE_CONFIDENCE
+
+
+def test_detects_variable_utility_weighted_to_recent_months():
+    (pattern,) = detect_recurring_expenses(electricity(), TARGET)
+
+    assert pattern.is_fixed_amount is False
+    assert pattern.payment_day in (10, 11)
+    assert pattern.typical_amount == 53500
+    # Recent months weigh more than the plain mean of 52,667.
+    assert 53500 < pattern.recommended_amount < 58000
+
+
+def test_rejects_irregular_spending():
+    sporadic = [
+        expense(FOOD, 2024, 1, 5, 30000, "회식"),
+        expense(FOOD, 2024, 4, 20, 80000, "회식"),
+    ]
+    assert detect_recurring_expenses(coffee() + sporadic, TARGET) == []
+
+
+def test_ignores_the_target_month_and_later():
+    history = rent() + [expense(HOUSING, 2024, 7, 25, 700000, "월세 7월")]
+    (pattern,) = detect_recurring_expenses(history, TARGET)
+    assert pattern.recommended_amount == 500000
+
+
+def test_several_charges_in_one_month_count_as_one_month():
+    history = electricity() + [expense(UTILITIES, 2024, 3, 28, 5000, "전기요금")]
+    (pattern,) = detect_recurring_expenses(history, TARGET)
+
+    assert pattern.months_observed == 6
+    assert pattern.payment_day in (10, 11)
+    # March's charges are summed: 48,000 + 5,000.
+    assert pattern.typical_amount == 54000
+
+
+def test_expenses_without_memo_cluster_by_amount():
+    history = [
+        expense(SUBSCRIPTIONS, year, month, 3, 9900 if month % 2 else 10000, None)
+        for year, month in MONTHS
+    ]
+    history.append(expense(SUBSCRIPTIONS, 2024, 2, 14, 250000, None))
+
+    (pattern,) = detect_recurring_expenses(history, TARGET)
+    assert pattern.memo_key == ""
+    assert pattern.months_observed == 6
+    assert pattern.label.startswith("정기 지출 (")
+    assert pattern.payment_day == 3
+
+
+def test_recommends_update_for_matching_fixed_cost():
+    patterns = detect_recurring_expenses(electricity(), TARGET)
+    fixed_costs = [{
+        "id": "cost-1", "name": "전기요금", "category_id": UTILITIES,
+        "amount": 0, "payment_day": 10, "is_fixed_amount": False, "is_active": True,
+    }]
+
+    (recommendation,) = recommend_fixed_costs(patterns, fixed_costs)
+    assert recommendation["action"] == "update"
+    assert recommendation["fixed_cost_id"] == "cost-1"
+    assert recommendation["is_fixed_amount"] is False
+    assert recommendation["recommended_amount"] == patterns[0].recommended_amount
+
+
+def test_proposes_create_for_untracked_confident_pattern():
+    patterns = detect_recurring_expenses(rent(), TARGET)
+
+    (recommendation,) = recommend_fixed_costs(patterns, [])
+    assert recommendation["action"] == "create"
+    assert recommendation["name"] == "월세"
+    assert recommendation["category_id"] == HOUSING
+    assert recommendation["amount"] == 500000
+    assert recommendation["payment_day"] == 25
+
+
+def test_no_recommendation_without_a_match_or_enough_confidence():
+    patterns = detect_recurring_expenses(rent(), TARGET)
+    # Only two recent months: recurring, but not confident enough to propose.
+    short = detect_recurring_expenses(
+        [expense(HOUSING, 2024, month, 1, 30000, "주차비") for month in (2, 4, 6)], TARGET
+    )
+    assert short and short[0].confidence < PROPOSE_CONFIDENCE
+
+    fixed_costs = [
+        # Same category, already tracked: matched and consumed.
+        {"id": "rent", "name": "월세", "category_id": HOUSING, "amount": 500000,
+         "payment_day": 25, "is_fixed_amount": True, "is_active": True},
+        # Inactive costs are never matched.
+        {"id": "old", "name": "주차비", "category_id": HOUSING, "amount": 30000,
+         "payment_day": 1, "is_fixed_amount": True, "is_active": False},
+    ]
+    recommendations = recommend_fixed_costs(patterns + short, fixed_costs)
+    assert [(r["action"], r.get("fixed_cost_id")) for r in recommendations] == [("update", "rent")]
+
+    assert recommend_fixed_costs([], fixed_costs) == []
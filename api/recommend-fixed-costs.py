@@ -5,31 +5,56 @@ Vercel Serverless Function: Fixed Cost Recommendation API
 POST /api/recommend-fixed-costs
 Body: {
   "year_month": "2025-10",
-  "user_id": "uuid-here"
+  "user_id": "uuid-here",
+  "async": true            (optional, see below)
 }
 
-Response: {
+Response (202): {
   "success": true,
-  "updated_count": 5,
-  "details": [...],
-  "errors": []
+  "job_id": "...",
+  "status": "pending",
+  "status_url": "/api/recommend-fixed-costs?job_id=..."
 }
+
+GET /api/recommend-fixed-costs?job_id=...
+Response: {
+  "job_id": "...",
+  "status": "pending" | "running" | "completed" | "failed",
+  "cached": false,
+  "result": {"success": true, "updated_count": 5, "details": [...], "errors": []},
+  "error": null
+}
+
+With "async": false the POST runs the workflow inline and answers with the
+result itself, as before. Results are cached per (year_month, user_id,
+input fingerprint), so either mode returns at once when nothing changed.
+
+Jobs run on threads of the process that accepted the POST and are kept in
+its memory. On Vercel (VERCEL is set) the instance may be frozen as soon as
+the 202 is sent, stalling the job, and a poll may reach another instance
+that answers 404. There the POST therefore runs inline unless the client
+asks for "async": true and can fall back to an inline POST. Elsewhere, in
+a long-running process, "async" defaults to true.
 """
 
 import sys
 import os
 import json
 from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlparse
 
 # Add parent directory to path to import agents module
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 try:
-    from agents.fixed_cost_recommender import run_recommendation_workflow
+    from agents.recommendation_jobs import jobs as recommendation_jobs
 except ImportError:
     # If running in Vercel, the module might be in a different location
     # Try to import the core functions directly
-    run_recommendation_workflow = None
+    recommendation_jobs = None
+
+# Serverless instances give no worker that outlives the response.
+ASYNC_DEFAULT = not os.environ.get("VERCEL")
 
 
 class handler(BaseHTTPRequestHandler):
@@ -40,7 +65,7 @@ class handler(BaseHTTPRequestHandler):
         self.send_response(status_code)
         self.send_header("Content-Type", content_type)
         self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "POST, OPTIONS")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
         self.end_headers()
 
@@ -67,7 +92,7 @@ class handler(BaseHTTPRequestHandler):
         """Handle POST request"""
         try:
             # Check if workflow function is available
-            if run_recommendation_workflow is None:
+            if recommendation_jobs is None:
                 self._send_error("Recommendation workflow not available", 500)
                 return
 
@@ -97,9 +122,20 @@ class handler(BaseHTTPRequestHandler):
                 self._send_error("Invalid year_month format. Expected YYYY-MM")
                 return
 
-            # Run the workflow
+            if data.get("async", ASYNC_DEFAULT):
+                # Queue the run and let the client poll for it
+                job = recommendation_jobs.submit(year_month, user_id)
+                self._send_json({
+                    "success": True,
+                    "job_id": job["job_id"],
+                    "status": job["status"],
+                    "status_url": f"/api/recommend-fixed-costs?job_id={job['job_id']}",
+                }, 202)
+                return
+
+            # Run the workflow inline
             print(f"Running recommendation workflow for {year_month}, user: {user_id}")
-            result = run_recommendation_workflow(year_month, user_id)
+            result, _ = recommendation_jobs.run(year_month, user_id)
 
             # Send response
             self._send_json(result, 200 if result["success"] else 500)
@@ -113,5 +149,19 @@ class handler(BaseHTTPRequestHandler):
             self._send_error(f"Internal server error: {str(e)}", 500)
 
     def do_GET(self):
-        """Handle GET request (not allowed)"""
-        self._send_error("Method not allowed. Use POST.", 405)
+        """Handle GET request (poll a recommendation job)"""
+        if recommendation_jobs is None:
+            self._send_error("Recommendation workflow not available", 500)
+            return
+
+        job_id = parse_qs(urlparse(self.path).query).get("job_id", [None])[0]
+        if not job_id:
+            self._send_error("Missing required query parameter: job_id")
+            return
+
+        job = recommendation_jobs.get(job_id)
+        if job is None:
+            self._send_error("Job not found", 404)
+            return
+
+        self._send_json(job)
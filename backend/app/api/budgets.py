@@ -1,31 +1,64 @@
+from datetime import date
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import TypeAdapter
+from sqlalchemy import Numeric, cast, func, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_db
+from app.core.etag import conditional_json_response
+from app.core.periods import MONTH_PATTERN, month_start
 from app.models.budget import Budget as BudgetModel
-from app.schemas.budget import Budget, BudgetCreate, BudgetUpdate
+from app.models.types import sql_uuid4
+from app.schemas.budget import Budget, BudgetCopyResult, BudgetCreate, BudgetForecast, BudgetUpdate
+from app.services.forecast import get_budget_forecast
 
 router = APIRouter()
 
+_budget_list = TypeAdapter(List[Budget])
+
 
 @router.get("", response_model=List[Budget])
 def get_budgets(
-    month: Optional[str] = None,
+    request: Request,
+    month: Optional[str] = Query(None, pattern=MONTH_PATTERN),
+    from_month: Optional[str] = Query(None, alias="from", pattern=MONTH_PATTERN, description="First month (YYYY-MM), inclusive"),
+    to_month: Optional[str] = Query(None, alias="to", pattern=MONTH_PATTERN, description="Last month (YYYY-MM), inclusive"),
     category_id: Optional[UUID] = None,
     db: Session = Depends(get_db)
 ):
-    """Get all budgets with optional filters"""
+    """Get all budgets with optional filters (supports If-None-Match)"""
     query = db.query(BudgetModel)
 
     if month:
-        query = query.filter(BudgetModel.month == month)
+        query = query.filter(BudgetModel.period == month_start(month))
+    if from_month:
+        query = query.filter(BudgetModel.period >= month_start(from_month))
+    if to_month:
+        query = query.filter(BudgetModel.period <= month_start(to_month))
     if category_id:
         query = query.filter(BudgetModel.category_id == category_id)
 
-    return query.all()
+    return conditional_json_response(
+        request,
+        ("budgets",),
+        ("budgets", month, from_month, to_month, category_id),
+        lambda: query.order_by(BudgetModel.period, BudgetModel.category_id).all(),
+        _budget_list,
+    )
+
+
+@router.get("/forecast", response_model=List[BudgetForecast])
+def get_forecast(
+    month: str = Query(..., pattern=MONTH_PATTERN),
+    as_of: Optional[date] = Query(None, description="Project from this date (defaults to today)"),
+    db: Session = Depends(get_db)
+):
+    """Project month-end spend with a 90% band for every budget in a month"""
+    return get_budget_forecast(db, month, as_of)
 
 
 @router.get("/{budget_id}", response_model=Budget)
@@ -43,7 +76,7 @@ def create_budget(budget: BudgetCreate, db: Session = Depends(get_db)):
     # Check if budget already exists for this category and month
     existing = db.query(BudgetModel).filter(
         BudgetModel.category_id == budget.category_id,
-        BudgetModel.month == budget.month
+        BudgetModel.period == month_start(budget.month)
     ).first()
 
     if existing:
@@ -59,6 +92,49 @@ def create_budget(budget: BudgetCreate, db: Session = Depends(get_db)):
     return db_budget
 
 
+def _copy_statement(dialect: str, from_month: str, to_month: str, percent: float):
+    """INSERT ... SELECT copying ``from_month``'s budgets into ``to_month``."""
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    limit_amount = BudgetModel.limit_amount
+    if percent:
+        # PostgreSQL only rounds numeric to a scale, not double precision.
+        limit_amount = func.round(cast(limit_amount * (1 + percent / 100), Numeric), 2)
+
+    source = select(
+        sql_uuid4(dialect),
+        BudgetModel.category_id,
+        literal(month_start(to_month)),
+        limit_amount,
+    ).where(BudgetModel.period == month_start(from_month))
+
+    return (
+        insert(BudgetModel)
+        .from_select(["id", "category_id", "period", "limit_amount"], source)
+        .on_conflict_do_nothing(index_elements=["category_id", "period"])
+    )
+
+
+@router.post("/copy", response_model=BudgetCopyResult)
+def copy_budgets(
+    from_month: str = Query(..., alias="from", pattern=MONTH_PATTERN),
+    to_month: str = Query(..., alias="to", pattern=MONTH_PATTERN),
+    percent: float = Query(0, gt=-100, description="Adjust copied limits by this percentage"),
+    db: Session = Depends(get_db)
+):
+    """Copy every budget of one month into another with a single INSERT ... SELECT.
+
+    Categories that already have a budget in the target month are left as
+    they are.
+    """
+    if from_month == to_month:
+        raise HTTPException(status_code=400, detail="Source and target month must differ")
+
+    statement = _copy_statement(db.get_bind().dialect.name, from_month, to_month, percent)
+    copied = db.execute(statement).rowcount
+    db.commit()
+    return {"from_month": from_month, "to_month": to_month, "copied": copied}
+
+
 @router.put("/{budget_id}", response_model=Budget)
 def update_budget(budget_id: UUID, budget: BudgetUpdate, db: Session = Depends(get_db)):
     """Update an existing budget"""
@@ -75,7 +151,7 @@ def update_budget(budget_id: UUID, budget: BudgetUpdate, db: Session = Depends(g
 
         existing = db.query(BudgetModel).filter(
             BudgetModel.category_id == new_category_id,
-            BudgetModel.month == new_month,
+            BudgetModel.period == month_start(new_month),
             BudgetModel.id != budget_id
         ).first()
 
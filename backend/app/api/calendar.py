@@ -0,0 +1,245 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_db
+from app.models.calendar import (
+    DEFAULT_REMINDERS,
+    DEFAULT_TIMEZONE,
+    CalendarEvent as CalendarEventModel,
+    UserCalendarPreference as UserCalendarPreferenceModel,
+)
+from app.schemas.calendar import (
+    CalendarEvent,
+    CalendarEventCreate,
+    CalendarEventUpdate,
+    CalendarOccurrence,
+    CalendarReminderDue,
+    UserCalendarPreference,
+    UserCalendarPreferenceUpdate,
+)
+from app.services import reference_data
+from app.services.calendar_occurrences import (
+    SCHEDULE_FIELDS,
+    as_utc,
+    clear_event,
+    get_zone,
+    list_occurrences,
+    materialize_event,
+    materialize_user_events,
+    user_zones,
+)
+from app.services.recurrence import InvalidRecurrenceRule, parse_rrule
+from app.services.reminders import scheduler
+
+router = APIRouter()
+
+# Longest window the occurrences endpoint expands in one call.
+MAX_WINDOW_DAYS = 400
+
+
+def _get_event_or_404(db: Session, event_id: UUID) -> CalendarEventModel:
+    event = db.get(CalendarEventModel, event_id)
+    if event is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+    return event
+
+
+def _to_utc(value: datetime, zone) -> datetime:
+    """Stored timestamps are UTC; naive input is wall-clock time in ``zone``."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=zone)
+    return value.astimezone(timezone.utc)
+
+
+def _validate_event(event: CalendarEventModel) -> None:
+    if as_utc(event.end_at) < as_utc(event.start_at):
+        raise HTTPException(status_code=400, detail="end_at must not be before start_at")
+    if event.recurrence_rule:
+        try:
+            parse_rrule(event.recurrence_rule)
+        except InvalidRecurrenceRule as exc:
+            raise HTTPException(status_code=400, detail=f"Invalid recurrence_rule: {exc}") from exc
+
+
+@router.get("/occurrences", response_model=List[CalendarOccurrence])
+def get_occurrences(
+    from_at: datetime = Query(..., alias="from", description="Window start, inclusive"),
+    to_at: datetime = Query(..., alias="to", description="Window end, exclusive"),
+    user_id: Optional[UUID] = Query(None, description="Viewer: own and shared events, in their time zone"),
+    db: Session = Depends(get_db),
+):
+    """Occurrences overlapping the window, recurring events expanded in their owner's time zone"""
+    zone = user_zones(db, [user_id])[user_id] if user_id else get_zone(DEFAULT_TIMEZONE)
+    window_start, window_end = _to_utc(from_at, zone), _to_utc(to_at, zone)
+    if window_end <= window_start:
+        raise HTTPException(status_code=400, detail="'to' must be after 'from'")
+    if window_end - window_start > timedelta(days=MAX_WINDOW_DAYS):
+        raise HTTPException(status_code=400, detail=f"Window must not exceed {MAX_WINDOW_DAYS} days")
+
+    occurrences = list_occurrences(db, window_start, window_end, user_id=user_id)
+    owner_zones = {} if user_id else user_zones(db, {o.event.created_by for o in occurrences})
+    results = []
+    for occurrence in occurrences:
+        event = occurrence.event
+        local = zone if user_id else owner_zones[event.created_by]
+        results.append({
+            "event_id": event.id,
+            "title": event.title,
+            "location": event.location,
+            "start_at": occurrence.start_at.astimezone(local),
+            "end_at": occurrence.end_at.astimezone(local),
+            "is_all_day": event.is_all_day,
+            "is_recurring": bool(event.recurrence_rule),
+            "is_shared": event.is_shared,
+            "color_override": event.color_override,
+            "created_by": event.created_by,
+        })
+    return results
+
+
+@router.get("/reminders/due", response_model=List[CalendarReminderDue])
+def get_due_reminders(
+    since: datetime = Query(..., description="Reminders that fired after this time"),
+    until: Optional[datetime] = Query(None, description="Defaults to now; later times are capped to now"),
+    user_id: Optional[UUID] = Query(None, description="Only reminders of this user's events"),
+    db: Session = Depends(get_db),
+):
+    """Reminders that fired in (since, until], served from the in-memory scheduler"""
+    since = _to_utc(since, timezone.utc)
+    until = _to_utc(until, timezone.utc) if until else None
+    if until and until < since:
+        raise HTTPException(status_code=400, detail="'until' must not be before 'since'")
+    return [
+        {
+            "event_id": reminder.event_id,
+            "title": reminder.title,
+            "occurrence_start": reminder.occurrence_start,
+            "fire_at": reminder.fire_at,
+            "minutes_before": reminder.minutes_before,
+            "method": reminder.method,
+        }
+        for reminder in scheduler.due(db, since, until=until, user_id=user_id)
+    ]
+
+
+@router.get("/events", response_model=List[CalendarEvent])
+def get_events(
+    user_id: Optional[UUID] = Query(None, description="Only this user's own and shared events"),
+    db: Session = Depends(get_db),
+):
+    """Get calendar events ordered by start"""
+    query = db.query(CalendarEventModel)
+    if user_id:
+        query = query.filter(or_(CalendarEventModel.created_by == user_id, CalendarEventModel.is_shared))
+    return query.order_by(CalendarEventModel.start_at, CalendarEventModel.id).all()
+
+
+@router.get("/events/{event_id}", response_model=CalendarEvent)
+def get_event(event_id: UUID, db: Session = Depends(get_db)):
+    """Get a specific calendar event by ID"""
+    return _get_event_or_404(db, event_id)
+
+
+@router.post("/events", response_model=CalendarEvent, status_code=status.HTTP_201_CREATED)
+def create_event(event: CalendarEventCreate, db: Session = Depends(get_db)):
+    """Create a new calendar event; naive times are in the owner's time zone"""
+    if reference_data.users.get(db, event.created_by) is None:
+        raise HTTPException(status_code=400, detail="Invalid created_by user id")
+
+    zone = user_zones(db, [event.created_by])[event.created_by]
+    data = event.model_dump()
+    data["start_at"] = _to_utc(event.start_at, zone)
+    data["end_at"] = _to_utc(event.end_at, zone)
+    db_event = CalendarEventModel(**data)
+    _validate_event(db_event)
+    db.add(db_event)
+    materialize_event(db, db_event)
+    db.commit()
+    db.refresh(db_event)
+    scheduler.refresh_event(db, db_event.id)
+    return db_event
+
+
+@router.put("/events/{event_id}", response_model=CalendarEvent)
+def update_event(event_id: UUID, event: CalendarEventUpdate, db: Session = Depends(get_db)):
+    """Update a calendar event"""
+    db_event = _get_event_or_404(db, event_id)
+    zone = user_zones(db, [db_event.created_by])[db_event.created_by]
+
+    update_data = event.model_dump(exclude_unset=True)
+    for field in ("start_at", "end_at"):
+        if update_data.get(field) is not None:
+            update_data[field] = _to_utc(update_data[field], zone)
+    for field, value in update_data.items():
+        setattr(db_event, field, value)
+    _validate_event(db_event)
+    if set(SCHEDULE_FIELDS) & update_data.keys():
+        materialize_event(db, db_event)
+
+    db.commit()
+    db.refresh(db_event)
+    scheduler.refresh_event(db, db_event.id)
+    return db_event
+
+
+@router.delete("/events/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_event(event_id: UUID, db: Session = Depends(get_db)):
+    """Delete a calendar event"""
+    db_event = _get_event_or_404(db, event_id)
+    clear_event(db, db_event.id)
+    db.delete(db_event)
+    db.commit()
+    scheduler.forget_event(event_id)
+
+
+@router.get("/preferences/{user_id}", response_model=UserCalendarPreference)
+def get_preferences(user_id: UUID, db: Session = Depends(get_db)):
+    """Get a user's calendar preferences, or the defaults when none are saved"""
+    if reference_data.users.get(db, user_id) is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    preference = db.query(UserCalendarPreferenceModel).filter_by(user_id=user_id).first()
+    if preference is None:
+        return UserCalendarPreference(
+            user_id=user_id,
+            color_hex="#0ea5e9",
+            palette_key="sky",
+            reminders_default=DEFAULT_REMINDERS,
+            timezone=DEFAULT_TIMEZONE,
+            week_starts_on=1,
+        )
+    return preference
+
+
+@router.put("/preferences/{user_id}", response_model=UserCalendarPreference)
+def update_preferences(user_id: UUID, preference: UserCalendarPreferenceUpdate, db: Session = Depends(get_db)):
+    """Create or update a user's calendar preferences"""
+    if reference_data.users.get(db, user_id) is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    if preference.timezone is not None:
+        try:
+            ZoneInfo(preference.timezone)
+        except (ZoneInfoNotFoundError, ValueError) as exc:
+            raise HTTPException(status_code=400, detail="Unknown timezone") from exc
+
+    db_preference = db.query(UserCalendarPreferenceModel).filter_by(user_id=user_id).first()
+    if db_preference is None:
+        db_preference = UserCalendarPreferenceModel(user_id=user_id)
+        db.add(db_preference)
+    update_data = preference.model_dump(exclude_unset=True)
+    zone_changed = "timezone" in update_data and update_data["timezone"] != db_preference.timezone
+    for field, value in update_data.items():
+        setattr(db_preference, field, value)
+    if zone_changed:
+        # Recurring events repeat on the owner's wall clock.
+        materialize_user_events(db, user_id)
+    db.commit()
+    db.refresh(db_preference)
+    if zone_changed:
+        scheduler.reset()
+    return db_preference
@@ -1,25 +1,40 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import TypeAdapter
+from sqlalchemy import delete, exists, select, update
+from sqlalchemy.orm import Session, aliased
 
 from app.core.deps import get_db
+from app.core.etag import conditional_json_response
 from app.models.category import Category as CategoryModel, CategoryType
 from app.models.budget import Budget as BudgetModel
-from app.models.expense import Expense as ExpenseModel
-from app.schemas.category import Category, CategoryCreate, CategoryUpdate
+from app.models.expense import Expense as ExpenseModel, rebuild_daily_totals
+from app.models.fixed_cost import FixedCost as FixedCostModel
+from app.schemas.category import Category, CategoryCreate, CategoryMergeResult, CategoryUpdate
+from app.services import reference_data
 
 router = APIRouter()
 
+_category_list = TypeAdapter(List[Category])
+
 
 @router.get("", response_model=List[Category], summary="List all categories")
-def list_categories(db: Session = Depends(get_db)):
+def list_categories(request: Request, db: Session = Depends(get_db)):
     """
     Get a list of all income and expense categories.
+
+    Supports conditional requests: send the returned ETag as If-None-Match
+    to get 304 Not Modified while categories are unchanged.
     """
-    return db.query(CategoryModel).order_by(CategoryModel.id).all()
+    return conditional_json_response(
+        request,
+        ("categories",),
+        "categories",
+        lambda: reference_data.categories.all(db),
+        _category_list,
+    )
 
 
 @router.get("/{category_id}", response_model=Category, summary="Get category by ID")
@@ -29,11 +44,7 @@ def get_category(category_id: UUID, db: Session = Depends(get_db)):
 
     - **category_id**: The ID of the category to retrieve
     """
-    category = (
-        db.query(CategoryModel)
-        .filter(CategoryModel.id == category_id)
-        .first()
-    )
+    category = reference_data.categories.get(db, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     return category
@@ -135,28 +146,132 @@ def delete_category(category_id: UUID, db: Session = Depends(get_db)):
     if not db_category:
         raise HTTPException(status_code=404, detail="Category not found")
 
-    linked_budget_count = (
-        db.query(func.count(BudgetModel.id))
-        .filter(BudgetModel.category_id == category_id)
-        .scalar()
-    )
-    if linked_budget_count:
+    has_budgets = db.query(
+        exists().where(BudgetModel.category_id == category_id)
+    ).scalar()
+    if has_budgets:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete category because budgets depend on it",
         )
 
-    linked_expense_count = (
-        db.query(func.count(ExpenseModel.id))
-        .filter(ExpenseModel.category_id == category_id)
-        .scalar()
-    )
-    if linked_expense_count:
+    has_expenses = db.query(
+        exists().where(ExpenseModel.category_id == category_id)
+    ).scalar()
+    if has_expenses:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete category because expenses depend on it",
         )
 
+    has_fixed_costs = db.query(
+        exists().where(FixedCostModel.category_id == category_id)
+    ).scalar()
+    if has_fixed_costs:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot delete category because fixed costs depend on it",
+        )
+
     db.delete(db_category)
     db.commit()
     return {"message": "Category deleted successfully"}
+
+
+@router.post(
+    "/{category_id}/merge-into/{target_id}",
+    response_model=CategoryMergeResult,
+    summary="Merge a category into another",
+)
+def merge_category(category_id: UUID, target_id: UUID, db: Session = Depends(get_db)):
+    """
+    Move every expense, fixed cost and budget of a category to another
+    category and delete the source, in one transaction.
+
+    Where both categories have a budget for the same month, the limits are
+    added together on the target's budget.
+
+    - **category_id**: The category to merge away
+    - **target_id**: The category that receives its expenses, fixed costs and budgets
+    """
+    if category_id == target_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot merge a category into itself",
+        )
+
+    categories = {
+        category.id: category
+        for category in db.query(CategoryModel).filter(CategoryModel.id.in_([category_id, target_id]))
+    }
+    if category_id not in categories or target_id not in categories:
+        raise HTTPException(status_code=404, detail="Category not found")
+    if categories[category_id].type != categories[target_id].type:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot merge categories of different types",
+        )
+
+    source_budget = aliased(BudgetModel)
+    source_periods = select(source_budget.period).where(source_budget.category_id == category_id)
+    target_periods = select(BudgetModel.period).where(BudgetModel.category_id == target_id)
+
+    # Every statement below is set-based, so the cost is one round trip each
+    # regardless of how many rows move.
+    combined = db.execute(
+        update(BudgetModel)
+        .where(BudgetModel.category_id == target_id, BudgetModel.period.in_(source_periods))
+        .values(
+            limit_amount=BudgetModel.limit_amount
+            + select(source_budget.limit_amount)
+            .where(
+                source_budget.category_id == category_id,
+                source_budget.period == BudgetModel.period,
+            )
+            .scalar_subquery()
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.execute(
+        delete(BudgetModel)
+        .where(BudgetModel.category_id == category_id, BudgetModel.period.in_(target_periods))
+        .execution_options(synchronize_session=False)
+    )
+    budgets_moved = db.execute(
+        update(BudgetModel)
+        .where(BudgetModel.category_id == category_id)
+        .values(category_id=target_id)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    expenses_moved = db.execute(
+        update(ExpenseModel)
+        .where(ExpenseModel.category_id == category_id)
+        .values(category_id=target_id)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    # The bulk update bypasses the flush that keeps daily totals current.
+    rebuild_daily_totals(db, (category_id, target_id))
+    # Fixed costs cascade with their category, payments included; they
+    # must move before the source is deleted.
+    fixed_costs_moved = db.execute(
+        update(FixedCostModel)
+        .where(FixedCostModel.category_id == category_id)
+        .values(category_id=target_id)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.execute(
+        delete(CategoryModel)
+        .where(CategoryModel.id == category_id)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    db.expire_all()
+
+    return {
+        "source_id": category_id,
+        "target_id": target_id,
+        "expenses_moved": expenses_moved,
+        "fixed_costs_moved": fixed_costs_moved,
+        "budgets_moved": budgets_moved,
+        "budgets_combined": combined,
+    }
@@ -6,10 +6,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_db
-from app.models.category import Category as CategoryModel
 from app.models.expense import Expense as ExpenseModel
 from app.models.user import User as UserModel
 from app.schemas.expense import Expense, ExpenseCreate, ExpenseUpdate
+from app.services import reference_data
 
 router = APIRouter()
 
@@ -26,22 +26,12 @@ def _get_expense_or_404(db: Session, expense_id: UUID) -> ExpenseModel:
 
 
 def _ensure_category_exists(db: Session, category_id: UUID) -> None:
-    exists = (
-        db.query(CategoryModel.id)
-        .filter(CategoryModel.id == category_id)
-        .first()
-    )
-    if not exists:
+    if reference_data.categories.get(db, category_id) is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
 
 
 def _ensure_user_exists(db: Session, user_id: UUID) -> None:
-    exists = (
-        db.query(UserModel.id)
-        .filter(UserModel.id == user_id)
-        .first()
-    )
-    if not exists:
+    if reference_data.users.get(db, user_id) is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid created_by user id")
 
 
@@ -0,0 +1,197 @@
+from datetime import date
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import case, delete, exists, func, literal, not_, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.cache import note_table_writes
+from app.core.deps import get_db
+from app.core.periods import MONTH_PATTERN, month_end, month_start
+from app.models.fixed_cost import (
+    FixedCost as FixedCostModel,
+    FixedCostPayment as FixedCostPaymentModel,
+    FixedCostPaymentStatus,
+)
+from app.models.types import sql_uuid4
+from app.schemas.fixed_cost import (
+    FixedCost,
+    FixedCostCreate,
+    FixedCostDeleteResult,
+    FixedCostGenerateResult,
+    FixedCostMonthSummary,
+    FixedCostPayment,
+)
+from app.services import reference_data
+from app.services.fixed_cost_summary import get_fixed_cost_summary
+
+router = APIRouter()
+
+# Longest range the summary endpoint answers in one call.
+MAX_SUMMARY_MONTHS = 120
+
+
+def _active_in_month(month: str):
+    """Active fixed costs whose start/end dates overlap ``month``.
+
+    The bare is_active test matches the predicate of the partial indexes.
+    """
+    return (
+        FixedCostModel.is_active,
+        FixedCostModel.start_date <= month_end(month),
+        or_(FixedCostModel.end_date.is_(None), FixedCostModel.end_date >= month_start(month)),
+    )
+
+
+@router.get("", response_model=List[FixedCost])
+def get_fixed_costs(
+    month: Optional[str] = Query(None, pattern=MONTH_PATTERN, description="Only costs active in this month (YYYY-MM)"),
+    created_by: Optional[UUID] = Query(None, description="Only costs of this user"),
+    include_inactive: bool = Query(False, description="Include soft-deleted costs"),
+    db: Session = Depends(get_db),
+):
+    """Get fixed costs ordered by payment day; soft-deleted ones are hidden by default"""
+    query = db.query(FixedCostModel)
+    if month:
+        query = query.filter(*_active_in_month(month))
+    elif not include_inactive:
+        query = query.filter(FixedCostModel.is_active)
+    if created_by:
+        query = query.filter(FixedCostModel.created_by == created_by)
+    return query.order_by(FixedCostModel.payment_day, FixedCostModel.id).all()
+
+
+@router.post("", response_model=FixedCost, status_code=status.HTTP_201_CREATED)
+def create_fixed_cost(fixed_cost: FixedCostCreate, db: Session = Depends(get_db)):
+    """Create a new fixed cost"""
+    if fixed_cost.end_date and fixed_cost.end_date < fixed_cost.start_date:
+        raise HTTPException(status_code=400, detail="end_date must not be before start_date")
+    if reference_data.categories.get(db, fixed_cost.category_id) is None:
+        raise HTTPException(status_code=404, detail="Category not found")
+    if reference_data.users.get(db, fixed_cost.created_by) is None:
+        raise HTTPException(status_code=400, detail="Invalid created_by user id")
+
+    db_fixed_cost = FixedCostModel(**fixed_cost.model_dump())
+    db.add(db_fixed_cost)
+    db.commit()
+    db.refresh(db_fixed_cost)
+    return db_fixed_cost
+
+
+@router.get("/payments", response_model=List[FixedCostPayment])
+def get_fixed_cost_payments(
+    month: str = Query(..., pattern=MONTH_PATTERN, description="Month (YYYY-MM)"),
+    db: Session = Depends(get_db),
+):
+    """Get the payment rows of one month"""
+    return (
+        db.query(FixedCostPaymentModel)
+        .filter(FixedCostPaymentModel.year_month == month)
+        .order_by(FixedCostPaymentModel.fixed_cost_id)
+        .all()
+    )
+
+
+@router.get("/summary", response_model=List[FixedCostMonthSummary])
+def get_payment_summary(
+    from_month: str = Query(..., alias="from", pattern=MONTH_PATTERN, description="First month (YYYY-MM), inclusive"),
+    to_month: str = Query(..., alias="to", pattern=MONTH_PATTERN, description="Last month (YYYY-MM), inclusive"),
+    created_by: Optional[UUID] = Query(None, description="Only payments of this user"),
+    db: Session = Depends(get_db),
+):
+    """Scheduled, paid and remaining totals for every month in the range.
+
+    Months without payments are included with zero totals.
+    """
+    if from_month > to_month:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    start, end = month_start(from_month), month_start(to_month)
+    if (end.year - start.year) * 12 + end.month - start.month >= MAX_SUMMARY_MONTHS:
+        raise HTTPException(status_code=400, detail=f"Range is limited to {MAX_SUMMARY_MONTHS} months")
+    return get_fixed_cost_summary(db, from_month, to_month, created_by)
+
+
+@router.post("/generate", response_model=FixedCostGenerateResult)
+def generate_payments(
+    month: str = Query(..., pattern=MONTH_PATTERN, description="Month (YYYY-MM)"),
+    db: Session = Depends(get_db),
+):
+    """Create the month's scheduled payments with a single INSERT ... SELECT.
+
+    Every active fixed cost whose start/end dates overlap the month gets one
+    payment; variable-amount costs get no scheduled amount. Costs that
+    already have a payment for the month are skipped, so calling this again
+    is a no-op.
+    """
+    dialect = db.get_bind().dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+    source = select(
+        sql_uuid4(dialect),
+        FixedCostModel.id,
+        literal(month),
+        case((FixedCostModel.is_fixed_amount, FixedCostModel.amount), else_=None),
+        literal(FixedCostPaymentStatus.SCHEDULED, FixedCostPaymentModel.status.type),
+        FixedCostModel.created_by,
+    ).where(
+        *_active_in_month(month),
+    )
+
+    statement = (
+        insert(FixedCostPaymentModel)
+        .from_select(
+            ["id", "fixed_cost_id", "year_month", "scheduled_amount", "status", "created_by"],
+            source,
+        )
+        .on_conflict_do_nothing(index_elements=["fixed_cost_id", "year_month"])
+    )
+    generated = db.execute(statement).rowcount
+    db.commit()
+    return {"month": month, "generated": generated}
+
+
+@router.delete("/{fixed_cost_id}", response_model=FixedCostDeleteResult)
+def delete_fixed_cost(fixed_cost_id: UUID, db: Session = Depends(get_db)):
+    """Delete a fixed cost, keeping it as inactive history if it has payments.
+
+    A cost with payments is soft-deleted (deactivated and ended today);
+    one without is removed. The payment check and the write happen in the
+    same statement, so a payment generated concurrently cannot be orphaned.
+    """
+    has_payments = exists().where(FixedCostPaymentModel.fixed_cost_id == FixedCostModel.id)
+    target = FixedCostModel.id == fixed_cost_id
+    soft_delete = (
+        update(FixedCostModel)
+        .where(target, FixedCostModel.is_active, has_payments)
+        .values(is_active=False, end_date=date.today())
+    )
+    hard_delete = delete(FixedCostModel).where(target, not_(has_payments))
+
+    if db.get_bind().dialect.name == "postgresql":
+        soft = soft_delete.returning(FixedCostModel.id).cte("soft")
+        hard = hard_delete.returning(FixedCostModel.id).cte("hard")
+        soft_count, hard_count = db.execute(select(
+            select(func.count()).select_from(soft).scalar_subquery(),
+            select(func.count()).select_from(hard).scalar_subquery(),
+        )).one()
+        note_table_writes(db, FixedCostModel.__tablename__)
+    else:
+        # No data-modifying CTEs here: run both guarded statements; at most
+        # one of them matches the row.
+        soft_count = db.execute(soft_delete.execution_options(synchronize_session=False)).rowcount
+        hard_count = db.execute(hard_delete.execution_options(synchronize_session=False)).rowcount
+
+    if not soft_count and not hard_count:
+        already_inactive = db.query(
+            exists().where(target, not_(FixedCostModel.is_active))
+        ).scalar()
+        db.rollback()
+        if already_inactive:
+            return {"id": fixed_cost_id, "mode": "soft"}
+        raise HTTPException(status_code=404, detail="Fixed cost not found")
+
+    db.commit()
+    db.expire_all()
+    return {"id": fixed_cost_id, "mode": "soft" if soft_count else "hard"}
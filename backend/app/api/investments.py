@@ -1,18 +1,27 @@
+import codecs
 from datetime import date
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_db
 from app.models.investment import (
+    DEFAULT_CURRENCY,
+    CorporateAction,
+    FxRate,
     Holding,
     InvestmentAccount,
     InvestmentTransaction,
     TransactionType,
 )
 from app.schemas.investment import (
+    CorporateAction as CorporateActionSchema,
+    CorporateActionCreate,
+    FxRate as FxRateSchema,
+    FxRateCreate,
+    FxRateIngestResult,
     Holding as HoldingSchema,
     HoldingCreate,
     HoldingUpdate,
@@ -22,7 +31,20 @@ from app.schemas.investment import (
     InvestmentTransaction as InvestmentTransactionSchema,
     InvestmentTransactionCreate,
     InvestmentTransactionUpdate,
+    InvestmentReturns,
+    PortfolioValuation,
+    Position,
+    TransactionImportResult,
 )
+from app.services.fx import FxRateMissing, ingest_rates
+from app.services.positions import get_positions
+from app.services.returns import get_returns
+from app.services.transaction_import import (
+    ImportFormatError,
+    get_mapping,
+    import_transactions,
+)
+from app.services.valuation import get_valuation
 
 router = APIRouter()
 
@@ -86,6 +108,53 @@ def delete_holding(holding_id: UUID, db: Session = Depends(get_db)):
     return {"message": "Holding deleted successfully"}
 
 
+# ========== Valuation Endpoints ==========
+
+def _valuation_or_400(db: Session, account_id: Optional[UUID], currency: str, as_of: Optional[date]):
+    try:
+        return get_valuation(db, account_id, currency=currency.upper(), as_of=as_of)
+    except FxRateMissing as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.get("/valuation", response_model=PortfolioValuation)
+def get_portfolio_valuation(
+    currency: str = Query(DEFAULT_CURRENCY, min_length=3, max_length=3, description="Reporting currency"),
+    as_of: Optional[date] = Query(None, description="FX rate date (defaults to the latest rate)"),
+    db: Session = Depends(get_db),
+):
+    """Get market value, cost basis, gain and allocation by symbol across all accounts"""
+    return _valuation_or_400(db, None, currency, as_of)
+
+
+@router.get("/returns", response_model=InvestmentReturns)
+def get_investment_returns(
+    as_of: Optional[date] = Query(None, description="Valuation date (defaults to today)"),
+    account_id: Optional[UUID] = None,
+    currency: str = Query(DEFAULT_CURRENCY, min_length=3, max_length=3, description="Reporting currency"),
+    db: Session = Depends(get_db),
+):
+    """Get money-weighted (XIRR) and time-weighted returns per account and symbol"""
+    try:
+        return get_returns(db, as_of=as_of, account_id=account_id, currency=currency.upper())
+    except FxRateMissing as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.get("/positions", response_model=List[Position])
+def get_investment_positions(
+    as_of: Optional[date] = None,
+    account_id: Optional[UUID] = None,
+    currency: str = Query(DEFAULT_CURRENCY, min_length=3, max_length=3, description="Reporting currency"),
+    db: Session = Depends(get_db),
+):
+    """Get split-adjusted positions and P&L derived from transactions"""
+    try:
+        return get_positions(db, as_of=as_of, account_id=account_id, currency=currency.upper())
+    except FxRateMissing as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
 # ========== Investment Accounts Endpoints ==========
 
 @router.get("/accounts", response_model=List[InvestmentAccountSchema])
@@ -103,6 +172,20 @@ def get_account(account_id: UUID, db: Session = Depends(get_db)):
     return account
 
 
+@router.get("/accounts/{account_id}/valuation", response_model=PortfolioValuation)
+def get_account_valuation(
+    account_id: UUID,
+    currency: str = Query(DEFAULT_CURRENCY, min_length=3, max_length=3, description="Reporting currency"),
+    as_of: Optional[date] = Query(None, description="FX rate date (defaults to the latest rate)"),
+    db: Session = Depends(get_db),
+):
+    """Get market value, cost basis, gain and allocation by symbol for an account"""
+    valuation = _valuation_or_400(db, account_id, currency, as_of)
+    if valuation is None:
+        raise HTTPException(status_code=404, detail="Investment account not found")
+    return valuation
+
+
 @router.post("/accounts", response_model=InvestmentAccountSchema)
 def create_account(account: InvestmentAccountCreate, db: Session = Depends(get_db)):
     """Create a new investment account"""
@@ -206,6 +289,31 @@ def create_transaction(payload: InvestmentTransactionCreate, db: Session = Depen
     return transaction
 
 
+@router.post("/transactions/import", response_model=TransactionImportResult)
+def import_transactions_csv(
+    account_id: UUID,
+    file: UploadFile = File(...),
+    mapping: str = Query("default", description="Column mapping of the broker export"),
+    dry_run: bool = Query(False, description="Report inserts and duplicates without saving"),
+    db: Session = Depends(get_db),
+):
+    """Import investment transactions from a broker CSV export"""
+    account = db.query(InvestmentAccount.id).filter(InvestmentAccount.id == account_id).first()
+    if not account:
+        raise HTTPException(status_code=404, detail="Investment account not found")
+
+    try:
+        column_mapping = get_mapping(mapping)
+        # Decoded line by line; TextIOWrapper rejects SpooledTemporaryFile
+        # before Python 3.11.
+        lines = codecs.iterdecode(file.file, column_mapping.encoding)
+        return import_transactions(db, account_id, lines, column_mapping, dry_run=dry_run)
+    except ImportFormatError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except UnicodeDecodeError as exc:
+        raise HTTPException(status_code=400, detail="File is not valid text in the expected encoding") from exc
+
+
 @router.put("/transactions/{transaction_id}", response_model=InvestmentTransactionSchema)
 def update_transaction(
     transaction_id: UUID,
@@ -250,3 +358,75 @@ def delete_transaction(transaction_id: UUID, db: Session = Depends(get_db)):
     db.delete(transaction)
     db.commit()
     return None
+
+
+# ========== Corporate Actions Endpoints ==========
+
+@router.get("/corporate-actions", response_model=List[CorporateActionSchema])
+def list_corporate_actions(symbol: Optional[str] = None, db: Session = Depends(get_db)):
+    """List corporate actions (splits, stock dividends)"""
+    query = db.query(CorporateAction)
+    if symbol:
+        query = query.filter(CorporateAction.symbol == symbol)
+    return query.order_by(CorporateAction.symbol, CorporateAction.ex_date).all()
+
+
+@router.post("/corporate-actions", response_model=CorporateActionSchema, status_code=201)
+def create_corporate_action(payload: CorporateActionCreate, db: Session = Depends(get_db)):
+    """Record a corporate action; past transactions are adjusted when read"""
+    existing = (
+        db.query(CorporateAction.id)
+        .filter(
+            CorporateAction.symbol == payload.symbol,
+            CorporateAction.ex_date == payload.ex_date,
+            CorporateAction.type == payload.type,
+        )
+        .first()
+    )
+    if existing:
+        raise HTTPException(status_code=400, detail="Corporate action already exists for this symbol and date")
+
+    action = CorporateAction(**payload.model_dump())
+    db.add(action)
+    db.commit()
+    db.refresh(action)
+    return action
+
+
+@router.delete("/corporate-actions/{action_id}", status_code=204)
+def delete_corporate_action(action_id: UUID, db: Session = Depends(get_db)):
+    """Delete a corporate action"""
+    action = db.query(CorporateAction).filter(CorporateAction.id == action_id).first()
+    if not action:
+        raise HTTPException(status_code=404, detail="Corporate action not found")
+
+    db.delete(action)
+    db.commit()
+    return None
+
+
+# ========== FX Rates Endpoints ==========
+
+@router.get("/fx-rates", response_model=List[FxRateSchema])
+def list_fx_rates(
+    pair: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: Session = Depends(get_db),
+):
+    """List FX rates with optional filters"""
+    query = db.query(FxRate)
+    if pair:
+        query = query.filter(FxRate.pair == pair.upper())
+    if start_date is not None:
+        query = query.filter(FxRate.date >= start_date)
+    if end_date is not None:
+        query = query.filter(FxRate.date <= end_date)
+    return query.order_by(FxRate.pair, FxRate.date).all()
+
+
+@router.post("/fx-rates/bulk", response_model=FxRateIngestResult)
+def bulk_ingest_fx_rates(rates: List[FxRateCreate], db: Session = Depends(get_db)):
+    """Insert or replace FX rates keyed by (pair, date)"""
+    ingested = ingest_rates(db, [rate.model_dump() for rate in rates])
+    return {"ingested": ingested}
@@ -1,21 +1,95 @@
+import base64
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import TypeAdapter
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.deps import get_db
-from app.models.issue import Issue as IssueModel, Label as LabelModel, IssueStatus
-from app.schemas.issue import Issue, IssueCreate, IssueUpdate, Label, LabelCreate
+from app.core.etag import conditional_json_response
+from app.models.issue import (
+    Issue as IssueModel,
+    IssueComment as IssueCommentModel,
+    Label as LabelModel,
+    PRIORITY_ORDER,
+    IssuePriority,
+    IssueStatus,
+)
+from app.schemas.issue import (
+    Issue,
+    IssueComment,
+    IssueCommentCount,
+    IssueCommentCreate,
+    IssueCommentPage,
+    IssueCommentUpdate,
+    IssueCreate,
+    IssuePage,
+    IssueUpdate,
+    Label,
+    LabelCreate,
+)
+from app.services import reference_data
 
 router = APIRouter()
 
+_label_list = TypeAdapter(List[Label])
+
+def _encode_cursor(issue: IssueModel) -> str:
+    raw = f"{issue.priority.name}:{issue.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str):
+    try:
+        priority_name, issue_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(":", 1)
+        return IssuePriority[priority_name], UUID(issue_id)
+    except (ValueError, KeyError, UnicodeDecodeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+def _encode_comment_cursor(comment: IssueCommentModel) -> str:
+    raw = f"{comment.created_at.isoformat()}|{comment.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_comment_cursor(cursor: str):
+    try:
+        created_at, comment_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(comment_id)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+def _with_authors(db: Session, comments: List[IssueCommentModel]) -> List[dict]:
+    """Attach author data to comments with one lookup for all authors."""
+    authors = {user.id: user for user in reference_data.users.get_many(db, (c.user_id for c in comments))}
+    return [
+        {**IssueComment.model_validate(comment).model_dump(exclude={"user"}), "user": authors.get(comment.user_id)}
+        for comment in comments
+    ]
+
+
+def _get_comment_or_404(db: Session, comment_id: UUID) -> IssueCommentModel:
+    comment = db.query(IssueCommentModel).filter(IssueCommentModel.id == comment_id).first()
+    if not comment:
+        raise HTTPException(status_code=404, detail="Comment not found")
+    return comment
+
 
 # Label endpoints
 @router.get("/labels", response_model=List[Label])
-def get_labels(db: Session = Depends(get_db)):
-    """Get all labels"""
-    return db.query(LabelModel).all()
+def get_labels(request: Request, db: Session = Depends(get_db)):
+    """Get all labels (supports If-None-Match)"""
+    return conditional_json_response(
+        request,
+        ("labels",),
+        "labels",
+        lambda: reference_data.labels.all(db),
+        _label_list,
+    )
 
 
 @router.post("/labels", response_model=Label)
@@ -34,21 +108,51 @@ def create_label(label: LabelCreate, db: Session = Depends(get_db)):
 
 
 # Issue endpoints
-@router.get("", response_model=List[Issue])
+@router.get("", response_model=IssuePage)
 def get_issues(
     status: Optional[IssueStatus] = None,
     assignee_id: Optional[UUID] = None,
+    priority: Optional[IssuePriority] = None,
+    label_id: Optional[UUID] = None,
+    q: Optional[str] = Query(None, description="Search in title and body"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     db: Session = Depends(get_db)
 ):
-    """Get all issues with optional filters"""
-    query = db.query(IssueModel)
+    """Get a page of issues, most severe first, with optional filters"""
+    query = db.query(IssueModel).options(selectinload(IssueModel.labels))
 
     if status:
         query = query.filter(IssueModel.status == status)
     if assignee_id:
         query = query.filter(IssueModel.assignee_id == assignee_id)
+    if priority:
+        query = query.filter(IssueModel.priority == priority)
+    if label_id:
+        query = query.filter(IssueModel.labels.any(LabelModel.id == label_id))
+    if q:
+        query = query.filter(or_(
+            IssueModel.title.icontains(q, autoescape=True),
+            IssueModel.body.icontains(q, autoescape=True),
+        ))
 
-    return query.all()
+    if cursor:
+        # Keyset condition on (priority_rank, id), served by its index like
+        # the ORDER BY below.
+        cursor_priority, cursor_id = _decode_cursor(cursor)
+        cursor_rank = PRIORITY_ORDER.index(cursor_priority)
+        query = query.filter(or_(
+            IssueModel.priority_rank > cursor_rank,
+            and_(IssueModel.priority_rank == cursor_rank, IssueModel.id > cursor_id),
+        ))
+
+    issues = query.order_by(IssueModel.priority_rank, IssueModel.id).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(issues) > limit:
+        issues = issues[:limit]
+        next_cursor = _encode_cursor(issues[-1])
+    return {"items": issues, "next_cursor": next_cursor}
 
 
 @router.get("/{issue_id}", response_model=Issue)
@@ -69,8 +173,7 @@ def create_issue(issue: IssueCreate, db: Session = Depends(get_db)):
 
     # Add labels if provided
     if issue.label_ids:
-        labels = db.query(LabelModel).filter(LabelModel.id.in_(issue.label_ids)).all()
-        db_issue.labels = labels
+        db_issue.labels = reference_data.labels.attach(db, issue.label_ids)
 
     db.add(db_issue)
     db.commit()
@@ -92,8 +195,7 @@ def update_issue(issue_id: UUID, issue: IssueUpdate, db: Session = Depends(get_d
 
     # Update labels if provided
     if issue.label_ids is not None:
-        labels = db.query(LabelModel).filter(LabelModel.id.in_(issue.label_ids)).all()
-        db_issue.labels = labels
+        db_issue.labels = reference_data.labels.attach(db, issue.label_ids)
 
     db.commit()
     db.refresh(db_issue)
@@ -110,3 +212,81 @@ def delete_issue(issue_id: UUID, db: Session = Depends(get_db)):
     db.delete(db_issue)
     db.commit()
     return {"message": "Issue deleted successfully"}
+
+
+# Comment endpoints
+@router.get("/comments/counts", response_model=List[IssueCommentCount])
+def get_comment_counts(
+    issue_id: List[UUID] = Query(..., description="Issues to count comments for"),
+    db: Session = Depends(get_db),
+):
+    """Get comment counts for several issues without loading comment bodies"""
+    counts = dict(
+        db.query(IssueCommentModel.issue_id, func.count(IssueCommentModel.id))
+        .filter(IssueCommentModel.issue_id.in_(issue_id))
+        .group_by(IssueCommentModel.issue_id)
+        .all()
+    )
+    return [{"issue_id": requested, "count": counts.get(requested, 0)} for requested in dict.fromkeys(issue_id)]
+
+
+@router.get("/{issue_id}/comments", response_model=IssueCommentPage)
+def get_issue_comments(
+    issue_id: UUID,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: Session = Depends(get_db),
+):
+    """Get a page of an issue's comments, oldest first, with their authors"""
+    query = db.query(IssueCommentModel).filter(IssueCommentModel.issue_id == issue_id)
+    if cursor:
+        created_at, comment_id = _decode_comment_cursor(cursor)
+        query = query.filter(or_(
+            IssueCommentModel.created_at > created_at,
+            and_(IssueCommentModel.created_at == created_at, IssueCommentModel.id > comment_id),
+        ))
+    comments = (
+        query.order_by(IssueCommentModel.created_at, IssueCommentModel.id)
+        .limit(limit + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(comments) > limit:
+        comments = comments[:limit]
+        next_cursor = _encode_comment_cursor(comments[-1])
+    return {"items": _with_authors(db, comments), "next_cursor": next_cursor}
+
+
+@router.post("/{issue_id}/comments", response_model=IssueComment)
+def create_issue_comment(issue_id: UUID, comment: IssueCommentCreate, db: Session = Depends(get_db)):
+    """Add a comment to an issue"""
+    if not db.query(IssueModel.id).filter(IssueModel.id == issue_id).first():
+        raise HTTPException(status_code=404, detail="Issue not found")
+    if reference_data.users.get(db, comment.user_id) is None:
+        raise HTTPException(status_code=400, detail="Invalid user id")
+
+    db_comment = IssueCommentModel(issue_id=issue_id, **comment.model_dump())
+    db.add(db_comment)
+    db.commit()
+    db.refresh(db_comment)
+    return _with_authors(db, [db_comment])[0]
+
+
+@router.put("/comments/{comment_id}", response_model=IssueComment)
+def update_issue_comment(comment_id: UUID, comment: IssueCommentUpdate, db: Session = Depends(get_db)):
+    """Edit a comment"""
+    db_comment = _get_comment_or_404(db, comment_id)
+    db_comment.content = comment.content
+    db.commit()
+    db.refresh(db_comment)
+    return _with_authors(db, [db_comment])[0]
+
+
+@router.delete("/comments/{comment_id}")
+def delete_issue_comment(comment_id: UUID, db: Session = Depends(get_db)):
+    """Delete a comment"""
+    db_comment = _get_comment_or_404(db, comment_id)
+    db.delete(db_comment)
+    db.commit()
+    return {"message": "Comment deleted successfully"}
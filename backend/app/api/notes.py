@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+from typing import List, Literal, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.deps import get_db
+from app.core.jobs import jobs
+from app.models.note import Note as NoteModel
+from app.schemas.note import Note, NoteCreate, NotePurgeJob, NoteUpdate
+from app.services import reference_data
+from app.services.note_retention import run_note_purge, start_note_purge
+
+router = APIRouter()
+
+
+def _get_note_or_404(db: Session, note_id: UUID) -> NoteModel:
+    note = db.get(NoteModel, note_id)
+    if note is None:
+        raise HTTPException(status_code=404, detail="Note not found")
+    return note
+
+
+@router.get("", response_model=List[Note])
+def get_notes(
+    created_by: Optional[UUID] = Query(None, description="Only notes of this user"),
+    db: Session = Depends(get_db),
+):
+    """Get notes, open ones first, newest first"""
+    query = db.query(NoteModel)
+    if created_by:
+        query = query.filter(NoteModel.created_by == created_by)
+    return query.order_by(NoteModel.is_completed, NoteModel.created_at.desc(), NoteModel.id).all()
+
+
+@router.post("", response_model=Note, status_code=status.HTTP_201_CREATED)
+def create_note(note: NoteCreate, db: Session = Depends(get_db)):
+    """Create a new note"""
+    if reference_data.users.get(db, note.created_by) is None:
+        raise HTTPException(status_code=400, detail="Invalid created_by user id")
+    db_note = NoteModel(**note.model_dump())
+    if db_note.is_completed:
+        db_note.completed_at = datetime.now(timezone.utc)
+    db.add(db_note)
+    db.commit()
+    db.refresh(db_note)
+    return db_note
+
+
+@router.put("/{note_id}", response_model=Note)
+def update_note(note_id: UUID, note: NoteUpdate, db: Session = Depends(get_db)):
+    """Update a note; completing it stamps completed_at"""
+    db_note = _get_note_or_404(db, note_id)
+    update_data = note.model_dump(exclude_unset=True)
+    if "is_completed" in update_data and update_data["is_completed"] != db_note.is_completed:
+        db_note.completed_at = datetime.now(timezone.utc) if update_data["is_completed"] else None
+    for field, value in update_data.items():
+        setattr(db_note, field, value)
+    db.commit()
+    db.refresh(db_note)
+    return db_note
+
+
+@router.delete("/{note_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_note(note_id: UUID, db: Session = Depends(get_db)):
+    """Delete a note"""
+    db.delete(_get_note_or_404(db, note_id))
+    db.commit()
+
+
+@router.post("/purge", response_model=NotePurgeJob, status_code=status.HTTP_202_ACCEPTED)
+def purge_notes(
+    background_tasks: BackgroundTasks,
+    older_than_days: int = Query(settings.NOTES_RETENTION_DAYS, ge=0),
+    mode: Literal["delete", "archive"] = Query(settings.NOTES_RETENTION_MODE),
+    db: Session = Depends(get_db),
+):
+    """Purge or archive completed notes older than the cutoff in the background.
+
+    Poll /api/notes/purge-jobs/{job_id}; the result reports how many notes
+    were purged.
+    """
+    job = start_note_purge(older_than_days, mode)
+    background_tasks.add_task(run_note_purge, Session(bind=db.get_bind()), job, older_than_days, mode)
+    return job
+
+
+@router.get("/purge-jobs/{job_id}", response_model=NotePurgeJob)
+def get_purge_job(job_id: UUID):
+    """Get the progress of a note purge job"""
+    job = jobs.get(job_id)
+    if not job or job.kind != "note_purge":
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
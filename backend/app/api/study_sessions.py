@@ -0,0 +1,214 @@
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.deps import get_db
+from app.models.study import (
+    StudyFollowup as StudyFollowupModel,
+    StudyReference as StudyReferenceModel,
+    StudySession as StudySessionModel,
+)
+from app.schemas.study import (
+    StudyFollowup,
+    StudyFollowupCreate,
+    StudyFollowupUpdate,
+    StudyReference,
+    StudyReferenceCreate,
+    StudyReferenceUpdate,
+    StudySession,
+    StudySessionCreate,
+    StudySessionSearchResult,
+    StudySessionUpdate,
+    TagCount,
+)
+from app.services import reference_data
+from app.services.study_tags import facet_counts, facets, set_tags, tag_filters
+
+router = APIRouter()
+
+
+_CHILDREN = (selectinload(StudySessionModel.references), selectinload(StudySessionModel.followups))
+# Columns a partial update may not clear.
+_REQUIRED_FIELDS = ("topic", "date", "highlights")
+
+
+def _with_children(query):
+    return query.options(*_CHILDREN)
+
+
+def _get_session_or_404(db: Session, session_id: UUID) -> StudySessionModel:
+    # Children are loaded so that deleting cascades on SQLite too.
+    study_session = db.get(StudySessionModel, session_id, options=_CHILDREN)
+    if study_session is None:
+        raise HTTPException(status_code=404, detail="Study session not found")
+    return study_session
+
+
+def _get_child_or_404(db: Session, model, child_id: UUID, name: str):
+    child = db.get(model, child_id)
+    if child is None:
+        raise HTTPException(status_code=404, detail=f"{name} not found")
+    return child
+
+
+def _tag_counts(counts) -> List[dict]:
+    return [{"tag": tag, "count": count} for tag, count in counts]
+
+
+@router.get("", response_model=List[StudySession])
+def get_study_sessions(
+    created_by: Optional[UUID] = Query(None, description="Only sessions of this user"),
+    db: Session = Depends(get_db),
+):
+    """Get study sessions, newest first"""
+    query = _with_children(db.query(StudySessionModel))
+    if created_by:
+        query = query.filter(StudySessionModel.created_by == created_by)
+    return query.order_by(StudySessionModel.date.desc(), StudySessionModel.created_at.desc()).all()
+
+
+@router.get("/search", response_model=StudySessionSearchResult)
+def search_study_sessions(
+    any_tags: List[str] = Query([], alias="any", description="Sessions with at least one of these tags"),
+    all_tags: List[str] = Query([], alias="all", description="Sessions with every one of these tags"),
+    prefix: Optional[str] = Query(None, description="Sessions with a tag starting with this"),
+    facet_limit: int = Query(20, ge=1, le=200),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
+    """Search sessions by tag, with tag counts over the matching sessions"""
+    prefix = prefix.strip() if prefix else None
+    filters = tag_filters(db, any_tags, all_tags, prefix)
+    total = db.scalar(select(func.count()).select_from(StudySessionModel).where(*filters))
+    items = (
+        _with_children(db.query(StudySessionModel))
+        .filter(*filters)
+        .order_by(StudySessionModel.date.desc(), StudySessionModel.created_at.desc(), StudySessionModel.id)
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    if filters:
+        counts = facet_counts(db, select(StudySessionModel.id).where(*filters), limit=facet_limit)
+    else:
+        counts = facets.counts(db, limit=facet_limit)
+    return {"items": items, "total": total, "facets": _tag_counts(counts)}
+
+
+@router.get("/tags", response_model=List[TagCount])
+def get_tags(
+    prefix: Optional[str] = Query(None, description="Only tags starting with this, for autocomplete"),
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_db),
+):
+    """Tags with the number of sessions using each, most used first"""
+    return _tag_counts(facets.counts(db, prefix=prefix.strip() if prefix else None, limit=limit))
+
+
+@router.get("/{session_id}", response_model=StudySession)
+def get_study_session(session_id: UUID, db: Session = Depends(get_db)):
+    """Get a specific study session by ID"""
+    return _get_session_or_404(db, session_id)
+
+
+@router.post("", response_model=StudySession, status_code=status.HTTP_201_CREATED)
+def create_study_session(study_session: StudySessionCreate, db: Session = Depends(get_db)):
+    """Create a new study session"""
+    if reference_data.users.get(db, study_session.created_by) is None:
+        raise HTTPException(status_code=400, detail="Invalid created_by user id")
+    data = study_session.model_dump(exclude={"tags"})
+    if data["date"] is None:
+        del data["date"]
+    db_session = StudySessionModel(**data)
+    _, added = set_tags(db_session, study_session.tags)
+    db.add(db_session)
+    facets.commit(db, added=added)
+    db.refresh(db_session)
+    return db_session
+
+
+@router.put("/{session_id}", response_model=StudySession)
+def update_study_session(session_id: UUID, study_session: StudySessionUpdate, db: Session = Depends(get_db)):
+    """Update a study session; tag changes update the tag index"""
+    db_session = _get_session_or_404(db, session_id)
+    update_data = study_session.model_dump(exclude_unset=True)
+    tags = update_data.pop("tags", None)
+    for field, value in update_data.items():
+        if value is None and field in _REQUIRED_FIELDS:
+            continue
+        setattr(db_session, field, value)
+    removed, added = set_tags(db_session, tags) if tags is not None else ([], [])
+    facets.commit(db, removed=removed, added=added)
+    db.refresh(db_session)
+    return db_session
+
+
+@router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_study_session(session_id: UUID, db: Session = Depends(get_db)):
+    """Delete a study session with its references and followups"""
+    db_session = _get_session_or_404(db, session_id)
+    removed, _ = set_tags(db_session, [])
+    db.delete(db_session)
+    facets.commit(db, removed=removed)
+
+
+@router.post("/{session_id}/references", response_model=StudyReference, status_code=status.HTTP_201_CREATED)
+def create_reference(session_id: UUID, reference: StudyReferenceCreate, db: Session = Depends(get_db)):
+    """Add a reference to a study session"""
+    _get_session_or_404(db, session_id)
+    db_reference = StudyReferenceModel(study_session_id=session_id, **reference.model_dump())
+    db.add(db_reference)
+    db.commit()
+    db.refresh(db_reference)
+    return db_reference
+
+
+@router.put("/references/{reference_id}", response_model=StudyReference)
+def update_reference(reference_id: UUID, reference: StudyReferenceUpdate, db: Session = Depends(get_db)):
+    """Update a reference"""
+    db_reference = _get_child_or_404(db, StudyReferenceModel, reference_id, "Reference")
+    for field, value in reference.model_dump(exclude_unset=True).items():
+        setattr(db_reference, field, value)
+    db.commit()
+    db.refresh(db_reference)
+    return db_reference
+
+
+@router.delete("/references/{reference_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_reference(reference_id: UUID, db: Session = Depends(get_db)):
+    """Delete a reference"""
+    db.delete(_get_child_or_404(db, StudyReferenceModel, reference_id, "Reference"))
+    db.commit()
+
+
+@router.post("/{session_id}/followups", response_model=StudyFollowup, status_code=status.HTTP_201_CREATED)
+def create_followup(session_id: UUID, followup: StudyFollowupCreate, db: Session = Depends(get_db)):
+    """Add a followup to a study session"""
+    _get_session_or_404(db, session_id)
+    db_followup = StudyFollowupModel(study_session_id=session_id, **followup.model_dump())
+    db.add(db_followup)
+    db.commit()
+    db.refresh(db_followup)
+    return db_followup
+
+
+@router.put("/followups/{followup_id}", response_model=StudyFollowup)
+def update_followup(followup_id: UUID, followup: StudyFollowupUpdate, db: Session = Depends(get_db)):
+    """Update a followup"""
+    db_followup = _get_child_or_404(db, StudyFollowupModel, followup_id, "Followup")
+    for field, value in followup.model_dump(exclude_unset=True).items():
+        setattr(db_followup, field, value)
+    db.commit()
+    db.refresh(db_followup)
+    return db_followup
+
+
+@router.delete("/followups/{followup_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_followup(followup_id: UUID, db: Session = Depends(get_db)):
+    """Delete a followup"""
+    db.delete(_get_child_or_404(db, StudyFollowupModel, followup_id, "Followup"))
+    db.commit()
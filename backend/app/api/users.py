@@ -1,29 +1,54 @@
-from typing import List
+from datetime import date
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_db
+from app.core.etag import conditional_json_response
+from app.core.jobs import jobs
 from app.core.security import get_password_hash
 from app.models.user import User as UserModel
-from app.models.expense import Expense as ExpenseModel
-from app.models.issue import Issue as IssueModel
-from app.schemas.user import User, UserCreate, UserUpdate
+from app.schemas.user import User, UserActivity, UserCreate, UserDeletionJob, UserUpdate
+from app.services import reference_data
+from app.services.user_activity import get_user_activity
+from app.services.user_deletion import InvalidReassignTarget, UserInUse, run_user_deletion, start_user_deletion
 
 router = APIRouter()
 
+_user_list = TypeAdapter(List[User])
+
 
 @router.get("", response_model=List[User])
-def get_users(db: Session = Depends(get_db)):
-    """Get all users"""
-    return db.query(UserModel).all()
+def get_users(request: Request, db: Session = Depends(get_db)):
+    """Get all users (supports If-None-Match)"""
+    return conditional_json_response(
+        request,
+        ("users",),
+        "users",
+        lambda: reference_data.users.all(db),
+        _user_list,
+    )
+
+
+@router.get("/activity", response_model=List[UserActivity])
+def get_users_activity(
+    from_date: Optional[date] = Query(None, alias="from", description="First expense date, inclusive"),
+    to_date: Optional[date] = Query(None, alias="to", description="Last expense date, inclusive"),
+    db: Session = Depends(get_db),
+):
+    """Per-user expense count and total, open issues by status and last activity"""
+    if from_date and to_date and from_date > to_date:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    return get_user_activity(db, from_date, to_date)
 
 
 @router.get("/{user_id}", response_model=User)
 def get_user(user_id: UUID, db: Session = Depends(get_db)):
     """Get a specific user by ID"""
-    user = db.query(UserModel).filter(UserModel.id == user_id).first()
+    user = reference_data.users.get(db, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
@@ -76,57 +101,45 @@ def update_user(user_id: UUID, user: UserUpdate, db: Session = Depends(get_db)):
     return db_user
 
 
-@router.delete("/{user_id}")
-def delete_user(user_id: UUID, db: Session = Depends(get_db)):
-    """Delete a user"""
-    db_user = db.query(UserModel).filter(UserModel.id == user_id).first()
-    if not db_user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    fallback_user = (
-        db.query(UserModel)
-        .filter(UserModel.id != user_id)
-        .order_by(UserModel.id.asc())
-        .first()
-    )
-
-    reassignment_needed = False
-
-    expenses_to_reassign = (
-        db.query(ExpenseModel.id)
-        .filter(ExpenseModel.created_by == user_id)
-        .first()
-    )
-    if expenses_to_reassign:
-        reassignment_needed = True
-
-    issues_to_reassign = (
-        db.query(IssueModel.id)
-        .filter(IssueModel.assignee_id == user_id)
-        .first()
-    )
-    if issues_to_reassign:
-        reassignment_needed = True
-
-    if reassignment_needed and not fallback_user:
+@router.delete("/{user_id}", response_model=UserDeletionJob, status_code=status.HTTP_202_ACCEPTED)
+def delete_user(
+    user_id: UUID,
+    background_tasks: BackgroundTasks,
+    reassign_to: Optional[UUID] = Query(
+        None, description="User who takes over the shared records (expenses, issues, fixed costs)"
+    ),
+    db: Session = Depends(get_db),
+):
+    """Delete a user in the background.
+
+    Shared records (expenses, assigned issues, fixed costs and payments)
+    are reassigned in batches to ``reassign_to``, which is required when
+    the user has any. Personal data (comments, notes, calendar events and
+    preferences, study sessions) is deleted with the user. The job counts
+    the rows, so ``total`` is filled in once it starts; poll it at
+    /api/users/deletion-jobs/{job_id} for progress and the per-table result.
+    """
+    try:
+        job = start_user_deletion(db, user_id, reassign_to)
+    except InvalidReassignTarget:
+        raise HTTPException(status_code=400, detail="reassign_to must be another existing user")
+    except UserInUse:
         raise HTTPException(
             status_code=400,
-            detail="해당 구성원은 다른 데이터에서 사용 중입니다. 다른 구성원을 만든 뒤 다시 삭제하거나 관련 기록을 삭제해주세요."
+            detail="해당 구성원은 공유 기록(지출, 이슈, 고정비)을 가지고 있습니다. 기록을 넘겨받을 구성원(reassign_to)을 지정해주세요."
         )
+    if job is None:
+        raise HTTPException(status_code=404, detail="User not found")
 
-    if fallback_user:
-        fallback_id = fallback_user.id
-        if expenses_to_reassign:
-            db.query(ExpenseModel).filter(ExpenseModel.created_by == user_id).update(
-                {ExpenseModel.created_by: fallback_id},
-                synchronize_session=False
-            )
-        if issues_to_reassign:
-            db.query(IssueModel).filter(IssueModel.assignee_id == user_id).update(
-                {IssueModel.assignee_id: fallback_id},
-                synchronize_session=False
-            )
-
-    db.delete(db_user)
-    db.commit()
-    return {"message": "User deleted successfully"}
+    # The job outlives the request, so it gets its own session.
+    background_tasks.add_task(run_user_deletion, Session(bind=db.get_bind()), job, user_id, reassign_to)
+    return job
+
+
+@router.get("/deletion-jobs/{job_id}", response_model=UserDeletionJob)
+def get_user_deletion_job(job_id: UUID):
+    """Get the progress of a user deletion job"""
+    job = jobs.get(job_id)
+    if not job or job.kind != "user_deletion":
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
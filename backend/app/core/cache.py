@@ -0,0 +1,229 @@
+"""In-process caches invalidated by per-table write versions.
+
+Every committed write bumps a counter for each table it touched. Cached
+values remember the counters they were computed under, so a read only has
+to compare a few integers to know whether the entry is still valid and
+never needs to go back to the database while nothing has changed.
+
+Tables registered with track_row_writes are also stamped per row key, so
+a cache over a slice of such a table (one owner's month, say) survives
+writes to other slices. Writes the flush cannot attribute to rows, such as
+bulk statements, move every key of the table at once.
+"""
+import threading
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+_PENDING_TABLES_KEY = "pending_table_writes"
+_PENDING_BULK_KEY = "pending_bulk_writes"
+_PENDING_ROWS_KEY = "pending_row_writes"
+
+# Table name -> function from a column getter to the row's keys.
+RowKeys = Callable[[Callable[[str], Any]], Iterable[Hashable]]
+_row_keys: Dict[str, RowKeys] = {}
+
+
+class TableVersions:
+    """Monotonic write counters keyed by table name."""
+
+    def __init__(self):
+        self._versions: dict[str, int] = {}
+        # Writes not attributed to row keys, and writes per (table, key).
+        self._bulk: dict[str, int] = {}
+        self._rows: dict[Tuple[str, Hashable], int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, table: str) -> int:
+        return self._versions.get(table, 0)
+
+    def snapshot(self, tables: Iterable[str]) -> Tuple[int, ...]:
+        return tuple(self._versions.get(table, 0) for table in tables)
+
+    def row_version(self, table: str, key: Hashable) -> Tuple[int, int]:
+        """Version of the rows under ``key``; see track_row_writes."""
+        return self._bulk.get(table, 0), self._rows.get((table, key), 0)
+
+    def bump(self, *tables: str) -> None:
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def bump_bulk(self, *tables: str) -> None:
+        with self._lock:
+            for table in tables:
+                self._bulk[table] = self._bulk.get(table, 0) + 1
+
+    def bump_rows(self, row_keys: Iterable[Tuple[str, Hashable]]) -> None:
+        with self._lock:
+            for row_key in row_keys:
+                self._rows[row_key] = self._rows.get(row_key, 0) + 1
+
+
+table_versions = TableVersions()
+
+
+class VersionedCache:
+    """Bounded LRU mapping whose entries are only valid for one version token."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, version: Any) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, version: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: Hashable, version: Any, compute: Callable[[], Any]) -> Any:
+        cached = self.get(key, version)
+        if cached is not None:
+            return cached
+        # The version is captured before computing, so a write that lands
+        # while we compute leaves the entry stale instead of wrongly fresh.
+        value = compute()
+        self.set(key, version, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def _pending_tables(session: Session) -> set:
+    return session.info.setdefault(_PENDING_TABLES_KEY, set())
+
+
+def note_table_writes(session: Session, *tables: str) -> None:
+    """Record writes the session events cannot see, such as DML inside a CTE."""
+    _pending_tables(session).update(tables)
+    session.info.setdefault(_PENDING_BULK_KEY, set()).update(tables)
+
+
+def track_row_writes(model, keys: RowKeys) -> None:
+    """Stamp flushed writes to ``model`` per row key (see row_version).
+
+    ``keys`` gets a column getter and returns the keys a row belongs to; a
+    changed row is stamped under its keys before and after the change.
+    """
+    _row_keys[model.__tablename__] = keys
+
+
+class _UnknownValue(Exception):
+    """A key column was overwritten before its committed value was loaded."""
+
+
+def _flushed_row_keys(instance, keys: RowKeys) -> Optional[set]:
+    state = inspect(instance)
+
+    def committed(name):
+        history = state.attrs[name].history
+        if history.deleted:
+            return history.deleted[0]
+        if history.added and state.has_identity:
+            raise _UnknownValue(name)
+        return getattr(instance, name)
+
+    try:
+        return set(keys(lambda name: getattr(instance, name))) | set(keys(committed))
+    except _UnknownValue:
+        return None
+
+
+def has_pending_writes(session: Session, table: str) -> bool:
+    """Whether ``session`` holds uncommitted writes to ``table``.
+
+    Reads inside such a session see data that may still be rolled back and
+    must not be cached under the committed version.
+    """
+    if table in session.info.get(_PENDING_TABLES_KEY, ()):
+        return True
+    return any(
+        getattr(instance, "__tablename__", None) == table
+        for instance in chain(session.new, session.dirty, session.deleted)
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_row_writes(session, flush_context, instances):
+    # Expired key columns (and deleted rows) can still be loaded here.
+    bulk = session.info.setdefault(_PENDING_BULK_KEY, set())
+    rows = session.info.setdefault(_PENDING_ROWS_KEY, set())
+    for instance in chain(session.new, session.dirty, session.deleted):
+        table = getattr(instance, "__tablename__", None)
+        keys = _row_keys.get(table)
+        if keys is None:
+            continue
+        row_keys = _flushed_row_keys(instance, keys)
+        if row_keys is None:
+            bulk.add(table)
+        else:
+            rows.update((table, key) for key in row_keys)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session, flush_context):
+    pending = _pending_tables(session)
+    bulk = session.info.setdefault(_PENDING_BULK_KEY, set())
+    for instance in chain(session.new, session.dirty, session.deleted):
+        table = getattr(instance, "__tablename__", None)
+        if table:
+            pending.add(table)
+            if table not in _row_keys:
+                bulk.add(table)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_tables(orm_execute_state):
+    if orm_execute_state.is_select:
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None and getattr(table, "name", None):
+        note_table_writes(orm_execute_state.session, table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_tables(session):
+    pending = session.info.pop(_PENDING_TABLES_KEY, None)
+    bulk = session.info.pop(_PENDING_BULK_KEY, None)
+    rows = session.info.pop(_PENDING_ROWS_KEY, None)
+    if rows:
+        table_versions.bump_rows(rows)
+    if bulk:
+        table_versions.bump_bulk(*bulk)
+    if pending:
+        table_versions.bump(*pending)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back_tables(session, previous_transaction):
+    for key in (_PENDING_TABLES_KEY, _PENDING_BULK_KEY, _PENDING_ROWS_KEY):
+        session.info.pop(key, None)
@@ -15,6 +15,12 @@ class Settings(BaseSettings):
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:5173"]
 
+    # Notes retention: completed notes older than this many days are purged
+    # every NOTES_PURGE_INTERVAL_MINUTES (0 disables the schedule).
+    NOTES_RETENTION_DAYS: int = 7
+    NOTES_RETENTION_MODE: str = "delete"  # or "archive"
+    NOTES_PURGE_INTERVAL_MINUTES: int = 60
+
     # App
     APP_NAME: str = "Jjoogguk Finance API"
     DEBUG: bool = True
@@ -0,0 +1,61 @@
+"""Conditional GET support for list endpoints over rarely changing tables.
+
+The ETag of a response is derived from the write versions of the tables it
+reads (see app.core.cache), so a client revalidating with If-None-Match is
+answered with 304 without a query. The serialized body for the current
+version is also kept in memory, so a changed ETag costs one query and one
+serialization per table write rather than one per poll.
+"""
+import uuid
+from typing import Any, Callable, Hashable, Sequence
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+from app.core.cache import VersionedCache, table_versions
+
+# Counters restart with the process; the boot id keeps ETags issued before a
+# restart from matching the reset counters.
+_BOOT_ID = uuid.uuid4().hex[:8]
+
+_body_cache = VersionedCache(maxsize=256)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    # Weak comparison: W/"x" and "x" are equivalent for GET revalidation.
+    return any(candidate.removeprefix("W/") == etag.removeprefix("W/") for candidate in candidates)
+
+
+def conditional_json_response(
+    request: Request,
+    tables: Sequence[str],
+    key: Hashable,
+    load: Callable[[], Any],
+    adapter: TypeAdapter,
+) -> Response:
+    """Serve ``load()`` serialized by ``adapter`` with an ETag from ``tables``' versions.
+
+    ``key`` must identify everything besides the table contents that shapes
+    the body, such as query parameters.
+    """
+    version = table_versions.snapshot(tables)
+    etag = 'W/"{}-{}-{}"'.format(
+        _BOOT_ID,
+        abs(hash(key)) % (1 << 32),
+        ".".join(str(part) for part in version),
+    )
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body = _body_cache.get_or_compute(
+        key,
+        version,
+        lambda: adapter.dump_json(adapter.validate_python(load(), from_attributes=True)),
+    )
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,81 @@
+"""In-process registry for background jobs and their progress.
+
+Jobs run in this process (FastAPI background tasks), so their state lives
+in memory and is lost on restart; the registry keeps the most recent
+MAX_JOBS jobs for status polling.
+"""
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Optional
+
+MAX_JOBS = 200
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class Job:
+    kind: str
+    total: int = 0
+    processed: int = 0
+    status: JobStatus = JobStatus.PENDING
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: Optional[datetime] = None
+
+
+class JobRegistry:
+    """Bounded, thread-safe map of job id to Job."""
+
+    def __init__(self, maxsize: int = MAX_JOBS):
+        self.maxsize = maxsize
+        self._jobs: "OrderedDict[uuid.UUID, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, kind: str, total: int = 0) -> Job:
+        job = Job(kind=kind, total=total)
+        with self._lock:
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.maxsize:
+                self._jobs.popitem(last=False)
+        return job
+
+    def get(self, job_id: uuid.UUID) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def start(self, job: Job, total: Optional[int] = None) -> None:
+        with self._lock:
+            job.status = JobStatus.RUNNING
+            if total is not None:
+                job.total = total
+
+    def advance(self, job: Job, count: int) -> None:
+        with self._lock:
+            job.processed += count
+
+    def finish(self, job: Job, result: Any = None) -> None:
+        with self._lock:
+            job.status = JobStatus.COMPLETED
+            job.result = result
+            job.finished_at = datetime.now(timezone.utc)
+
+    def fail(self, job: Job, error: str) -> None:
+        with self._lock:
+            job.status = JobStatus.FAILED
+            job.error = error
+            job.finished_at = datetime.now(timezone.utc)
+
+
+jobs = JobRegistry()
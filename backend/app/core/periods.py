@@ -0,0 +1,27 @@
+"""Helpers for the ``YYYY-MM`` month strings used across the API."""
+from datetime import date, timedelta
+
+MONTH_PATTERN = r"^\d{4}-(0[1-9]|1[0-2])$"
+
+
+def month_start(month: str) -> date:
+    """First day of a ``YYYY-MM`` month."""
+    try:
+        year, month_number = month.split("-")
+        return date(int(year), int(month_number), 1)
+    except (AttributeError, ValueError) as exc:
+        raise ValueError(f"Invalid month {month!r}, expected YYYY-MM") from exc
+
+
+def month_end(month: str) -> date:
+    """Last day of a ``YYYY-MM`` month."""
+    return add_months(month_start(month), 1) - timedelta(days=1)
+
+
+def format_month(period: date) -> str:
+    return period.strftime("%Y-%m")
+
+
+def add_months(period: date, months: int) -> date:
+    index = period.year * 12 + period.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
@@ -1,8 +1,31 @@
+from contextlib import asynccontextmanager
+from datetime import timedelta
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services.note_retention import NoteRetentionSchedule
+from app.services.reference_data import cache_stats
+
+note_retention = NoteRetentionSchedule(
+    SessionLocal,
+    interval=timedelta(minutes=settings.NOTES_PURGE_INTERVAL_MINUTES),
+    older_than_days=settings.NOTES_RETENTION_DAYS,
+    mode=settings.NOTES_RETENTION_MODE,
+)
+
 
-app = FastAPI(title=settings.APP_NAME, debug=settings.DEBUG)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    note_retention.start()
+    try:
+        yield
+    finally:
+        note_retention.stop()
+
+
+app = FastAPI(title=settings.APP_NAME, debug=settings.DEBUG, lifespan=lifespan)
 
 # CORS middleware
 app.add_middleware(
@@ -22,12 +45,12 @@ def read_root():
 
 @app.get("/api/health")
 def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy"}
+    """Health check endpoint, with reference cache hit/miss counters"""
+    return {"status": "healthy", "reference_cache": cache_stats()}
 
 
 # Import routers
-from app.api import categories, expenses, investments, issues, users, budgets
+from app.api import categories, expenses, investments, issues, users, budgets, fixed_costs, calendar, notes, study_sessions
 
 # Mount routers
 app.include_router(
@@ -60,6 +83,26 @@ app.include_router(
     prefix="/api/budgets",
     tags=["budgets"]
 )
+app.include_router(
+    fixed_costs.router,
+    prefix="/api/fixed-costs",
+    tags=["fixed-costs"]
+)
+app.include_router(
+    calendar.router,
+    prefix="/api/calendar",
+    tags=["calendar"]
+)
+app.include_router(
+    notes.router,
+    prefix="/api/notes",
+    tags=["notes"]
+)
+app.include_router(
+    study_sessions.router,
+    prefix="/api/study-sessions",
+    tags=["study-sessions"]
+)
 
 # TODO: Add more routers
 # from app.api import auth
@@ -17,8 +17,24 @@ from app.models import (
     Budget,
     InvestmentAccount,
     Holding,
+    InvestmentTransaction,
+    CorporateAction,
+    FxRate,
+    CalendarEvent,
+    CalendarOccurrence,
+    CalendarOccurrenceHorizon,
+    UserCalendarPreference,
+    FixedCost,
+    FixedCostPayment,
     Issue,
+    IssueComment,
     Label,
+    Note,
+    NoteArchive,
+    StudySession,
+    StudySessionTag,
+    StudyReference,
+    StudyFollowup,
 )
 
 # this is the Alembic Config object, which provides
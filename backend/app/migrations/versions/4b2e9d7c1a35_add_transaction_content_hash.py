@@ -0,0 +1,88 @@
+"""add content hash to investment transactions
+
+Revision ID: 4b2e9d7c1a35
+Revises: c7f3b1ef4123
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+import hashlib
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4b2e9d7c1a35"
+down_revision: Union[str, None] = "c7f3b1ef4123"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BATCH_SIZE = 5000
+
+
+def _content_hash(account_id, symbol, trade_date, quantity, price) -> str:
+    # Mirrors app.models.investment.transaction_content_hash at the time of
+    # this revision; kept inline so the migration does not drift with the app.
+    key = "|".join((
+        str(account_id),
+        symbol.strip().upper(),
+        trade_date.isoformat(),
+        repr(float(quantity)),
+        repr(float(price)),
+    ))
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    op.add_column("investment_transactions", sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+    bind = op.get_bind()
+    transactions = sa.table(
+        "investment_transactions",
+        sa.column("id"),
+        sa.column("account_id"),
+        sa.column("symbol"),
+        sa.column("trade_date"),
+        sa.column("quantity"),
+        sa.column("price"),
+        sa.column("content_hash"),
+    )
+    while True:
+        rows = bind.execute(
+            sa.select(
+                transactions.c.id,
+                transactions.c.account_id,
+                transactions.c.symbol,
+                transactions.c.trade_date,
+                transactions.c.quantity,
+                transactions.c.price,
+            )
+            .where(transactions.c.content_hash.is_(None))
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        bind.execute(
+            transactions.update()
+            .where(transactions.c.id == sa.bindparam("row_id"))
+            .values(content_hash=sa.bindparam("hash")),
+            [
+                {"row_id": row.id, "hash": _content_hash(*row[1:])}
+                for row in rows
+            ],
+        )
+
+    op.create_index(
+        op.f("ix_investment_transactions_content_hash"),
+        "investment_transactions",
+        ["content_hash"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_investment_transactions_content_hash"), table_name="investment_transactions")
+    op.drop_column("investment_transactions", "content_hash")
@@ -0,0 +1,44 @@
+"""add corporate actions table
+
+Revision ID: 9e4c6a2f7b18
+Revises: 4b2e9d7c1a35
+Create Date: 2026-10-18 00:10:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9e4c6a2f7b18"
+down_revision: Union[str, None] = "4b2e9d7c1a35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "corporate_actions",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("uuid_generate_v4()"), nullable=False),
+        sa.Column("symbol", sa.String(), nullable=False),
+        sa.Column("type", sa.Enum("SPLIT", "STOCK_DIVIDEND", name="corporateactiontype"), nullable=False),
+        sa.Column("ex_date", sa.Date(), nullable=False),
+        sa.Column("ratio", sa.Float(), nullable=False),
+        sa.Column("memo", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("symbol", "ex_date", "type", name="uq_corporate_actions_symbol_ex_date_type"),
+    )
+    op.create_index(op.f("ix_corporate_actions_id"), "corporate_actions", ["id"], unique=False)
+    op.create_index(op.f("ix_corporate_actions_symbol"), "corporate_actions", ["symbol"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_corporate_actions_symbol"), table_name="corporate_actions")
+    op.drop_index(op.f("ix_corporate_actions_id"), table_name="corporate_actions")
+    op.drop_table("corporate_actions")
+    op.execute("DROP TYPE IF EXISTS corporateactiontype")
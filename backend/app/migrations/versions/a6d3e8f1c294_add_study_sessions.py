@@ -0,0 +1,105 @@
+"""add study sessions, references, followups and the tag index
+
+Revision ID: a6d3e8f1c294
+Revises: f27c4e9a0b63
+Create Date: 2026-10-18 04:40:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a6d3e8f1c294"
+down_revision: Union[str, None] = "f27c4e9a0b63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "study_sessions",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("uuid_generate_v4()"), nullable=False),
+        sa.Column("topic", sa.Text(), nullable=False),
+        sa.Column("date", sa.Date(), server_default=sa.text("CURRENT_DATE"), nullable=False),
+        sa.Column("source", sa.Text(), nullable=True),
+        sa.Column("participants", sa.Text(), nullable=True),
+        sa.Column("tags", postgresql.ARRAY(sa.Text()), server_default=sa.text("'{}'"), nullable=False),
+        sa.Column("highlights", postgresql.ARRAY(sa.Text()), server_default=sa.text("'{}'"), nullable=False),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["created_by"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_study_sessions_id"), "study_sessions", ["id"], unique=False)
+    op.create_index(op.f("ix_study_sessions_date"), "study_sessions", ["date"], unique=False)
+    op.create_index(op.f("ix_study_sessions_created_by"), "study_sessions", ["created_by"], unique=False)
+    # Any-of (&&) and all-of (@>) tag filters.
+    op.create_index("ix_study_sessions_tags", "study_sessions", ["tags"], unique=False, postgresql_using="gin")
+
+    # One row per (session, tag), mirroring the arrays: prefix search and
+    # facet counts.
+    op.create_table(
+        "study_session_tags",
+        sa.Column("study_session_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("tag", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(["study_session_id"], ["study_sessions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("study_session_id", "tag"),
+    )
+    op.create_index(
+        "ix_study_session_tags_tag_session", "study_session_tags", ["tag", "study_session_id"], unique=False
+    )
+
+    op.create_table(
+        "study_references",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("uuid_generate_v4()"), nullable=False),
+        sa.Column("study_session_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("url", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["study_session_id"], ["study_sessions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_study_references_id"), "study_references", ["id"], unique=False)
+    op.create_index(
+        op.f("ix_study_references_study_session_id"), "study_references", ["study_session_id"], unique=False
+    )
+
+    op.create_table(
+        "study_followups",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("uuid_generate_v4()"), nullable=False),
+        sa.Column("study_session_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("task", sa.Text(), nullable=False),
+        sa.Column("owner", sa.Text(), nullable=True),
+        sa.Column("due", sa.Date(), nullable=True),
+        sa.Column("completed", sa.Boolean(), server_default=sa.false(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["study_session_id"], ["study_sessions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_study_followups_id"), "study_followups", ["id"], unique=False)
+    op.create_index(
+        op.f("ix_study_followups_study_session_id"), "study_followups", ["study_session_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_study_followups_study_session_id"), table_name="study_followups")
+    op.drop_index(op.f("ix_study_followups_id"), table_name="study_followups")
+    op.drop_table("study_followups")
+    op.drop_index(op.f("ix_study_references_study_session_id"), table_name="study_references")
+    op.drop_index(op.f("ix_study_references_id"), table_name="study_references")
+    op.drop_table("study_references")
+    op.drop_index("ix_study_session_tags_tag_session", table_name="study_session_tags")
+    op.drop_table("study_session_tags")
+    op.drop_index("ix_study_sessions_tags", table_name="study_sessions")
+    op.drop_index(op.f("ix_study_sessions_created_by"), table_name="study_sessions")
+    op.drop_index(op.f("ix_study_sessions_date"), table_name="study_sessions")
+    op.drop_index(op.f("ix_study_sessions_id"), table_name="study_sessions")
+    op.drop_table("study_sessions")
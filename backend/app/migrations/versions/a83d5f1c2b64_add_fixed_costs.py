@@ -0,0 +1,92 @@
+"""add fixed costs and fixed cost payments
+
+Revision ID: a83d5f1c2b64
+Revises: f41c9d2e6a57
+Create Date: 2026-10-18 01:50:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a83d5f1c2b64"
+down_revision: Union[str, None] = "f41c9d2e6a57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fixed_costs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("uuid_generate_v4()"), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("category_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("payment_day", sa.Integer(), nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), server_default=sa.true(), nullable=False),
+        sa.Column("is_fixed_amount", sa.Boolean(), server_default=sa.true(), nullable=False),
+        sa.Column("memo", sa.Text(), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint("amount >= 0", name="ck_fixed_costs_amount"),
+        sa.CheckConstraint("payment_day BETWEEN 1 AND 31", name="ck_fixed_costs_payment_day"),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["created_by"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_fixed_costs_id"), "fixed_costs", ["id"], unique=False)
+    op.create_index(op.f("ix_fixed_costs_is_active"), "fixed_costs", ["is_active"], unique=False)
+    op.create_index(op.f("ix_fixed_costs_created_by"), "fixed_costs", ["created_by"], unique=False)
+
+    op.create_table(
+        "fixed_cost_payments",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("uuid_generate_v4()"), nullable=False),
+        sa.Column("fixed_cost_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("year_month", sa.String(length=7), nullable=False),
+        sa.Column("scheduled_amount", sa.Float(), nullable=True),
+        sa.Column("actual_amount", sa.Float(), nullable=True),
+        sa.Column("payment_date", sa.Date(), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum("SCHEDULED", "PAID", "SKIPPED", name="fixedcostpaymentstatus"),
+            server_default="SCHEDULED",
+            nullable=False,
+        ),
+        sa.Column("memo", sa.Text(), nullable=True),
+        sa.Column("expense_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint("scheduled_amount >= 0", name="ck_fixed_cost_payments_scheduled_amount"),
+        sa.CheckConstraint("actual_amount >= 0", name="ck_fixed_cost_payments_actual_amount"),
+        sa.ForeignKeyConstraint(["fixed_cost_id"], ["fixed_costs.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["expense_id"], ["expenses.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["created_by"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("fixed_cost_id", "year_month", name="uq_fixed_cost_payments_fixed_cost_id_year_month"),
+    )
+    op.create_index(op.f("ix_fixed_cost_payments_id"), "fixed_cost_payments", ["id"], unique=False)
+    op.create_index(op.f("ix_fixed_cost_payments_year_month"), "fixed_cost_payments", ["year_month"], unique=False)
+    op.create_index(op.f("ix_fixed_cost_payments_expense_id"), "fixed_cost_payments", ["expense_id"], unique=False)
+    op.create_index(op.f("ix_fixed_cost_payments_created_by"), "fixed_cost_payments", ["created_by"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_fixed_cost_payments_created_by"), table_name="fixed_cost_payments")
+    op.drop_index(op.f("ix_fixed_cost_payments_expense_id"), table_name="fixed_cost_payments")
+    op.drop_index(op.f("ix_fixed_cost_payments_year_month"), table_name="fixed_cost_payments")
+    op.drop_index(op.f("ix_fixed_cost_payments_id"), table_name="fixed_cost_payments")
+    op.drop_table("fixed_cost_payments")
+    op.execute("DROP TYPE IF EXISTS fixedcostpaymentstatus")
+    op.drop_index(op.f("ix_fixed_costs_created_by"), table_name="fixed_costs")
+    op.drop_index(op.f("ix_fixed_costs_is_active"), table_name="fixed_costs")
+    op.drop_index(op.f("ix_fixed_costs_id"), table_name="fixed_costs")
+    op.drop_table("fixed_costs")
@@ -0,0 +1,43 @@
+"""order issues by a stored priority rank
+
+Revision ID: b3f9c1d7e605
+Revises: a6d3e8f1c294
+Create Date: 2026-10-18 05:20:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f9c1d7e605"
+down_revision: Union[str, None] = "a6d3e8f1c294"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors app.models.issue.PRIORITY_RANK_SQL at the time of this revision.
+PRIORITY_RANK_SQL = (
+    "CASE priority WHEN 'CRITICAL' THEN 0 WHEN 'HIGH' THEN 1 "
+    "WHEN 'MEDIUM' THEN 2 WHEN 'LOW' THEN 3 END"
+)
+
+
+def upgrade() -> None:
+    # The enum's storage order (LOW..CRITICAL) is not severity order, so the
+    # list sorted on a CASE no index could serve; a generated column can be
+    # indexed and is kept current by the database for every writer.
+    op.add_column(
+        "issues",
+        sa.Column("priority_rank", sa.SmallInteger(), sa.Computed(PRIORITY_RANK_SQL, persisted=True), nullable=False),
+    )
+    op.drop_index("ix_issues_priority_id", table_name="issues")
+    op.create_index("ix_issues_priority_rank_id", "issues", ["priority_rank", "id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_issues_priority_rank_id", table_name="issues")
+    op.create_index("ix_issues_priority_id", "issues", ["priority", "id"], unique=False)
+    op.drop_column("issues", "priority_rank")
@@ -0,0 +1,48 @@
+"""add currency columns and fx rates table
+
+Revision ID: b58d13e0c6f2
+Revises: 9e4c6a2f7b18
+Create Date: 2026-10-18 00:20:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b58d13e0c6f2"
+down_revision: Union[str, None] = "9e4c6a2f7b18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("holdings", sa.Column("currency", sa.String(length=3), server_default="KRW", nullable=False))
+    op.add_column(
+        "investment_transactions",
+        sa.Column("currency", sa.String(length=3), server_default="KRW", nullable=False),
+    )
+
+    op.create_table(
+        "fx_rates",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("uuid_generate_v4()"), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("pair", sa.String(length=6), nullable=False),
+        sa.Column("rate", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("pair", "date", name="uq_fx_rates_pair_date"),
+    )
+    op.create_index(op.f("ix_fx_rates_id"), "fx_rates", ["id"], unique=False)
+    op.create_index(op.f("ix_fx_rates_pair"), "fx_rates", ["pair"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_fx_rates_pair"), table_name="fx_rates")
+    op.drop_index(op.f("ix_fx_rates_id"), table_name="fx_rates")
+    op.drop_table("fx_rates")
+    op.drop_column("investment_transactions", "currency")
+    op.drop_column("holdings", "currency")
@@ -0,0 +1,31 @@
+"""add (created_by, year_month, status) index on fixed cost payments
+
+Revision ID: b97e2c4a5d10
+Revises: a83d5f1c2b64
+Create Date: 2026-10-18 02:10:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b97e2c4a5d10"
+down_revision: Union[str, None] = "a83d5f1c2b64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_fixed_cost_payments_created_by_year_month_status",
+        "fixed_cost_payments",
+        ["created_by", "year_month", "status"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fixed_cost_payments_created_by_year_month_status", table_name="fixed_cost_payments")
@@ -0,0 +1,94 @@
+"""store budget month as an indexed first-of-month date
+
+Revision ID: c3a71f5e8d42
+Revises: b58d13e0c6f2
+Create Date: 2026-10-18 00:30:00.000000
+
+"""
+import logging
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a71f5e8d42"
+down_revision: Union[str, None] = "b58d13e0c6f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# month was free-form text. "YYYY-MM" (also "YYYY-M", "YYYY/MM", "YYYY.MM",
+# surrounding spaces) with a month of 1-12 converts; the captured groups are
+# digits, so the casts below cannot fail.
+_YEAR = r"substring(month from '^\s*(\d{4})')::int"
+_MONTH = r"substring(month from '^\s*\d{4}[-./](\d{1,2})\s*$')::int"
+_CONVERTIBLE = f"COALESCE({_MONTH} BETWEEN 1 AND 12, false)"
+
+
+def upgrade() -> None:
+    # Rows whose month cannot be read are moved aside instead of aborting
+    # the upgrade; review budgets_invalid_month and re-create them by hand.
+    op.execute(f"CREATE TABLE budgets_invalid_month AS SELECT * FROM budgets WHERE NOT {_CONVERTIBLE}")
+    quarantined = op.get_bind().execute(sa.text("SELECT count(*) FROM budgets_invalid_month")).scalar()
+    if quarantined:
+        logger.warning(
+            "Moved %s budgets with an unreadable month to budgets_invalid_month", quarantined
+        )
+    op.execute(f"DELETE FROM budgets WHERE NOT {_CONVERTIBLE}")
+
+    op.add_column("budgets", sa.Column("period", sa.Date(), nullable=True))
+    op.execute(f"UPDATE budgets SET period = make_date({_YEAR}, {_MONTH}, 1)")
+
+    # Earlier versions only enforced uniqueness in the API; fold any
+    # duplicates into one row before adding the constraint.
+    op.execute(
+        """
+        WITH ranked AS (
+            SELECT id,
+                   SUM(limit_amount) OVER (PARTITION BY category_id, period) AS total_limit,
+                   ROW_NUMBER() OVER (PARTITION BY category_id, period ORDER BY id) AS position
+            FROM budgets
+        )
+        UPDATE budgets AS b
+        SET limit_amount = ranked.total_limit
+        FROM ranked
+        WHERE b.id = ranked.id AND ranked.position = 1
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM budgets AS b
+        USING budgets AS keep
+        WHERE b.category_id = keep.category_id
+          AND b.period = keep.period
+          AND b.id > keep.id
+        """
+    )
+
+    op.alter_column("budgets", "period", existing_type=sa.Date(), nullable=False)
+    op.create_index(op.f("ix_budgets_period"), "budgets", ["period"], unique=False)
+    op.create_unique_constraint("uq_budgets_category_id_period", "budgets", ["category_id", "period"])
+
+    op.drop_index("ix_budgets_month", table_name="budgets")
+    op.drop_column("budgets", "month")
+
+
+def downgrade() -> None:
+    op.add_column("budgets", sa.Column("month", sa.String(), nullable=True))
+    op.execute("UPDATE budgets SET month = to_char(period, 'YYYY-MM')")
+    op.alter_column("budgets", "month", existing_type=sa.String(), nullable=False)
+    op.create_index("ix_budgets_month", "budgets", ["month"], unique=False)
+
+    op.drop_constraint("uq_budgets_category_id_period", "budgets", type_="unique")
+    op.drop_index(op.f("ix_budgets_period"), table_name="budgets")
+    op.drop_column("budgets", "period")
+
+    op.execute(
+        "INSERT INTO budgets (id, category_id, month, limit_amount) "
+        "SELECT id, category_id, month, limit_amount FROM budgets_invalid_month"
+    )
+    op.drop_table("budgets_invalid_month")
@@ -0,0 +1,43 @@
+"""replace the is_active index on fixed costs with partial indexes
+
+Revision ID: c5d18e7f3a92
+Revises: b97e2c4a5d10
+Create Date: 2026-10-18 02:40:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d18e7f3a92"
+down_revision: Union[str, None] = "b97e2c4a5d10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f("ix_fixed_costs_is_active"), table_name="fixed_costs")
+    op.create_index(
+        "ix_fixed_costs_active_created_by_start_date",
+        "fixed_costs",
+        ["created_by", "start_date"],
+        unique=False,
+        postgresql_where=sa.text("is_active"),
+    )
+    op.create_index(
+        "ix_fixed_costs_active_start_date",
+        "fixed_costs",
+        ["start_date"],
+        unique=False,
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fixed_costs_active_start_date", table_name="fixed_costs")
+    op.drop_index("ix_fixed_costs_active_created_by_start_date", table_name="fixed_costs")
+    op.create_index(op.f("ix_fixed_costs_is_active"), "fixed_costs", ["is_active"], unique=False)
@@ -0,0 +1,32 @@
+"""add indexes for the paginated issues list
+
+Revision ID: d6f0b2a9e374
+Revises: c3a71f5e8d42
+Create Date: 2026-10-18 00:40:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d6f0b2a9e374"
+down_revision: Union[str, None] = "c3a71f5e8d42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_issues_priority_id", "issues", ["priority", "id"], unique=False)
+    op.create_index(op.f("ix_issues_status"), "issues", ["status"], unique=False)
+    op.create_index(op.f("ix_issues_assignee_id"), "issues", ["assignee_id"], unique=False)
+    op.create_index(op.f("ix_issue_labels_label_id"), "issue_labels", ["label_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_issue_labels_label_id"), table_name="issue_labels")
+    op.drop_index(op.f("ix_issues_assignee_id"), table_name="issues")
+    op.drop_index(op.f("ix_issues_status"), table_name="issues")
+    op.drop_index("ix_issues_priority_id", table_name="issues")
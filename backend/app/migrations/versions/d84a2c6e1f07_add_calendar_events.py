@@ -0,0 +1,78 @@
+"""add calendar events and user calendar preferences
+
+Revision ID: d84a2c6e1f07
+Revises: c5d18e7f3a92
+Create Date: 2026-10-18 03:10:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d84a2c6e1f07"
+down_revision: Union[str, None] = "c5d18e7f3a92"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "calendar_events",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("uuid_generate_v4()"), nullable=False),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("location", sa.Text(), nullable=True),
+        sa.Column("start_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("end_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("is_all_day", sa.Boolean(), server_default=sa.false(), nullable=False),
+        sa.Column("recurrence_rule", sa.Text(), nullable=True),
+        sa.Column("reminders", postgresql.JSONB(), server_default=sa.text("'[]'::jsonb"), nullable=False),
+        sa.Column("is_shared", sa.Boolean(), server_default=sa.false(), nullable=False),
+        sa.Column("color_override", sa.String(), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+        sa.CheckConstraint("end_at >= start_at", name="ck_calendar_events_end_after_start"),
+        sa.ForeignKeyConstraint(["created_by"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_calendar_events_id"), "calendar_events", ["id"], unique=False)
+    op.create_index(op.f("ix_calendar_events_created_by"), "calendar_events", ["created_by"], unique=False)
+    op.create_index("ix_calendar_events_start_at_end_at", "calendar_events", ["start_at", "end_at"], unique=False)
+
+    op.create_table(
+        "user_calendar_preferences",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("uuid_generate_v4()"), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("color_hex", sa.String(), server_default="#0ea5e9", nullable=False),
+        sa.Column("palette_key", sa.String(), server_default="sky", nullable=False),
+        sa.Column(
+            "reminders_default",
+            postgresql.JSONB(),
+            server_default=sa.text("""'[{"type":"notification","minutes_before":15,"method":"in_app"}]'::jsonb"""),
+            nullable=False,
+        ),
+        sa.Column("timezone", sa.String(), server_default="Asia/Seoul", nullable=False),
+        sa.Column("week_starts_on", sa.Integer(), server_default="1", nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id"),
+    )
+    op.create_index(op.f("ix_user_calendar_preferences_id"), "user_calendar_preferences", ["id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_user_calendar_preferences_id"), table_name="user_calendar_preferences")
+    op.drop_table("user_calendar_preferences")
+    op.drop_index("ix_calendar_events_start_at_end_at", table_name="calendar_events")
+    op.drop_index(op.f("ix_calendar_events_created_by"), table_name="calendar_events")
+    op.drop_index(op.f("ix_calendar_events_id"), table_name="calendar_events")
+    op.drop_table("calendar_events")
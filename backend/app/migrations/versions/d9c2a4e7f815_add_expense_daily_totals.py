@@ -0,0 +1,42 @@
+"""add per-day expense totals for forecasts
+
+Revision ID: d9c2a4e7f815
+Revises: b3f9c1d7e605
+Create Date: 2026-10-18 23:40:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d9c2a4e7f815"
+down_revision: Union[str, None] = "b3f9c1d7e605"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Kept current by the application on every expense flush; the forecast
+    # reads it instead of grouping the expenses themselves.
+    op.create_table(
+        "expense_daily_totals",
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("category_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("expense_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("date", "category_id"),
+    )
+    op.execute(
+        "INSERT INTO expense_daily_totals (date, category_id, amount, expense_count) "
+        "SELECT date, category_id, SUM(amount), COUNT(*) FROM expenses GROUP BY date, category_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("expense_daily_totals")
@@ -0,0 +1,49 @@
+"""add materialized calendar occurrences
+
+Revision ID: e19b7d3c5a48
+Revises: d84a2c6e1f07
+Create Date: 2026-10-18 03:30:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e19b7d3c5a48"
+down_revision: Union[str, None] = "d84a2c6e1f07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "calendar_occurrences",
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("start_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("end_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["event_id"], ["calendar_events.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("event_id", "start_at"),
+    )
+    op.create_index(
+        "ix_calendar_occurrences_start_at_end_at", "calendar_occurrences", ["start_at", "end_at"], unique=False
+    )
+    # Left empty: the first occurrences query materializes every event.
+    op.create_table(
+        "calendar_occurrence_horizon",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("starts_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("ends_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("longest_seconds", sa.Integer(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("calendar_occurrence_horizon")
+    op.drop_index("ix_calendar_occurrences_start_at_end_at", table_name="calendar_occurrences")
+    op.drop_table("calendar_occurrences")
@@ -0,0 +1,26 @@
+"""add (created_by, date) index on expenses
+
+Revision ID: e2a87c4d91b3
+Revises: d6f0b2a9e374
+Create Date: 2026-10-18 01:10:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a87c4d91b3"
+down_revision: Union[str, None] = "d6f0b2a9e374"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_expenses_created_by_date", "expenses", ["created_by", "date"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_expenses_created_by_date", table_name="expenses")
@@ -0,0 +1,34 @@
+"""index study tags for LIKE prefix search
+
+Revision ID: e4b7a2c9d136
+Revises: d9c2a4e7f815
+Create Date: 2026-10-18 23:55:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b7a2c9d136"
+down_revision: Union[str, None] = "d9c2a4e7f815"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A tag range is only a prefix match under byte-order collation; prefix
+    # search uses LIKE, which a text_pattern_ops index serves under any.
+    op.create_index(
+        "ix_study_session_tags_tag_pattern",
+        "study_session_tags",
+        ["tag"],
+        unique=False,
+        postgresql_ops={"tag": "text_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_study_session_tags_tag_pattern", table_name="study_session_tags")
@@ -0,0 +1,62 @@
+"""add notes and notes archive
+
+Revision ID: f27c4e9a0b63
+Revises: e19b7d3c5a48
+Create Date: 2026-10-18 03:50:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f27c4e9a0b63"
+down_revision: Union[str, None] = "e19b7d3c5a48"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notes",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("uuid_generate_v4()"), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("is_completed", sa.Boolean(), server_default=sa.false(), nullable=False),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["created_by"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_notes_id"), "notes", ["id"], unique=False)
+    op.create_index(op.f("ix_notes_is_completed"), "notes", ["is_completed"], unique=False)
+    op.create_index(op.f("ix_notes_created_by"), "notes", ["created_by"], unique=False)
+    op.create_index(op.f("ix_notes_created_at"), "notes", ["created_at"], unique=False)
+
+    op.create_table(
+        "notes_archive",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("is_completed", sa.Boolean(), nullable=False),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["created_by"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_notes_archive_created_by"), "notes_archive", ["created_by"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_notes_archive_created_by"), table_name="notes_archive")
+    op.drop_table("notes_archive")
+    op.drop_index(op.f("ix_notes_created_at"), table_name="notes")
+    op.drop_index(op.f("ix_notes_created_by"), table_name="notes")
+    op.drop_index(op.f("ix_notes_is_completed"), table_name="notes")
+    op.drop_index(op.f("ix_notes_id"), table_name="notes")
+    op.drop_table("notes")
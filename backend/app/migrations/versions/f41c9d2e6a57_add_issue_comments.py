@@ -0,0 +1,50 @@
+"""add issue comments table
+
+Revision ID: f41c9d2e6a57
+Revises: e2a87c4d91b3
+Create Date: 2026-10-18 01:30:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f41c9d2e6a57"
+down_revision: Union[str, None] = "e2a87c4d91b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "issue_comments",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("uuid_generate_v4()"), nullable=False),
+        sa.Column("issue_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["issue_id"], ["issues.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_issue_comments_id"), "issue_comments", ["id"], unique=False)
+    op.create_index(op.f("ix_issue_comments_user_id"), "issue_comments", ["user_id"], unique=False)
+    op.create_index(
+        "ix_issue_comments_issue_id_created_at_id",
+        "issue_comments",
+        ["issue_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_issue_comments_issue_id_created_at_id", table_name="issue_comments")
+    op.drop_index(op.f("ix_issue_comments_user_id"), table_name="issue_comments")
+    op.drop_index(op.f("ix_issue_comments_id"), table_name="issue_comments")
+    op.drop_table("issue_comments")
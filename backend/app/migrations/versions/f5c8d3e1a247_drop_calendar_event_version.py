@@ -0,0 +1,30 @@
+"""drop the unused calendar event version counter
+
+Revision ID: f5c8d3e1a247
+Revises: e4b7a2c9d136
+Create Date: 2026-10-19 00:10:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f5c8d3e1a247"
+down_revision: Union[str, None] = "e4b7a2c9d136"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # It keyed the recurrence expansion memo, since replaced by materialized
+    # occurrences; as a mapper version column it only turned concurrent
+    # edits into errors.
+    op.drop_column("calendar_events", "version")
+
+
+def downgrade() -> None:
+    op.add_column("calendar_events", sa.Column("version", sa.Integer(), server_default="1", nullable=False))
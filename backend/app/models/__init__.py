@@ -1,14 +1,26 @@
 from app.models.user import User, UserRole
 from app.models.category import Category, CategoryType
-from app.models.expense import Expense
+from app.models.expense import Expense, ExpenseDailyTotal
 from app.models.budget import Budget
 from app.models.investment import (
     InvestmentAccount,
     Holding,
     InvestmentTransaction,
     TransactionType,
+    CorporateAction,
+    CorporateActionType,
+    FxRate,
 )
-from app.models.issue import Issue, IssueStatus, Label
+from app.models.calendar import (
+    CalendarEvent,
+    CalendarOccurrence,
+    CalendarOccurrenceHorizon,
+    UserCalendarPreference,
+)
+from app.models.fixed_cost import FixedCost, FixedCostPayment, FixedCostPaymentStatus
+from app.models.issue import Issue, IssueComment, IssueStatus, Label
+from app.models.note import Note, NoteArchive
+from app.models.study import StudyFollowup, StudyReference, StudySession, StudySessionTag
 
 __all__ = [
     "User",
@@ -16,12 +28,30 @@ __all__ = [
     "Category",
     "CategoryType",
     "Expense",
+    "ExpenseDailyTotal",
     "Budget",
     "InvestmentAccount",
     "Holding",
     "InvestmentTransaction",
     "TransactionType",
+    "CorporateAction",
+    "CorporateActionType",
+    "FxRate",
+    "CalendarEvent",
+    "CalendarOccurrence",
+    "CalendarOccurrenceHorizon",
+    "UserCalendarPreference",
+    "FixedCost",
+    "FixedCostPayment",
+    "FixedCostPaymentStatus",
     "Issue",
+    "IssueComment",
     "IssueStatus",
     "Label",
+    "Note",
+    "NoteArchive",
+    "StudySession",
+    "StudySessionTag",
+    "StudyReference",
+    "StudyFollowup",
 ]
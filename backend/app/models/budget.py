@@ -1,19 +1,32 @@
 import uuid
 
-from sqlalchemy import Column, Float, ForeignKey, String
+from sqlalchemy import Column, Date, Float, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.core.periods import format_month, month_start
 from app.models.types import GUID
 
 
 class Budget(Base):
     __tablename__ = "budgets"
+    __table_args__ = (
+        UniqueConstraint("category_id", "period", name="uq_budgets_category_id_period"),
+    )
 
     id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
     category_id = Column(GUID(), ForeignKey("categories.id"), nullable=False)
-    month = Column(String, nullable=False, index=True)  # Format: YYYY-MM
+    period = Column(Date, nullable=False, index=True)  # First day of the budget month
     limit_amount = Column(Float, nullable=False)
 
     # Relationships
     category = relationship("Category", backref="budgets")
+
+    @property
+    def month(self) -> str:
+        """Budget month as YYYY-MM, the format used by the API."""
+        return format_month(self.period) if self.period else None
+
+    @month.setter
+    def month(self, value: str) -> None:
+        self.period = month_start(value)
@@ -0,0 +1,104 @@
+import uuid
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+from app.models.types import GUID
+
+DEFAULT_TIMEZONE = "Asia/Seoul"
+DEFAULT_REMINDERS = [{"type": "notification", "minutes_before": 15, "method": "in_app"}]
+# Longest reminder lead time: four weeks.
+MAX_REMINDER_MINUTES = 4 * 7 * 24 * 60
+
+# JSON everywhere, JSONB on PostgreSQL.
+JSONType = JSON().with_variant(postgresql.JSONB(), "postgresql")
+
+
+class CalendarEvent(Base):
+    __tablename__ = "calendar_events"
+    __table_args__ = (
+        CheckConstraint("end_at >= start_at", name="ck_calendar_events_end_after_start"),
+        Index("ix_calendar_events_start_at_end_at", "start_at", "end_at"),
+    )
+
+    id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
+    title = Column(Text, nullable=False)
+    description = Column(Text, nullable=True)
+    location = Column(Text, nullable=True)
+    start_at = Column(DateTime(timezone=True), nullable=False)
+    end_at = Column(DateTime(timezone=True), nullable=False)
+    is_all_day = Column(Boolean, nullable=False, default=False)
+    # RFC 5545 RRULE, e.g. "FREQ=WEEKLY;BYDAY=MO,WE,FR"; expanded in the
+    # owner's time zone (see app.services.recurrence).
+    recurrence_rule = Column(Text, nullable=True)
+    # [{"type": "notification", "minutes_before": 15, "method": "in_app"}, ...]
+    reminders = Column(JSONType, nullable=False, default=list)
+    is_shared = Column(Boolean, nullable=False, default=False)
+    color_override = Column(String, nullable=True)
+    created_by = Column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # Relationships
+    owner = relationship("User")
+    occurrences = relationship("CalendarOccurrence", passive_deletes=True)
+
+
+class CalendarOccurrence(Base):
+    """One materialized occurrence of an event (see app.services.calendar_occurrences).
+
+    One-off events always have their single row; recurring events have rows
+    inside the materialized horizon only.
+    """
+
+    __tablename__ = "calendar_occurrences"
+    __table_args__ = (
+        Index("ix_calendar_occurrences_start_at_end_at", "start_at", "end_at"),
+    )
+
+    event_id = Column(GUID(), ForeignKey("calendar_events.id", ondelete="CASCADE"), primary_key=True)
+    start_at = Column(DateTime(timezone=True), primary_key=True)
+    end_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class CalendarOccurrenceHorizon(Base):
+    """Single row: the range recurring events are materialized for."""
+
+    __tablename__ = "calendar_occurrence_horizon"
+
+    id = Column(Integer, primary_key=True, default=1)
+    starts_at = Column(DateTime(timezone=True), nullable=False)
+    ends_at = Column(DateTime(timezone=True), nullable=False)
+    # Upper bound on any event's duration; gives window queries a lower
+    # bound on start_at so they stay a single index range scan.
+    longest_seconds = Column(Integer, nullable=False, default=0)
+
+
+class UserCalendarPreference(Base):
+    __tablename__ = "user_calendar_preferences"
+
+    id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
+    user_id = Column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True)
+    color_hex = Column(String, nullable=False, default="#0ea5e9")
+    palette_key = Column(String, nullable=False, default="sky")
+    reminders_default = Column(JSONType, nullable=False, default=lambda: list(DEFAULT_REMINDERS))
+    # IANA zone name; recurring events of this user repeat on its wall clock.
+    timezone = Column(String, nullable=False, default=DEFAULT_TIMEZONE)
+    # 0 = Sunday, 1 = Monday
+    week_starts_on = Column(Integer, nullable=False, default=1)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
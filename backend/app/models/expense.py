@@ -1,8 +1,24 @@
 import uuid
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
 
-from sqlalchemy import Column, Date, DateTime, Float, ForeignKey, String
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    delete,
+    event,
+    func,
+    inspect,
+    select,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, relationship
 
 from app.core.database import Base
 from app.models.types import GUID
@@ -10,6 +26,10 @@ from app.models.types import GUID
 
 class Expense(Base):
     __tablename__ = "expenses"
+    __table_args__ = (
+        # Per-user activity is grouped by creator within a date range.
+        Index("ix_expenses_created_by_date", "created_by", "date"),
+    )
 
     id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
     category_id = Column(GUID(), ForeignKey("categories.id"), nullable=False)
@@ -23,3 +43,103 @@ class Expense(Base):
     # Relationships
     category = relationship("Category", backref="expenses")
     creator = relationship("User", backref="expenses")
+
+
+class ExpenseDailyTotal(Base):
+    """Spend per category per day, kept in step with expenses on every flush.
+
+    Bulk statements on expenses bypass the flush; code issuing them must
+    call rebuild_daily_totals for the categories it touched.
+    """
+    __tablename__ = "expense_daily_totals"
+
+    date = Column(Date, primary_key=True)
+    category_id = Column(GUID(), ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True)
+    amount = Column(Float, nullable=False, default=0.0)
+    expense_count = Column(Integer, nullable=False, default=0)
+
+
+_DAILY_DELTAS_KEY = "expense_daily_deltas"
+_UPSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def _committed(expense: Expense, attribute: str):
+    history = inspect(expense).attrs[attribute].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(expense, attribute)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_daily_deltas(session, flush_context, instances):
+    # Attribute history is still intact (and deleted rows loadable) here.
+    deltas: Dict[Tuple, List] = session.info.setdefault(_DAILY_DELTAS_KEY, defaultdict(lambda: [0.0, 0]))
+
+    def add(key, amount, count):
+        deltas[key][0] += amount
+        deltas[key][1] += count
+
+    for expense in session.new:
+        if isinstance(expense, Expense):
+            add((expense.date, expense.category_id), expense.amount or 0.0, 1)
+    for expense in session.deleted:
+        if isinstance(expense, Expense) and inspect(expense).has_identity:
+            key = (_committed(expense, "date"), _committed(expense, "category_id"))
+            add(key, -(_committed(expense, "amount") or 0.0), -1)
+    for expense in session.dirty:
+        if not isinstance(expense, Expense) or not session.is_modified(expense):
+            continue
+        old_key = (_committed(expense, "date"), _committed(expense, "category_id"))
+        new_key = (expense.date, expense.category_id)
+        old_amount, new_amount = _committed(expense, "amount") or 0.0, expense.amount or 0.0
+        if old_key != new_key or old_amount != new_amount:
+            add(old_key, -old_amount, -1)
+            add(new_key, new_amount, 1)
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_daily_deltas(session, flush_context):
+    deltas = session.info.pop(_DAILY_DELTAS_KEY, None)
+    rows = [
+        {"date": spend_date, "category_id": category_id, "amount": amount, "expense_count": count}
+        for (spend_date, category_id), (amount, count) in (deltas or {}).items()
+        if count or amount
+    ]
+    if not rows:
+        return
+    connection = session.connection()
+    table = ExpenseDailyTotal.__table__
+    statement = _UPSERTS[connection.dialect.name](table).values(rows)
+    connection.execute(statement.on_conflict_do_update(
+        index_elements=[table.c.date, table.c.category_id],
+        set_={
+            "amount": table.c.amount + statement.excluded.amount,
+            "expense_count": table.c.expense_count + statement.excluded.expense_count,
+        },
+    ))
+    if any(row["expense_count"] < 0 for row in rows):
+        # Emptied days go, rather than keeping float residue of their sums.
+        connection.execute(delete(table).where(table.c.expense_count <= 0))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_daily_deltas(session, previous_transaction):
+    session.info.pop(_DAILY_DELTAS_KEY, None)
+
+
+def rebuild_daily_totals(db: Session, category_ids: Iterable[uuid.UUID]) -> None:
+    """Recompute the daily totals of ``category_ids`` from their expenses."""
+    category_ids = list(category_ids)
+    db.execute(
+        delete(ExpenseDailyTotal)
+        .where(ExpenseDailyTotal.category_id.in_(category_ids))
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(
+        ExpenseDailyTotal.__table__.insert().from_select(
+            ["date", "category_id", "amount", "expense_count"],
+            select(Expense.date, Expense.category_id, func.sum(Expense.amount), func.count())
+            .where(Expense.category_id.in_(category_ids))
+            .group_by(Expense.date, Expense.category_id),
+        )
+    )
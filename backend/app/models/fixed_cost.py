@@ -0,0 +1,100 @@
+import enum
+import uuid
+
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+from app.models.types import GUID
+
+
+class FixedCostPaymentStatus(str, enum.Enum):
+    SCHEDULED = "scheduled"
+    PAID = "paid"
+    SKIPPED = "skipped"
+
+
+class FixedCost(Base):
+    __tablename__ = "fixed_costs"
+    __table_args__ = (
+        CheckConstraint("amount >= 0", name="ck_fixed_costs_amount"),
+        CheckConstraint("payment_day BETWEEN 1 AND 31", name="ck_fixed_costs_payment_day"),
+        # Soft-deleted rows pile up over time; listing and payment generation
+        # only ever read active rows, so the indexes cover just those.
+        Index(
+            "ix_fixed_costs_active_created_by_start_date",
+            "created_by",
+            "start_date",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+        Index(
+            "ix_fixed_costs_active_start_date",
+            "start_date",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+    )
+
+    id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
+    name = Column(String, nullable=False)
+    category_id = Column(GUID(), ForeignKey("categories.id", ondelete="CASCADE"), nullable=False)
+    amount = Column(Float, nullable=False)
+    payment_day = Column(Integer, nullable=False)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=True)
+    # False once soft-deleted: the cost has payment history and is kept for it.
+    is_active = Column(Boolean, nullable=False, default=True)
+    # Variable costs (utilities, card bills) get payments without a scheduled amount.
+    is_fixed_amount = Column(Boolean, nullable=False, default=True)
+    memo = Column(Text, nullable=True)
+    created_by = Column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # Relationships
+    category = relationship("Category")
+    payments = relationship("FixedCostPayment", back_populates="fixed_cost", passive_deletes=True)
+
+
+class FixedCostPayment(Base):
+    __tablename__ = "fixed_cost_payments"
+    __table_args__ = (
+        UniqueConstraint("fixed_cost_id", "year_month", name="uq_fixed_cost_payments_fixed_cost_id_year_month"),
+        CheckConstraint("scheduled_amount >= 0", name="ck_fixed_cost_payments_scheduled_amount"),
+        CheckConstraint("actual_amount >= 0", name="ck_fixed_cost_payments_actual_amount"),
+        # Monthly summaries group one user's payments by month and status.
+        Index("ix_fixed_cost_payments_created_by_year_month_status", "created_by", "year_month", "status"),
+    )
+
+    id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
+    fixed_cost_id = Column(GUID(), ForeignKey("fixed_costs.id", ondelete="CASCADE"), nullable=False)
+    year_month = Column(String(7), nullable=False, index=True)  # Format: YYYY-MM
+    scheduled_amount = Column(Float, nullable=True)
+    actual_amount = Column(Float, nullable=True)
+    payment_date = Column(Date, nullable=True)
+    status = Column(Enum(FixedCostPaymentStatus), nullable=False, default=FixedCostPaymentStatus.SCHEDULED)
+    memo = Column(Text, nullable=True)
+    expense_id = Column(GUID(), ForeignKey("expenses.id", ondelete="SET NULL"), nullable=True, index=True)
+    created_by = Column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # Relationships
+    fixed_cost = relationship("FixedCost", back_populates="payments")
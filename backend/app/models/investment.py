@@ -1,7 +1,20 @@
 import enum
+import hashlib
 import uuid
 
-from sqlalchemy import Column, Date, DateTime, Enum, Float, ForeignKey, String, Text, func
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    String,
+    Text,
+    UniqueConstraint,
+    event,
+    func,
+)
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -13,6 +26,14 @@ class TransactionType(enum.Enum):
     SELL = "SELL"
 
 
+DEFAULT_CURRENCY = "KRW"
+
+
+class CorporateActionType(enum.Enum):
+    SPLIT = "SPLIT"
+    STOCK_DIVIDEND = "STOCK_DIVIDEND"
+
+
 class InvestmentAccount(Base):
     __tablename__ = "investment_accounts"
 
@@ -34,6 +55,7 @@ class Holding(Base):
     qty = Column(Float, nullable=False)
     avg_price = Column(Float, nullable=False)
     current_price = Column(Float, nullable=False)
+    currency = Column(String(3), nullable=False, default=DEFAULT_CURRENCY, server_default=DEFAULT_CURRENCY)
 
     account = relationship("InvestmentAccount", back_populates="holdings")
 
@@ -50,7 +72,68 @@ class InvestmentTransaction(Base):
     quantity = Column(Float, nullable=False)
     price = Column(Float, nullable=False)
     fees = Column(Float, nullable=False, default=0.0)
+    currency = Column(String(3), nullable=False, default=DEFAULT_CURRENCY, server_default=DEFAULT_CURRENCY)
     memo = Column(Text, nullable=True)
+    content_hash = Column(String(64), nullable=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     account = relationship("InvestmentAccount", back_populates="transactions")
+
+
+class CorporateAction(Base):
+    """A share-count change for a symbol, e.g. a 2-for-1 split has ratio 2.0.
+
+    Trades before ``ex_date`` are adjusted at read time; stored transactions
+    are never rewritten.
+    """
+
+    __tablename__ = "corporate_actions"
+    __table_args__ = (
+        UniqueConstraint("symbol", "ex_date", "type", name="uq_corporate_actions_symbol_ex_date_type"),
+    )
+
+    id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
+    symbol = Column(String, nullable=False, index=True)
+    type = Column(Enum(CorporateActionType, name="corporateactiontype"), nullable=False)
+    ex_date = Column(Date, nullable=False)
+    ratio = Column(Float, nullable=False)
+    memo = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class FxRate(Base):
+    """Daily exchange rate; ``pair`` is base+quote, e.g. USDKRW = KRW per USD."""
+
+    __tablename__ = "fx_rates"
+    __table_args__ = (
+        UniqueConstraint("pair", "date", name="uq_fx_rates_pair_date"),
+    )
+
+    id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
+    date = Column(Date, nullable=False)
+    pair = Column(String(6), nullable=False, index=True)
+    rate = Column(Float, nullable=False)
+
+
+def transaction_content_hash(account_id, symbol, trade_date, quantity, price) -> str:
+    """Fingerprint used to recognise the same trade across imports."""
+    key = "|".join((
+        str(account_id),
+        symbol.strip().upper(),
+        trade_date.isoformat(),
+        repr(float(quantity)),
+        repr(float(price)),
+    ))
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+@event.listens_for(InvestmentTransaction, "before_insert")
+@event.listens_for(InvestmentTransaction, "before_update")
+def _set_content_hash(mapper, connection, target):
+    target.content_hash = transaction_content_hash(
+        target.account_id,
+        target.symbol,
+        target.trade_date,
+        target.quantity,
+        target.price,
+    )
@@ -1,8 +1,10 @@
 import enum
 import uuid
+from datetime import datetime, timezone
 
-from sqlalchemy import Column, Enum, ForeignKey, String, Table, Text
+from sqlalchemy import Column, Computed, DateTime, Enum, ForeignKey, Index, SmallInteger, String, Table, Text
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from app.core.database import Base
 from app.models.types import GUID
@@ -21,12 +23,26 @@ class IssuePriority(str, enum.Enum):
     CRITICAL = "Critical"
 
 
+# Issues are listed most severe first.
+PRIORITY_ORDER = (
+    IssuePriority.CRITICAL,
+    IssuePriority.HIGH,
+    IssuePriority.MEDIUM,
+    IssuePriority.LOW,
+)
+# Position in PRIORITY_ORDER, computed by the database from the stored enum
+# name so that every writer keeps it current.
+PRIORITY_RANK_SQL = "CASE priority {} END".format(
+    " ".join(f"WHEN '{priority.name}' THEN {rank}" for rank, priority in enumerate(PRIORITY_ORDER))
+)
+
+
 # Association table for many-to-many relationship between issues and labels
 issue_labels = Table(
     'issue_labels',
     Base.metadata,
     Column('issue_id', GUID(), ForeignKey('issues.id'), primary_key=True),
-    Column('label_id', GUID(), ForeignKey('labels.id'), primary_key=True)
+    Column('label_id', GUID(), ForeignKey('labels.id'), primary_key=True, index=True)
 )
 
 
@@ -40,14 +56,43 @@ class Label(Base):
 
 class Issue(Base):
     __tablename__ = "issues"
+    __table_args__ = (
+        # Keyset pagination walks issues by (priority_rank, id).
+        Index("ix_issues_priority_rank_id", "priority_rank", "id"),
+    )
 
     id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
     title = Column(String, nullable=False)
-    status = Column(Enum(IssueStatus), nullable=False, default=IssueStatus.OPEN)
+    status = Column(Enum(IssueStatus), nullable=False, default=IssueStatus.OPEN, index=True)
     priority = Column(Enum(IssuePriority), nullable=False, default=IssuePriority.MEDIUM)
-    assignee_id = Column(GUID(), ForeignKey("users.id"), nullable=False)
+    priority_rank = Column(SmallInteger, Computed(PRIORITY_RANK_SQL, persisted=True), nullable=False)
+    assignee_id = Column(GUID(), ForeignKey("users.id"), nullable=False, index=True)
     body = Column(Text, nullable=False)
 
     # Relationships
     assignee = relationship("User", backref="assigned_issues")
     labels = relationship("Label", secondary=issue_labels, backref="issues")
+    comments = relationship("IssueComment", back_populates="issue", cascade="all, delete-orphan", passive_deletes=True)
+
+
+def _utcnow():
+    return datetime.now(timezone.utc)
+
+
+class IssueComment(Base):
+    __tablename__ = "issue_comments"
+    __table_args__ = (
+        # Threads are read per issue in (created_at, id) order.
+        Index("ix_issue_comments_issue_id_created_at_id", "issue_id", "created_at", "id"),
+    )
+
+    id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
+    issue_id = Column(GUID(), ForeignKey("issues.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    content = Column(Text, nullable=False)
+    # Set in Python as well so every backend stores microseconds; the
+    # keyset cursor compares on this column.
+    created_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    issue = relationship("Issue", back_populates="comments")
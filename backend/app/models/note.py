@@ -0,0 +1,32 @@
+import uuid
+
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Text
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+from app.models.types import GUID
+
+
+class Note(Base):
+    __tablename__ = "notes"
+
+    id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
+    content = Column(Text, nullable=False)
+    is_completed = Column(Boolean, nullable=False, default=False, index=True)
+    created_by = Column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class NoteArchive(Base):
+    """Completed notes moved out of ``notes`` by the retention job."""
+
+    __tablename__ = "notes_archive"
+
+    id = Column(GUID(), primary_key=True)
+    content = Column(Text, nullable=False)
+    is_completed = Column(Boolean, nullable=False)
+    created_by = Column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
+    created_at = Column(DateTime(timezone=True))
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,97 @@
+import uuid
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Text,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+from app.models.types import GUID
+
+# TEXT[] on PostgreSQL, a JSON list elsewhere.
+TextArray = JSON().with_variant(postgresql.ARRAY(Text), "postgresql")
+
+
+class StudySession(Base):
+    __tablename__ = "study_sessions"
+    __table_args__ = (
+        # any-of (&&) and all-of (@>) tag filters on PostgreSQL.
+        Index("ix_study_sessions_tags", "tags", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
+
+    id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
+    topic = Column(Text, nullable=False)
+    date = Column(Date, nullable=False, server_default=func.current_date(), index=True)
+    source = Column(Text, nullable=True)
+    participants = Column(Text, nullable=True)
+    tags = Column(TextArray, nullable=False, default=list)
+    highlights = Column(TextArray, nullable=False, default=list)
+    notes = Column(Text, nullable=True)
+    created_by = Column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # Relationships
+    references = relationship(
+        "StudyReference", back_populates="study_session", cascade="all, delete-orphan", passive_deletes=True
+    )
+    followups = relationship(
+        "StudyFollowup", back_populates="study_session", cascade="all, delete-orphan", passive_deletes=True
+    )
+    tag_rows = relationship("StudySessionTag", cascade="all, delete-orphan", passive_deletes=True)
+
+
+class StudySessionTag(Base):
+    """One row per (session, tag): the tag index for prefix lookups and facets.
+
+    Mirrors StudySession.tags; kept in sync by app.services.study_tags.
+    """
+
+    __tablename__ = "study_session_tags"
+    __table_args__ = (
+        Index("ix_study_session_tags_tag_session", "tag", "study_session_id"),
+        # Serves LIKE 'prefix%' whatever the database collation.
+        Index(
+            "ix_study_session_tags_tag_pattern", "tag", postgresql_ops={"tag": "text_pattern_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    study_session_id = Column(GUID(), ForeignKey("study_sessions.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(Text, primary_key=True)
+
+
+class StudyReference(Base):
+    __tablename__ = "study_references"
+
+    id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
+    study_session_id = Column(GUID(), ForeignKey("study_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
+    title = Column(Text, nullable=False)
+    url = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    study_session = relationship("StudySession", back_populates="references")
+
+
+class StudyFollowup(Base):
+    __tablename__ = "study_followups"
+
+    id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
+    study_session_id = Column(GUID(), ForeignKey("study_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
+    task = Column(Text, nullable=False)
+    owner = Column(Text, nullable=True)
+    due = Column(Date, nullable=True)
+    completed = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    study_session = relationship("StudySession", back_populates="followups")
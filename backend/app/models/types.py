@@ -1,5 +1,6 @@
 import uuid
 
+from sqlalchemy import func, literal_column
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.types import CHAR, TypeDecorator
 
@@ -30,3 +31,20 @@ class GUID(TypeDecorator):
         if value is None:
             return value
         return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+def sql_uuid4(dialect_name: str):
+    """SQL expression producing a fresh UUID per row, for INSERT ... SELECT.
+
+    Column defaults on GUID columns are generated in Python and so are not
+    applied to rows created inside a single set-based statement.
+    """
+    if dialect_name == "postgresql":
+        return func.uuid_generate_v4()
+    # SQLite: assemble a version 4 UUID from random bytes.
+    return literal_column(
+        "lower(hex(randomblob(4))) || '-' || lower(hex(randomblob(2))) || '-4' || "
+        "substr(lower(hex(randomblob(2))), 2) || '-' || "
+        "substr('89ab', 1 + (abs(random()) % 4), 1) || substr(lower(hex(randomblob(2))), 2) || '-' || "
+        "lower(hex(randomblob(6)))"
+    )
@@ -1,12 +1,14 @@
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.core.periods import MONTH_PATTERN
 
 
 class BudgetBase(BaseModel):
     category_id: UUID
-    month: str  # Format: YYYY-MM
+    month: str = Field(..., pattern=MONTH_PATTERN)  # Format: YYYY-MM
     limit_amount: float
 
 
@@ -16,7 +18,7 @@ class BudgetCreate(BudgetBase):
 
 class BudgetUpdate(BaseModel):
     category_id: Optional[UUID] = None
-    month: Optional[str] = None
+    month: Optional[str] = Field(None, pattern=MONTH_PATTERN)
     limit_amount: Optional[float] = None
 
 
@@ -25,3 +27,22 @@ class Budget(BudgetBase):
 
     class Config:
         from_attributes = True
+
+
+class BudgetForecast(BaseModel):
+    budget_id: UUID
+    category_id: UUID
+    month: str
+    limit_amount: float
+    spent_to_date: float
+    daily_run_rate: float
+    projected: float
+    lower: float
+    upper: float
+    projected_over: bool
+
+
+class BudgetCopyResult(BaseModel):
+    from_month: str
+    to_month: str
+    copied: int
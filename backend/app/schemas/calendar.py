@@ -0,0 +1,102 @@
+import datetime
+from typing import List, Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.models.calendar import MAX_REMINDER_MINUTES
+
+
+class CalendarReminder(BaseModel):
+    type: Literal["notification"] = "notification"
+    minutes_before: int = Field(..., ge=0, le=MAX_REMINDER_MINUTES)
+    method: Literal["in_app", "email", "push"] = "in_app"
+
+
+class CalendarEventBase(BaseModel):
+    title: str
+    description: Optional[str] = None
+    location: Optional[str] = None
+    start_at: datetime.datetime
+    end_at: datetime.datetime
+    is_all_day: bool = False
+    recurrence_rule: Optional[str] = None
+    reminders: List[CalendarReminder] = []
+    is_shared: bool = False
+    color_override: Optional[str] = None
+
+
+class CalendarEventCreate(CalendarEventBase):
+    created_by: UUID
+
+
+class CalendarEventUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    location: Optional[str] = None
+    start_at: Optional[datetime.datetime] = None
+    end_at: Optional[datetime.datetime] = None
+    is_all_day: Optional[bool] = None
+    recurrence_rule: Optional[str] = None
+    reminders: Optional[List[CalendarReminder]] = None
+    is_shared: Optional[bool] = None
+    color_override: Optional[str] = None
+
+
+def _as_utc(value: datetime.datetime) -> datetime.datetime:
+    # SQLite hands stored timestamps back without their (UTC) offset.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+class CalendarEvent(CalendarEventBase):
+    id: UUID
+    created_by: UUID
+
+    _utc = field_validator("start_at", "end_at")(_as_utc)
+
+    class Config:
+        from_attributes = True
+
+
+class CalendarOccurrence(BaseModel):
+    event_id: UUID
+    title: str
+    location: Optional[str] = None
+    start_at: datetime.datetime
+    end_at: datetime.datetime
+    is_all_day: bool
+    is_recurring: bool
+    is_shared: bool
+    color_override: Optional[str] = None
+    created_by: UUID
+
+
+class UserCalendarPreferenceUpdate(BaseModel):
+    color_hex: Optional[str] = None
+    palette_key: Optional[str] = None
+    reminders_default: Optional[List[CalendarReminder]] = None
+    timezone: Optional[str] = None
+    week_starts_on: Optional[int] = Field(None, ge=0, le=6)
+
+
+class UserCalendarPreference(BaseModel):
+    user_id: UUID
+    color_hex: str
+    palette_key: str
+    reminders_default: List[CalendarReminder]
+    timezone: str
+    week_starts_on: int
+
+    class Config:
+        from_attributes = True
+
+
+class CalendarReminderDue(BaseModel):
+    event_id: UUID
+    title: str
+    occurrence_start: datetime.datetime
+    fire_at: datetime.datetime
+    minutes_before: int
+    method: str
@@ -23,3 +23,12 @@ class Category(CategoryBase):
 
     class Config:
         from_attributes = True
+
+
+class CategoryMergeResult(BaseModel):
+    source_id: UUID
+    target_id: UUID
+    expenses_moved: int
+    fixed_costs_moved: int
+    budgets_moved: int
+    budgets_combined: int
@@ -0,0 +1,68 @@
+import datetime
+from typing import Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.core.periods import MONTH_PATTERN
+from app.models.fixed_cost import FixedCostPaymentStatus
+
+
+class FixedCostBase(BaseModel):
+    name: str
+    category_id: UUID
+    amount: float = Field(..., ge=0)
+    payment_day: int = Field(..., ge=1, le=31)
+    start_date: datetime.date
+    end_date: Optional[datetime.date] = None
+    is_active: bool = True
+    is_fixed_amount: bool = True
+    memo: Optional[str] = None
+
+
+class FixedCostCreate(FixedCostBase):
+    created_by: UUID
+
+
+class FixedCost(FixedCostBase):
+    id: UUID
+    created_by: UUID
+
+    class Config:
+        from_attributes = True
+
+
+class FixedCostDeleteResult(BaseModel):
+    id: UUID
+    mode: Literal["soft", "hard"]
+
+
+class FixedCostPayment(BaseModel):
+    id: UUID
+    fixed_cost_id: UUID
+    year_month: str = Field(..., pattern=MONTH_PATTERN)
+    scheduled_amount: Optional[float] = None
+    actual_amount: Optional[float] = None
+    payment_date: Optional[datetime.date] = None
+    status: FixedCostPaymentStatus
+    memo: Optional[str] = None
+    expense_id: Optional[UUID] = None
+    created_by: UUID
+
+    class Config:
+        from_attributes = True
+
+
+class FixedCostGenerateResult(BaseModel):
+    month: str
+    generated: int
+
+
+class FixedCostMonthSummary(BaseModel):
+    year_month: str
+    total_scheduled: float
+    total_paid: float
+    total_remaining: float
+    paid_count: int
+    total_count: int
+    paid_ratio: float
@@ -1,10 +1,16 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
-from app.models.investment import TransactionType
+from app.models.investment import DEFAULT_CURRENCY, CorporateActionType, TransactionType
+
+
+def _normalize_currency(value):
+    if isinstance(value, str):
+        return value.strip().upper()
+    return value
 
 
 # Holding Schemas
@@ -15,6 +21,9 @@ class HoldingBase(BaseModel):
     qty: float
     avg_price: float
     current_price: float
+    currency: str = Field(DEFAULT_CURRENCY, min_length=3, max_length=3)
+
+    _currency_upper = field_validator("currency", mode="before")(_normalize_currency)
 
 
 class HoldingCreate(HoldingBase):
@@ -28,6 +37,9 @@ class HoldingUpdate(BaseModel):
     qty: Optional[float] = None
     avg_price: Optional[float] = None
     current_price: Optional[float] = None
+    currency: Optional[str] = Field(None, min_length=3, max_length=3)
+
+    _currency_upper = field_validator("currency", mode="before")(_normalize_currency)
 
 
 class Holding(HoldingBase):
@@ -69,8 +81,11 @@ class InvestmentTransactionBase(BaseModel):
     quantity: float = Field(..., gt=0)
     price: float = Field(..., gt=0)
     fees: float = Field(0, ge=0)
+    currency: str = Field(DEFAULT_CURRENCY, min_length=3, max_length=3)
     memo: Optional[str] = None
 
+    _currency_upper = field_validator("currency", mode="before")(_normalize_currency)
+
 
 class InvestmentTransactionCreate(InvestmentTransactionBase):
     pass
@@ -85,8 +100,11 @@ class InvestmentTransactionUpdate(BaseModel):
     quantity: Optional[float] = Field(None, gt=0)
     price: Optional[float] = Field(None, gt=0)
     fees: Optional[float] = Field(None, ge=0)
+    currency: Optional[str] = Field(None, min_length=3, max_length=3)
     memo: Optional[str] = None
 
+    _currency_upper = field_validator("currency", mode="before")(_normalize_currency)
+
 
 class InvestmentTransaction(InvestmentTransactionBase):
     id: UUID
@@ -95,3 +113,121 @@ class InvestmentTransaction(InvestmentTransactionBase):
 
     class Config:
         from_attributes = True
+
+
+# Valuation Schemas
+class PositionValuation(BaseModel):
+    symbol: str
+    name: Optional[str] = None
+    qty: float
+    market_value: float
+    cost_basis: float
+    gain: float
+    weight: float
+
+
+class PortfolioValuation(BaseModel):
+    account_id: Optional[UUID] = None
+    currency: str
+    market_value: float
+    cost_basis: float
+    gain: float
+    gain_pct: float
+    positions: List[PositionValuation]
+
+
+# FX Rate Schemas
+class FxRateBase(BaseModel):
+    date: date
+    pair: str = Field(..., min_length=6, max_length=6, description="Base and quote currency, e.g. USDKRW")
+    rate: float = Field(..., gt=0)
+
+    _pair_upper = field_validator("pair", mode="before")(_normalize_currency)
+
+
+class FxRateCreate(FxRateBase):
+    pass
+
+
+class FxRate(FxRateBase):
+    id: UUID
+
+    class Config:
+        from_attributes = True
+
+
+class FxRateIngestResult(BaseModel):
+    ingested: int
+
+
+# Transaction Import Schemas
+class TransactionImportError(BaseModel):
+    line: int
+    message: str
+
+
+class TransactionImportResult(BaseModel):
+    dry_run: bool
+    total_rows: int
+    inserted: int
+    duplicates: int
+    errors: int
+    duplicate_lines: List[int]
+    error_details: List[TransactionImportError]
+
+    class Config:
+        from_attributes = True
+
+
+# Return Schemas
+class ReturnSeries(BaseModel):
+    account_id: UUID
+    symbol: Optional[str] = None
+    xirr: Optional[float] = None
+    twr: Optional[float] = None
+    net_invested: float
+    market_value: float
+
+
+class InvestmentReturns(BaseModel):
+    as_of: date
+    currency: str
+    accounts: List[ReturnSeries]
+    symbols: List[ReturnSeries]
+
+
+# Corporate Action Schemas
+class CorporateActionBase(BaseModel):
+    symbol: str
+    type: CorporateActionType = CorporateActionType.SPLIT
+    ex_date: date
+    ratio: float = Field(..., gt=0, description="Shares held after the action per share held before")
+    memo: Optional[str] = None
+
+    # Positions and imported trades key symbols upper-cased.
+    _symbol_upper = field_validator("symbol", mode="before")(_normalize_currency)
+
+
+class CorporateActionCreate(CorporateActionBase):
+    pass
+
+
+class CorporateAction(CorporateActionBase):
+    id: UUID
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+# Position Schemas
+class Position(BaseModel):
+    account_id: UUID
+    symbol: str
+    currency: str
+    qty: float
+    avg_cost: float
+    cost_basis: float
+    realized_pnl: float
+    market_price: Optional[float] = None
+    unrealized_pnl: Optional[float] = None
@@ -1,9 +1,12 @@
+import datetime
 from enum import Enum
 from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel
 
+from app.schemas.user import User
+
 
 class IssueStatus(str, Enum):
     OPEN = "Open"
@@ -67,3 +70,40 @@ class Label(LabelCreate):
 
     class Config:
         from_attributes = True
+
+
+class IssuePage(BaseModel):
+    items: List[Issue]
+    next_cursor: Optional[str] = None
+
+
+class IssueCommentCreate(BaseModel):
+    user_id: UUID
+    content: str
+
+
+class IssueCommentUpdate(BaseModel):
+    content: str
+
+
+class IssueComment(BaseModel):
+    id: UUID
+    issue_id: UUID
+    user_id: UUID
+    content: str
+    created_at: datetime.datetime
+    updated_at: Optional[datetime.datetime] = None
+    user: Optional[User] = None
+
+    class Config:
+        from_attributes = True
+
+
+class IssueCommentPage(BaseModel):
+    items: List[IssueComment]
+    next_cursor: Optional[str] = None
+
+
+class IssueCommentCount(BaseModel):
+    issue_id: UUID
+    count: int
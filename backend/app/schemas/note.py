@@ -0,0 +1,44 @@
+import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.core.jobs import JobStatus
+
+
+class NoteBase(BaseModel):
+    content: str
+    is_completed: bool = False
+
+
+class NoteCreate(NoteBase):
+    created_by: UUID
+
+
+class NoteUpdate(BaseModel):
+    content: Optional[str] = None
+    is_completed: Optional[bool] = None
+
+
+class Note(NoteBase):
+    id: UUID
+    created_by: Optional[UUID] = None
+    created_at: Optional[datetime.datetime] = None
+    completed_at: Optional[datetime.datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class NotePurgeJob(BaseModel):
+    id: UUID
+    status: JobStatus
+    processed: int
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    created_at: datetime.datetime
+    finished_at: Optional[datetime.datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,102 @@
+import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class StudyReferenceBase(BaseModel):
+    title: str
+    url: Optional[str] = None
+
+
+class StudyReferenceCreate(StudyReferenceBase):
+    pass
+
+
+class StudyReferenceUpdate(BaseModel):
+    title: Optional[str] = None
+    url: Optional[str] = None
+
+
+class StudyReference(StudyReferenceBase):
+    id: UUID
+    study_session_id: UUID
+    created_at: Optional[datetime.datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class StudyFollowupBase(BaseModel):
+    task: str
+    owner: Optional[str] = None
+    due: Optional[datetime.date] = None
+    completed: bool = False
+
+
+class StudyFollowupCreate(StudyFollowupBase):
+    pass
+
+
+class StudyFollowupUpdate(BaseModel):
+    task: Optional[str] = None
+    owner: Optional[str] = None
+    due: Optional[datetime.date] = None
+    completed: Optional[bool] = None
+
+
+class StudyFollowup(StudyFollowupBase):
+    id: UUID
+    study_session_id: UUID
+    created_at: Optional[datetime.datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class StudySessionBase(BaseModel):
+    topic: str
+    date: Optional[datetime.date] = None
+    source: Optional[str] = None
+    participants: Optional[str] = None
+    tags: List[str] = []
+    highlights: List[str] = []
+    notes: Optional[str] = None
+
+
+class StudySessionCreate(StudySessionBase):
+    created_by: UUID
+
+
+class StudySessionUpdate(BaseModel):
+    topic: Optional[str] = None
+    date: Optional[datetime.date] = None
+    source: Optional[str] = None
+    participants: Optional[str] = None
+    tags: Optional[List[str]] = None
+    highlights: Optional[List[str]] = None
+    notes: Optional[str] = None
+
+
+class StudySession(StudySessionBase):
+    id: UUID
+    created_by: Optional[UUID] = None
+    created_at: Optional[datetime.datetime] = None
+    updated_at: Optional[datetime.datetime] = None
+    references: List[StudyReference] = []
+    followups: List[StudyFollowup] = []
+
+    class Config:
+        from_attributes = True
+
+
+class TagCount(BaseModel):
+    tag: str
+    count: int
+
+
+class StudySessionSearchResult(BaseModel):
+    items: List[StudySession]
+    total: int
+    facets: List[TagCount]
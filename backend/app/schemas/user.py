@@ -1,9 +1,12 @@
-from typing import Optional
+import datetime
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 from pydantic import BaseModel
 from enum import Enum
 
+from app.core.jobs import JobStatus
+
 
 class UserRole(str, Enum):
     ADMIN = "Admin"
@@ -35,3 +38,26 @@ class User(UserBase):
 
     class Config:
         from_attributes = True
+
+
+class UserActivity(BaseModel):
+    user_id: UUID
+    name: str
+    expense_count: int
+    expense_total: float
+    open_issues: Dict[str, int]
+    last_activity: Optional[datetime.date] = None
+
+
+class UserDeletionJob(BaseModel):
+    id: UUID
+    status: JobStatus
+    total: int
+    processed: int
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    created_at: datetime.datetime
+    finished_at: Optional[datetime.datetime] = None
+
+    class Config:
+        from_attributes = True
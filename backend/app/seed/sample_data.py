@@ -6,6 +6,7 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.core.database import Base, SessionLocal, engine
+from app.core.periods import month_start
 from app.models.budget import Budget
 from app.models.category import Category, CategoryType
 from app.models.expense import Expense
@@ -48,7 +49,7 @@ def upsert_budget(
 ) -> Budget:
     budget = (
         session.query(Budget)
-        .filter(Budget.category_id == category_id, Budget.month == month)
+        .filter(Budget.category_id == category_id, Budget.period == month_start(month))
         .first()
     )
     if budget:
@@ -0,0 +1,261 @@
+"""Calendar occurrences inside a time window, served from a materialized table.
+
+Every event's occurrences are stored in calendar_occurrences: one-off
+events as their single row, recurring events for a rolling horizon of
+HORIZON_MONTHS either side of the day the horizon was first needed. A
+window query is then one range scan over the (start_at, end_at) index
+joined to the events; no rule is expanded on the read path.
+
+The table is kept current incrementally:
+
+- writing an event re-materializes just that event (materialize_event);
+- changing a user's time zone re-materializes that user's recurring events;
+- a window past either end of the horizon extends it by at least
+  EXTEND_MONTHS, expanding the recurring events for the new slice only.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.periods import add_months
+from app.models.calendar import (
+    DEFAULT_TIMEZONE,
+    CalendarEvent,
+    CalendarOccurrence,
+    CalendarOccurrenceHorizon,
+    UserCalendarPreference,
+)
+from app.services.recurrence import expand, parse_rrule
+
+HORIZON_MONTHS = 18
+EXTEND_MONTHS = 6
+# Rules repeat at most daily, so a slice of this many months expands to at
+# most ~370 occurrences per event, well under MATERIALIZE_LIMIT: a horizon
+# of any length is expanded slice by slice and never truncated.
+SLICE_MONTHS = 12
+MATERIALIZE_LIMIT = 5000
+
+# Event fields whose change invalidates its materialized occurrences.
+SCHEDULE_FIELDS = ("start_at", "end_at", "recurrence_rule")
+
+
+@dataclass
+class Occurrence:
+    event: CalendarEvent
+    start_at: datetime
+    end_at: datetime
+
+
+def get_zone(name: Optional[str]) -> tzinfo:
+    """ZoneInfo for ``name``, falling back to the default zone."""
+    try:
+        return ZoneInfo(name or DEFAULT_TIMEZONE)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo(DEFAULT_TIMEZONE)
+
+
+def as_utc(value: datetime) -> datetime:
+    """Aware UTC datetime; naive values (SQLite drops the offset) are UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def user_zones(db: Session, user_ids: Iterable[UUID]) -> Dict[UUID, tzinfo]:
+    """Preferred time zone of each user; users without preferences get the default."""
+    user_ids = set(user_ids)
+    names = dict(
+        db.execute(
+            select(UserCalendarPreference.user_id, UserCalendarPreference.timezone).where(
+                UserCalendarPreference.user_id.in_(user_ids)
+            )
+        ).all()
+    ) if user_ids else {}
+    return {user_id: get_zone(names.get(user_id)) for user_id in user_ids}
+
+
+def _month_floor(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def _shift_months(value: datetime, months: int) -> datetime:
+    shifted = add_months(value.date(), months)
+    return datetime(shifted.year, shifted.month, 1, tzinfo=timezone.utc)
+
+
+def _occurrence_rows(
+    event: CalendarEvent,
+    zone: tzinfo,
+    window_start: datetime,
+    window_end: datetime,
+) -> List[dict]:
+    """Rows for ``event``: its single occurrence, or its expansion over the window."""
+    start_at, end_at = as_utc(event.start_at), as_utc(event.end_at)
+    if not event.recurrence_rule:
+        return [{"event_id": event.id, "start_at": start_at, "end_at": end_at}]
+    duration = end_at - start_at
+    rule = parse_rrule(event.recurrence_rule)
+    rows = []
+    slice_start = window_start
+    while slice_start < window_end:
+        slice_end = min(_shift_months(slice_start, SLICE_MONTHS), window_end)
+        for occurrence in expand(
+            rule, start_at, duration, slice_start, slice_end, zone, limit=MATERIALIZE_LIMIT
+        ):
+            # Later slices start where the previous one ended; occurrences
+            # overlapping from before were already produced by it.
+            if slice_start > window_start and occurrence < slice_start:
+                continue
+            rows.append({
+                "event_id": event.id,
+                "start_at": occurrence.astimezone(timezone.utc),
+                "end_at": (occurrence + duration).astimezone(timezone.utc),
+            })
+        slice_start = slice_end
+    return rows
+
+
+def _materialize(db: Session, events: Iterable[CalendarEvent], window_start: datetime, window_end: datetime) -> None:
+    events = list(events)
+    zones = user_zones(db, {event.created_by for event in events})
+    rows = [
+        row
+        for event in events
+        for row in _occurrence_rows(event, zones[event.created_by], window_start, window_end)
+    ]
+    if not rows:
+        return
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    # Concurrent extensions of the horizon may expand the same slice.
+    db.execute(
+        dialect.insert(CalendarOccurrence).on_conflict_do_nothing(index_elements=["event_id", "start_at"]),
+        rows,
+    )
+
+
+def _duration_seconds(event: CalendarEvent) -> int:
+    return int((as_utc(event.end_at) - as_utc(event.start_at)).total_seconds())
+
+
+def _horizon(db: Session, for_update: bool = False) -> Optional[CalendarOccurrenceHorizon]:
+    query = select(CalendarOccurrenceHorizon).where(CalendarOccurrenceHorizon.id == 1)
+    if for_update:
+        query = query.with_for_update()
+    return db.scalars(query).first()
+
+
+def clear_event(db: Session, event_id: UUID) -> None:
+    """Drop an event's materialized occurrences (SQLite does not cascade)."""
+    db.execute(delete(CalendarOccurrence).where(CalendarOccurrence.event_id == event_id))
+
+
+def materialize_event(db: Session, event: CalendarEvent) -> None:
+    """Rebuild one event's occurrences; the caller commits.
+
+    Before any horizon exists recurring events are left for ensure_horizon
+    to expand.
+    """
+    db.flush()
+    clear_event(db, event.id)
+    horizon = _horizon(db, for_update=True)
+    if horizon is None:
+        if not event.recurrence_rule:
+            _materialize(db, [event], as_utc(event.start_at), as_utc(event.end_at))
+        return
+    _materialize(db, [event], as_utc(horizon.starts_at), as_utc(horizon.ends_at))
+    horizon.longest_seconds = max(horizon.longest_seconds, _duration_seconds(event))
+
+
+def materialize_user_events(db: Session, user_id: UUID) -> None:
+    """Rebuild a user's recurring events, e.g. after their time zone changed."""
+    events = db.scalars(
+        select(CalendarEvent).where(CalendarEvent.created_by == user_id, CalendarEvent.recurrence_rule.isnot(None))
+    ).all()
+    for event in events:
+        materialize_event(db, event)
+
+
+def ensure_horizon(db: Session, window_start: datetime, window_end: datetime) -> CalendarOccurrenceHorizon:
+    """Make sure recurring events are materialized over the window.
+
+    The first call materializes every event over HORIZON_MONTHS either side
+    of today (widened to the window); later calls only expand the slices
+    the window adds beyond the horizon. Commits when it extended anything.
+    """
+    horizon = _horizon(db)
+    if horizon is not None and as_utc(horizon.starts_at) <= window_start and as_utc(horizon.ends_at) >= window_end:
+        return horizon
+
+    horizon = _horizon(db, for_update=True)
+    if horizon is None:
+        today = _month_floor(datetime.now(timezone.utc))
+        starts_at = min(_shift_months(today, -HORIZON_MONTHS), _month_floor(window_start))
+        ends_at = max(_shift_months(today, HORIZON_MONTHS + 1), _shift_months(window_end, 1))
+        events = db.scalars(select(CalendarEvent)).all()
+        _materialize(db, events, starts_at, ends_at)
+        horizon = CalendarOccurrenceHorizon(
+            id=1,
+            starts_at=starts_at,
+            ends_at=ends_at,
+            longest_seconds=max((_duration_seconds(event) for event in events), default=0),
+        )
+        db.add(horizon)
+    else:
+        starts_at, ends_at = as_utc(horizon.starts_at), as_utc(horizon.ends_at)
+        recurring = db.scalars(select(CalendarEvent).where(CalendarEvent.recurrence_rule.isnot(None))).all()
+        if window_start < starts_at:
+            new_start = min(_month_floor(window_start), _shift_months(starts_at, -EXTEND_MONTHS))
+            _materialize(db, recurring, new_start, starts_at)
+            horizon.starts_at = new_start
+        if window_end > ends_at:
+            new_end = max(_shift_months(window_end, 1), _shift_months(ends_at, EXTEND_MONTHS))
+            _materialize(db, recurring, ends_at, new_end)
+            horizon.ends_at = new_end
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another request created the horizon first; use theirs.
+        db.rollback()
+        return ensure_horizon(db, window_start, window_end)
+    return horizon
+
+
+def list_occurrences(
+    db: Session,
+    window_start: datetime,
+    window_end: datetime,
+    user_id: Optional[UUID] = None,
+) -> List[Occurrence]:
+    """Occurrences of the visible events overlapping ``[window_start, window_end)``.
+
+    With ``user_id`` only that user's own and shared events are visible.
+    """
+    window_start, window_end = as_utc(window_start), as_utc(window_end)
+    horizon = ensure_horizon(db, window_start, window_end)
+
+    # Nothing longer than the longest event can start earlier and still
+    # overlap, so start_at is bounded on both sides.
+    earliest = window_start - timedelta(seconds=horizon.longest_seconds)
+    query = (
+        select(CalendarOccurrence.start_at, CalendarOccurrence.end_at, CalendarEvent)
+        .join(CalendarEvent, CalendarEvent.id == CalendarOccurrence.event_id)
+        .where(
+            CalendarOccurrence.start_at >= earliest,
+            CalendarOccurrence.start_at < window_end,
+            or_(CalendarOccurrence.end_at > window_start, CalendarOccurrence.start_at >= window_start),
+        )
+        .order_by(CalendarOccurrence.start_at, CalendarOccurrence.event_id)
+    )
+    if user_id is not None:
+        query = query.where(or_(CalendarEvent.created_by == user_id, CalendarEvent.is_shared))
+    return [
+        Occurrence(event, as_utc(start_at), as_utc(end_at))
+        for start_at, end_at, event in db.execute(query).all()
+    ]
@@ -0,0 +1,137 @@
+from bisect import bisect_right
+from datetime import date
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import VersionedCache, table_versions
+from app.models.investment import CorporateAction, InvestmentTransaction, TransactionType
+from app.services.fx import get_rate_table
+
+CORPORATE_ACTION_TABLES = ("corporate_actions",)
+
+_factors_cache = VersionedCache(maxsize=1)
+
+
+class AdjustmentFactors:
+    """Cumulative share adjustment factors per symbol.
+
+    For each symbol the ex-dates are kept sorted together with the product of
+    all ratios from that action onwards, so the factor for a trade is a binary
+    search on its trade date: every action with an ex-date after the trade
+    applies to it.
+    """
+
+    def __init__(self, actions: Sequence[Tuple[str, date, float]]):
+        by_symbol: Dict[str, List[Tuple[date, float]]] = {}
+        for symbol, ex_date, ratio in actions:
+            by_symbol.setdefault(symbol, []).append((ex_date, ratio))
+
+        self._ex_dates: Dict[str, List[date]] = {}
+        self._cumulative: Dict[str, List[float]] = {}
+        for symbol, entries in by_symbol.items():
+            entries.sort()
+            cumulative = [1.0] * (len(entries) + 1)
+            for index in range(len(entries) - 1, -1, -1):
+                cumulative[index] = cumulative[index + 1] * entries[index][1]
+            self._ex_dates[symbol] = [ex_date for ex_date, _ in entries]
+            self._cumulative[symbol] = cumulative
+
+    def factor(self, symbol: str, trade_date: date) -> float:
+        ex_dates = self._ex_dates.get(symbol)
+        if not ex_dates:
+            return 1.0
+        return self._cumulative[symbol][bisect_right(ex_dates, trade_date)]
+
+    def adjust(
+        self,
+        symbols: Sequence[str],
+        trade_dates: Sequence[date],
+        quantities: Sequence[float],
+        prices: Sequence[float],
+    ) -> Tuple[List[float], List[float]]:
+        """Split-adjust whole columns of quantities and prices in one pass."""
+        if not self._ex_dates:
+            return list(quantities), list(prices)
+        factors = [
+            self.factor(symbol, trade_date)
+            for symbol, trade_date in zip(symbols, trade_dates)
+        ]
+        return (
+            [quantity * factor for quantity, factor in zip(quantities, factors)],
+            [price / factor for price, factor in zip(prices, factors)],
+        )
+
+
+def _load_factors(db: Session) -> AdjustmentFactors:
+    rows = db.query(CorporateAction.symbol, CorporateAction.ex_date, CorporateAction.ratio).all()
+    return AdjustmentFactors(rows)
+
+
+def get_adjustment_factors(db: Session) -> AdjustmentFactors:
+    """Factors for every symbol, rebuilt only after corporate_actions changes."""
+    version = table_versions.snapshot(CORPORATE_ACTION_TABLES)
+    return _factors_cache.get_or_compute("factors", version, lambda: _load_factors(db))
+
+
+class AdjustedTrade(NamedTuple):
+    account_id: UUID
+    symbol: str
+    type: TransactionType
+    trade_date: date
+    quantity: float
+    price: float
+    fees: float
+    currency: str
+
+
+def load_adjusted_trades(
+    db: Session,
+    as_of: Optional[date] = None,
+    account_id: Optional[UUID] = None,
+    currency: Optional[str] = None,
+) -> List[AdjustedTrade]:
+    """Transactions ordered by account and trade date, split-adjusted to today's share basis.
+
+    With ``currency`` set, prices and fees are converted to it at the rate on
+    or before each trade date; raises FxRateMissing if a rate is missing.
+    """
+    query = db.query(
+        InvestmentTransaction.account_id,
+        InvestmentTransaction.symbol,
+        InvestmentTransaction.type,
+        InvestmentTransaction.trade_date,
+        InvestmentTransaction.quantity,
+        InvestmentTransaction.price,
+        InvestmentTransaction.fees,
+        InvestmentTransaction.currency,
+    )
+    if as_of is not None:
+        query = query.filter(InvestmentTransaction.trade_date <= as_of)
+    if account_id is not None:
+        query = query.filter(InvestmentTransaction.account_id == account_id)
+    rows = query.order_by(
+        InvestmentTransaction.account_id,
+        InvestmentTransaction.trade_date,
+        InvestmentTransaction.id,
+    ).all()
+    if not rows:
+        return []
+
+    accounts, symbols, types, trade_dates, quantities, prices, fees, currencies = zip(*rows)
+    quantities, prices = get_adjustment_factors(db).adjust(symbols, trade_dates, quantities, prices)
+    if currency is not None:
+        rate_table = get_rate_table(db)
+        rates: Dict[Tuple[str, date], float] = {}
+        for key in zip(currencies, trade_dates):
+            if key not in rates:
+                rates[key] = rate_table.rate(key[0], currency, key[1])
+        factors = [rates[key] for key in zip(currencies, trade_dates)]
+        prices = [price * factor for price, factor in zip(prices, factors)]
+        fees = [fee * factor for fee, factor in zip(fees, factors)]
+        currencies = [currency] * len(rows)
+    return [
+        AdjustedTrade(*values)
+        for values in zip(accounts, symbols, types, trade_dates, quantities, prices, fees, currencies)
+    ]
@@ -0,0 +1,97 @@
+"""Monthly fixed-cost payment summaries over a range of months.
+
+A month is summarised from its fixed_cost_payments rows the same way the
+get_fixed_cost_monthly_summary RPC did, but a whole range is answered by
+one grouped scan. Past months without scheduled payments are closed: their
+numbers rarely change, so they are cached under the write stamp of their
+(owner, month) and recomputed only after a committed payment write to that
+month. Bulk statements on the payments table, and deletes that cascade
+into it (which their callers record), invalidate every closed month.
+"""
+from datetime import date
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.core.cache import VersionedCache, has_pending_writes, table_versions, track_row_writes
+from app.core.periods import add_months, format_month, month_start
+from app.models.fixed_cost import FixedCostPayment, FixedCostPaymentStatus
+
+_closed_months = VersionedCache(maxsize=2048)
+PAYMENTS_TABLE = FixedCostPayment.__tablename__
+
+ALL_USERS = "all"
+
+# A payment belongs to its owner's month and to the all-users month.
+track_row_writes(
+    FixedCostPayment,
+    lambda get: ((get("created_by"), get("year_month")), (ALL_USERS, get("year_month"))),
+)
+
+
+def _months_between(from_month: str, to_month: str) -> List[str]:
+    start, end = month_start(from_month), month_start(to_month)
+    months = []
+    while start <= end:
+        months.append(format_month(start))
+        start = add_months(start, 1)
+    return months
+
+
+def _summarise(month: str, scheduled: float, paid: float, paid_count: int, total_count: int) -> dict:
+    return {
+        "year_month": month,
+        "total_scheduled": scheduled,
+        "total_paid": paid,
+        "total_remaining": scheduled - paid,
+        "paid_count": paid_count,
+        "total_count": total_count,
+        "paid_ratio": round(paid / scheduled * 100, 2) if scheduled > 0 else 0.0,
+    }
+
+
+def get_fixed_cost_summary(
+    db: Session,
+    from_month: str,
+    to_month: str,
+    created_by: Optional[UUID] = None,
+    today: Optional[date] = None,
+) -> List[dict]:
+    """Scheduled, paid and remaining totals per month, oldest first."""
+    current_month = format_month(today or date.today())
+    owner = created_by if created_by is not None else ALL_USERS
+    months = _months_between(from_month, to_month)
+
+    summaries: Dict[str, dict] = {}
+    versions = {month: table_versions.row_version(PAYMENTS_TABLE, (owner, month)) for month in months}
+    cacheable = not has_pending_writes(db, PAYMENTS_TABLE)
+    for month in months:
+        cached = _closed_months.get((owner, month), versions[month])
+        if cached is not None:
+            summaries[month] = cached
+
+    missing = [month for month in months if month not in summaries]
+    if missing:
+        is_paid = FixedCostPayment.status == FixedCostPaymentStatus.PAID
+        query = db.query(
+            FixedCostPayment.year_month,
+            func.coalesce(func.sum(FixedCostPayment.scheduled_amount), 0.0),
+            func.coalesce(func.sum(case((is_paid, FixedCostPayment.actual_amount), else_=0.0)), 0.0),
+            func.count(case((is_paid, 1))),
+            func.count(case((FixedCostPayment.status == FixedCostPaymentStatus.SCHEDULED, 1))),
+            func.count(FixedCostPayment.id),
+        ).filter(FixedCostPayment.year_month.between(missing[0], missing[-1]))
+        if created_by is not None:
+            query = query.filter(FixedCostPayment.created_by == created_by)
+        rows = {row[0]: row[1:] for row in query.group_by(FixedCostPayment.year_month)}
+
+        for month in missing:
+            scheduled, paid, paid_count, open_count, total_count = rows.get(month, (0.0, 0.0, 0, 0, 0))
+            summary = _summarise(month, scheduled, paid, paid_count, total_count)
+            summaries[month] = summary
+            if cacheable and month < current_month and open_count == 0:
+                _closed_months.set((owner, month), versions[month], summary)
+
+    return [summaries[month] for month in months]
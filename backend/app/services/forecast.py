@@ -0,0 +1,125 @@
+"""Month-end spend projections for budgets.
+
+Each category's spend so far is extended by a daily run-rate that blends
+the current month's pace with the category's average over the previous
+HISTORY_MONTHS months; the blend leans on the current month more as it
+progresses. Confidence bands widen with the volatility of daily spend and
+the number of days still to go.
+"""
+import calendar
+import math
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.core.cache import VersionedCache, table_versions
+from app.core.periods import add_months, month_start
+from app.models.budget import Budget
+from app.models.expense import ExpenseDailyTotal
+
+FORECAST_TABLES = ("expenses", "budgets")
+HISTORY_MONTHS = 6
+# Two-sided 90% interval.
+BAND_Z = 1.645
+
+_forecast_cache = VersionedCache(maxsize=64)
+
+
+def _spend_moments(
+    db: Session, history_start: date, start: date, end: date
+) -> Dict[UUID, Tuple[float, float, float, float]]:
+    """Sum and sum of squares of daily spend per category, history and current.
+
+    History is ``history_start`` up to ``start``; the current part runs from
+    ``start`` to ``end``. Aggregated in the database over the per-day totals
+    kept up to date on expense writes, so a cold read neither scans every
+    expense nor ships one row per day.
+    """
+    daily = ExpenseDailyTotal.amount
+    in_history = ExpenseDailyTotal.date < start
+    rows = (
+        db.query(
+            ExpenseDailyTotal.category_id,
+            func.sum(case((in_history, daily), else_=0.0)),
+            func.sum(case((in_history, daily * daily), else_=0.0)),
+            func.sum(case((in_history, 0.0), else_=daily)),
+            func.sum(case((in_history, 0.0), else_=daily * daily)),
+        )
+        .filter(ExpenseDailyTotal.date >= history_start, ExpenseDailyTotal.date <= end)
+        .group_by(ExpenseDailyTotal.category_id)
+        .all()
+    )
+    return {category_id: tuple(value or 0.0 for value in sums) for category_id, *sums in rows}
+
+
+def _mean_and_variance(total: float, total_sq: float, count: int):
+    if count == 0:
+        return 0.0, 0.0
+    mean = total / count
+    return mean, max(total_sq / count - mean * mean, 0.0)
+
+
+def _compute_forecast(db: Session, month: str, as_of: date) -> List[dict]:
+    start = month_start(month)
+    days_in_month = calendar.monthrange(start.year, start.month)[1]
+    end = start + timedelta(days=days_in_month - 1)
+
+    # Days of the month already observed, clamped to the month itself.
+    elapsed = min(max((as_of - start).days + 1, 0), days_in_month)
+    remaining = days_in_month - elapsed
+
+    history_start = add_months(start, -HISTORY_MONTHS)
+    history_days = (start - history_start).days
+    observed_end = start + timedelta(days=elapsed - 1) if elapsed else start - timedelta(days=1)
+    moments = _spend_moments(db, history_start, start, observed_end)
+
+    budgets = (
+        db.query(Budget.id, Budget.category_id, Budget.limit_amount)
+        .filter(Budget.period == start)
+        .all()
+    )
+
+    forecasts = []
+    for budget_id, category_id, limit_amount in budgets:
+        history_total, history_sq, current_total, current_sq = moments.get(category_id, (0.0,) * 4)
+        history_mean, history_var = _mean_and_variance(history_total, history_sq, history_days)
+        current_mean, current_var = _mean_and_variance(current_total, current_sq, elapsed)
+
+        weight = elapsed / days_in_month
+        if history_total == 0:
+            weight = 1.0 if elapsed else 0.0
+        rate = weight * current_mean + (1.0 - weight) * history_mean
+        variance = weight * current_var + (1.0 - weight) * history_var
+
+        projected = current_total + rate * remaining
+        band = BAND_Z * math.sqrt(variance * remaining)
+        forecasts.append({
+            "budget_id": budget_id,
+            "category_id": category_id,
+            "month": month,
+            "limit_amount": limit_amount,
+            "spent_to_date": current_total,
+            "daily_run_rate": rate,
+            "projected": projected,
+            "lower": max(current_total, projected - band),
+            "upper": projected + band,
+            "projected_over": projected > limit_amount,
+        })
+
+    forecasts.sort(key=lambda item: item["projected"] - item["limit_amount"], reverse=True)
+    return forecasts
+
+
+def get_budget_forecast(db: Session, month: str, as_of: Optional[date] = None) -> List[dict]:
+    """Projected month-end spend and 90% band for every budget in ``month``.
+
+    Cached per (month, as-of date) until expenses or budgets change.
+    """
+    as_of = as_of or date.today()
+    version = table_versions.snapshot(FORECAST_TABLES)
+    return _forecast_cache.get_or_compute(
+        (month, as_of), version, lambda: _compute_forecast(db, month, as_of)
+    )
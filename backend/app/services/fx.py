@@ -0,0 +1,97 @@
+from bisect import bisect_right
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, insert, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.cache import VersionedCache, table_versions
+from app.models.investment import FxRate
+
+FX_TABLES = ("fx_rates",)
+
+_rates_cache = VersionedCache(maxsize=1)
+
+
+class FxRateMissing(LookupError):
+    """Raised when no rate on or before the as-of date exists for a currency pair."""
+
+
+class FxRateTable:
+    """All known rates held in memory, sorted by date per pair."""
+
+    def __init__(self, rows: Iterable[Tuple[str, date, float]]):
+        by_pair: Dict[str, List[Tuple[date, float]]] = {}
+        for pair, rate_date, rate in rows:
+            by_pair.setdefault(pair, []).append((rate_date, rate))
+
+        self._dates: Dict[str, List[date]] = {}
+        self._rates: Dict[str, List[float]] = {}
+        for pair, entries in by_pair.items():
+            entries.sort()
+            self._dates[pair] = [rate_date for rate_date, _ in entries]
+            self._rates[pair] = [rate for _, rate in entries]
+
+    def _lookup(self, pair: str, as_of: Optional[date]) -> Optional[float]:
+        dates = self._dates.get(pair)
+        if not dates:
+            return None
+        if as_of is None:
+            return self._rates[pair][-1]
+        index = bisect_right(dates, as_of)
+        return self._rates[pair][index - 1] if index else None
+
+    def rate(self, from_currency: str, to_currency: str, as_of: Optional[date] = None) -> float:
+        """Units of ``to_currency`` per unit of ``from_currency`` on ``as_of`` (latest if None)."""
+        if from_currency == to_currency:
+            return 1.0
+        direct = self._lookup(from_currency + to_currency, as_of)
+        if direct is not None:
+            return direct
+        inverse = self._lookup(to_currency + from_currency, as_of)
+        if inverse:
+            return 1.0 / inverse
+        raise FxRateMissing(f"No {from_currency}/{to_currency} rate available")
+
+    def convert(
+        self,
+        amounts: Sequence[float],
+        currencies: Sequence[str],
+        to_currency: str,
+        as_of: Optional[date] = None,
+    ) -> List[float]:
+        """Convert a whole column of amounts, looking each currency up once."""
+        rates = {currency: self.rate(currency, to_currency, as_of) for currency in set(currencies)}
+        return [amount * rates[currency] for amount, currency in zip(amounts, currencies)]
+
+
+def _load_rates(db: Session) -> FxRateTable:
+    return FxRateTable(db.query(FxRate.pair, FxRate.date, FxRate.rate).all())
+
+
+def get_rate_table(db: Session) -> FxRateTable:
+    """In-memory rate table, reloaded only after fx_rates changes."""
+    version = table_versions.snapshot(FX_TABLES)
+    return _rates_cache.get_or_compute("rates", version, lambda: _load_rates(db))
+
+
+def ingest_rates(db: Session, rates: Sequence[dict], chunk_size: int = 1000) -> int:
+    """Insert or replace (pair, date) rates in bulk within one transaction."""
+    latest: Dict[Tuple[str, date], float] = {}
+    for entry in rates:
+        latest[(entry["pair"].upper(), entry["date"])] = entry["rate"]
+    keys = list(latest)
+
+    for start in range(0, len(keys), chunk_size):
+        chunk = keys[start:start + chunk_size]
+        db.execute(
+            delete(FxRate)
+            .where(tuple_(FxRate.pair, FxRate.date).in_(chunk))
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(
+            insert(FxRate),
+            [{"pair": pair, "date": rate_date, "rate": latest[(pair, rate_date)]} for pair, rate_date in chunk],
+        )
+    db.commit()
+    return len(keys)
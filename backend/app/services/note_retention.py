@@ -0,0 +1,153 @@
+"""Retention for completed notes: purge or archive in bounded batches.
+
+Replaces the client-side deleteOldNotes loop with the same rule: completed
+notes whose completed_at is older than the cutoff are removed; notes
+without a completion time are kept. Rows go CHUNK_SIZE at a time, each
+batch in its own short transaction. Batches are picked through the
+created_at index (a note cannot be completed before it was created), and on
+PostgreSQL rows locked by a concurrent edit are skipped rather than waited
+for; they are picked up by the next run.
+
+In ``archive`` mode each batch is copied into notes_archive in the same
+transaction that deletes it. NoteRetentionSchedule runs the purge
+periodically inside the app process.
+"""
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.jobs import Job, jobs
+from app.models.note import Note, NoteArchive
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 500
+MODES = ("delete", "archive")
+
+_ARCHIVED_COLUMNS = ("id", "content", "is_completed", "created_by", "created_at", "completed_at")
+
+
+def _expired(cutoff: datetime):
+    return (
+        Note.is_completed,
+        Note.completed_at < cutoff,
+        # Implied by the above; lets batches use the created_at index.
+        Note.created_at < cutoff,
+    )
+
+
+def _purge_batch(db: Session, cutoff: datetime, mode: str) -> int:
+    ids = db.scalars(
+        select(Note.id)
+        .where(*_expired(cutoff))
+        .order_by(Note.created_at)
+        .limit(CHUNK_SIZE)
+        .with_for_update(skip_locked=True)
+    ).all()
+    if not ids:
+        return 0
+    if mode == "archive":
+        db.execute(
+            insert(NoteArchive).from_select(
+                _ARCHIVED_COLUMNS,
+                select(*(getattr(Note, column) for column in _ARCHIVED_COLUMNS)).where(Note.id.in_(ids)),
+            )
+        )
+    db.execute(delete(Note).where(Note.id.in_(ids)).execution_options(synchronize_session=False))
+    return len(ids)
+
+
+def purge_notes(
+    db: Session,
+    older_than_days: int,
+    mode: str = "delete",
+    job: Optional[Job] = None,
+    now: Optional[datetime] = None,
+) -> int:
+    """Purge expired completed notes batch by batch; returns how many.
+
+    ``db`` is committed after every batch.
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}")
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=older_than_days)
+    purged = 0
+    while True:
+        count = _purge_batch(db, cutoff, mode)
+        db.commit()
+        purged += count
+        if job is not None:
+            jobs.advance(job, count)
+        if count < CHUNK_SIZE:
+            return purged
+
+
+def start_note_purge(older_than_days: int, mode: str) -> Job:
+    """Validate the parameters and register the purge job."""
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}")
+    if older_than_days < 0:
+        raise ValueError("older_than_days must not be negative")
+    return jobs.create("note_purge")
+
+
+def run_note_purge(db: Session, job: Job, older_than_days: int, mode: str) -> None:
+    """Job body: purge and record the count; ``db`` is owned by the job."""
+    jobs.start(job)
+    try:
+        purged = purge_notes(db, older_than_days, mode, job=job)
+        jobs.finish(job, {"purged": purged, "mode": mode, "older_than_days": older_than_days})
+    except Exception as exc:
+        db.rollback()
+        jobs.fail(job, str(exc))
+    finally:
+        db.close()
+
+
+class NoteRetentionSchedule:
+    """Background thread running the purge every ``interval``."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        interval: timedelta,
+        older_than_days: int,
+        mode: str = "delete",
+    ):
+        self.session_factory = session_factory
+        self.interval = interval
+        self.older_than_days = older_than_days
+        self.mode = mode
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None or self.interval <= timedelta(0):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="note-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def run_once(self) -> Job:
+        job = start_note_purge(self.older_than_days, self.mode)
+        run_note_purge(self.session_factory(), job, self.older_than_days, self.mode)
+        return job
+
+    def _loop(self) -> None:
+        # First run one interval after startup, not during it.
+        while not self._stop.wait(self.interval.total_seconds()):
+            job = self.run_once()
+            if job.error:
+                logger.warning("Note retention run failed: %s", job.error)
+            else:
+                logger.info("Note retention purged %s notes", job.processed)
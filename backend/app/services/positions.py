@@ -0,0 +1,89 @@
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import VersionedCache, table_versions
+from app.models.investment import DEFAULT_CURRENCY, Holding, TransactionType
+from app.services.corporate_actions import load_adjusted_trades
+from app.services.fx import get_rate_table
+
+POSITION_TABLES = ("holdings", "investment_transactions", "corporate_actions", "fx_rates")
+
+_positions_cache = VersionedCache(maxsize=128)
+
+
+def _compute_positions(db: Session, as_of: Optional[date], account_id: Optional[UUID], currency: str) -> List[dict]:
+    # Trades of one position may be in different currencies; costs are
+    # converted at each trade date's rate before they are summed.
+    trades = load_adjusted_trades(db, as_of=as_of, account_id=account_id, currency=currency)
+
+    holdings_query = db.query(Holding.account_id, Holding.symbol, Holding.current_price, Holding.currency)
+    if account_id is not None:
+        holdings_query = holdings_query.filter(Holding.account_id == account_id)
+    rate_table = get_rate_table(db)
+    current_prices = {
+        (holding_account, symbol): price * rate_table.rate(price_currency, currency, as_of)
+        for holding_account, symbol, price, price_currency in holdings_query.all()
+    }
+
+    # Average-cost bookkeeping: buys raise the cost basis including fees,
+    # sells release basis at the running average and realise the difference.
+    qty: Dict[Tuple[UUID, str], float] = defaultdict(float)
+    cost: Dict[Tuple[UUID, str], float] = defaultdict(float)
+    realized: Dict[Tuple[UUID, str], float] = defaultdict(float)
+    for trade in trades:
+        key = (trade.account_id, trade.symbol)
+        if trade.type == TransactionType.BUY:
+            qty[key] += trade.quantity
+            cost[key] += trade.quantity * trade.price + trade.fees
+        else:
+            average = cost[key] / qty[key] if qty[key] > 0 else 0.0
+            released = average * min(trade.quantity, qty[key])
+            realized[key] += trade.quantity * trade.price - trade.fees - released
+            qty[key] -= trade.quantity
+            cost[key] -= released
+            if qty[key] <= 0:
+                qty[key], cost[key] = 0.0, 0.0
+
+    positions = []
+    for key in sorted(qty, key=lambda item: (str(item[0]), item[1])):
+        position_account, symbol = key
+        position_qty = qty[key]
+        market_price = current_prices.get(key)
+        unrealized = (
+            position_qty * market_price - cost[key]
+            if market_price is not None
+            else None
+        )
+        positions.append({
+            "account_id": position_account,
+            "symbol": symbol,
+            "currency": currency,
+            "qty": position_qty,
+            "avg_cost": cost[key] / position_qty if position_qty > 0 else 0.0,
+            "cost_basis": cost[key],
+            "realized_pnl": realized[key],
+            "market_price": market_price,
+            "unrealized_pnl": unrealized,
+        })
+    return positions
+
+
+def get_positions(
+    db: Session,
+    as_of: Optional[date] = None,
+    account_id: Optional[UUID] = None,
+    currency: str = DEFAULT_CURRENCY,
+) -> List[dict]:
+    """Split-adjusted positions and P&L per (account, symbol) derived from transactions.
+
+    Amounts are in ``currency``; raises FxRateMissing when a trade or price
+    cannot be converted.
+    """
+    version = table_versions.snapshot(POSITION_TABLES)
+    return _positions_cache.get_or_compute(
+        (account_id, as_of, currency), version, lambda: _compute_positions(db, as_of, account_id, currency)
+    )
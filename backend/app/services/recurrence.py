@@ -0,0 +1,287 @@
+"""RFC 5545 recurrence rules, expanded one window at a time.
+
+Supports the subset of RRULE the calendar writes and reads: FREQ (DAILY,
+WEEKLY, MONTHLY, YEARLY), INTERVAL, COUNT, UNTIL, BYDAY (with ordinals
+such as ``2MO`` or ``-1FR`` for monthly and yearly rules), BYMONTHDAY,
+BYMONTH and WKST. In yearly rules BYDAY and BYMONTHDAY select days within
+BYMONTH, or within the start month when BYMONTH is absent.
+
+Occurrences repeat on the wall clock of the event's time zone, so a weekly
+09:00 meeting stays at 09:00 across DST changes. A rule is expanded period
+by period (day, week, month or year); for rules without COUNT the iterator
+computes the first period that can reach the window and starts there, so
+expanding next month of a years-old daily event costs the same as
+expanding the first month.
+"""
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Iterator, List, Optional, Tuple
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+# Occurrences returned per event and window, as in the client expansion.
+MAX_OCCURRENCES = 500
+
+
+class InvalidRecurrenceRule(ValueError):
+    """Raised for RRULE strings outside the supported subset."""
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    freq: str
+    interval: int = 1
+    count: Optional[int] = None
+    # Either a date (inclusive, local) or an aware datetime.
+    until: Optional[object] = None
+    # (weekday 0=MO..6=SU, ordinal or None)
+    byday: Tuple[Tuple[int, Optional[int]], ...] = ()
+    bymonthday: Tuple[int, ...] = ()
+    bymonth: Tuple[int, ...] = ()
+    wkst: int = 0
+
+
+def _int_list(value: str, low: int, high: int, allow_negative: bool = False) -> Tuple[int, ...]:
+    numbers = []
+    for part in value.split(","):
+        number = int(part)
+        if not (low <= abs(number) <= high) or (number < 0 and not allow_negative):
+            raise InvalidRecurrenceRule(f"Value {part!r} out of range")
+        numbers.append(number)
+    return tuple(numbers)
+
+
+def _parse_byday(value: str) -> Tuple[Tuple[int, Optional[int]], ...]:
+    days = []
+    for part in value.split(","):
+        part = part.strip().upper()
+        code, ordinal = part[-2:], part[:-2]
+        if code not in WEEKDAYS:
+            raise InvalidRecurrenceRule(f"Unknown weekday {part!r}")
+        if ordinal:
+            number = int(ordinal)
+            if not 1 <= abs(number) <= 53:
+                raise InvalidRecurrenceRule(f"Weekday ordinal out of range in {part!r}")
+            days.append((WEEKDAYS.index(code), number))
+        else:
+            days.append((WEEKDAYS.index(code), None))
+    return tuple(days)
+
+
+def _parse_until(value: str):
+    try:
+        if "T" not in value:
+            return datetime.strptime(value, "%Y%m%d").date()
+        if value.endswith("Z"):
+            return datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+        # Floating local time; resolved against the event's zone on expansion.
+        return datetime.strptime(value, "%Y%m%dT%H%M%S")
+    except ValueError as exc:
+        raise InvalidRecurrenceRule(f"Invalid UNTIL {value!r}") from exc
+
+
+def parse_rrule(text: str) -> RecurrenceRule:
+    """Parse ``FREQ=WEEKLY;BYDAY=MO,WE`` (an ``RRULE:`` prefix is allowed)."""
+    text = (text or "").strip()
+    if text.upper().startswith("RRULE:"):
+        text = text[6:]
+    fields = {}
+    for part in filter(None, text.split(";")):
+        key, sep, value = part.partition("=")
+        if not sep or not value:
+            raise InvalidRecurrenceRule(f"Malformed rule part {part!r}")
+        fields[key.strip().upper()] = value.strip()
+
+    freq = fields.pop("FREQ", "").upper()
+    if freq not in FREQUENCIES:
+        raise InvalidRecurrenceRule(f"Unsupported FREQ {freq!r}")
+    try:
+        interval = int(fields.pop("INTERVAL", 1))
+        count = int(fields["COUNT"]) if "COUNT" in fields else None
+        fields.pop("COUNT", None)
+        until = _parse_until(fields.pop("UNTIL")) if "UNTIL" in fields else None
+        byday = _parse_byday(fields.pop("BYDAY")) if "BYDAY" in fields else ()
+        bymonthday = _int_list(fields.pop("BYMONTHDAY"), 1, 31, allow_negative=True) if "BYMONTHDAY" in fields else ()
+        bymonth = _int_list(fields.pop("BYMONTH"), 1, 12) if "BYMONTH" in fields else ()
+        wkst = WEEKDAYS.index(fields.pop("WKST", "MO").upper())
+    except ValueError as exc:
+        if isinstance(exc, InvalidRecurrenceRule):
+            raise
+        raise InvalidRecurrenceRule(str(exc)) from exc
+
+    if fields:
+        raise InvalidRecurrenceRule(f"Unsupported rule parts: {', '.join(sorted(fields))}")
+    if interval < 1:
+        raise InvalidRecurrenceRule("INTERVAL must be positive")
+    if count is not None and count < 1:
+        raise InvalidRecurrenceRule("COUNT must be positive")
+    if count is not None and until is not None:
+        raise InvalidRecurrenceRule("COUNT and UNTIL are mutually exclusive")
+    if freq in ("DAILY", "WEEKLY") and any(ordinal for _, ordinal in byday):
+        raise InvalidRecurrenceRule(f"BYDAY ordinals are not allowed with FREQ={freq}")
+    return RecurrenceRule(freq, interval, count, until, byday, bymonthday, bymonth, wkst)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    if month == 12:
+        return 31
+    return (date(year, month + 1, 1) - timedelta(days=1)).day
+
+
+def _month_days(rule: RecurrenceRule, year: int, month: int, default_day: int) -> List[int]:
+    """Days of ``month`` selected by BYMONTHDAY and/or BYDAY."""
+    last = _days_in_month(year, month)
+    days = None
+    if rule.bymonthday:
+        days = {day if day > 0 else last + day + 1 for day in rule.bymonthday}
+        days = {day for day in days if 1 <= day <= last}
+    if rule.byday:
+        first_weekday = date(year, month, 1).weekday()
+        matched = set()
+        for weekday, ordinal in rule.byday:
+            first = 1 + (weekday - first_weekday) % 7
+            all_days = list(range(first, last + 1, 7))
+            if ordinal is None:
+                matched.update(all_days)
+            elif -len(all_days) <= ordinal <= len(all_days) and ordinal != 0:
+                matched.add(all_days[ordinal - 1 if ordinal > 0 else ordinal])
+        days = matched if days is None else days & matched
+    if days is None:
+        # Like the client expansion, a 31st falls back to the month's last day.
+        return [min(default_day, last)]
+    return sorted(days)
+
+
+def _period_dates(rule: RecurrenceRule, dtstart: date, period: int) -> List[date]:
+    """Candidate dates of the ``period``-th period after ``dtstart``'s, in order."""
+    step = period * rule.interval
+    if rule.freq == "DAILY":
+        day = dtstart + timedelta(days=step)
+        if rule.byday and day.weekday() not in {weekday for weekday, _ in rule.byday}:
+            return []
+        if rule.bymonthday and day not in _month_day_dates(rule, day.year, day.month):
+            return []
+        dates = [day]
+    elif rule.freq == "WEEKLY":
+        week_start = dtstart - timedelta(days=(dtstart.weekday() - rule.wkst) % 7) + timedelta(weeks=step)
+        weekdays = [weekday for weekday, _ in rule.byday] or [dtstart.weekday()]
+        offsets = sorted({(weekday - rule.wkst) % 7 for weekday in weekdays})
+        dates = [week_start + timedelta(days=offset) for offset in offsets]
+    elif rule.freq == "MONTHLY":
+        index = dtstart.year * 12 + dtstart.month - 1 + step
+        year, month = divmod(index, 12)
+        dates = [date(year, month + 1, day) for day in _month_days(rule, year, month + 1, dtstart.day)]
+    else:
+        year = dtstart.year + step
+        months = rule.bymonth or (dtstart.month,)
+        dates = [
+            date(year, month, day)
+            for month in sorted(months)
+            for day in _month_days(rule, year, month, dtstart.day)
+        ]
+    if rule.bymonth and rule.freq != "YEARLY":
+        dates = [day for day in dates if day.month in rule.bymonth]
+    return dates
+
+
+def _month_day_dates(rule: RecurrenceRule, year: int, month: int) -> List[date]:
+    last = _days_in_month(year, month)
+    days = {day if day > 0 else last + day + 1 for day in rule.bymonthday}
+    return [date(year, month, day) for day in days if 1 <= day <= last]
+
+
+def _first_period(rule: RecurrenceRule, dtstart: date, target: date) -> int:
+    """Index of the period containing ``target``; no earlier one can reach it."""
+    if target <= dtstart:
+        return 0
+    if rule.freq == "DAILY":
+        span = (target - dtstart).days
+    elif rule.freq == "WEEKLY":
+        first_week = dtstart - timedelta(days=(dtstart.weekday() - rule.wkst) % 7)
+        span = (target - first_week).days // 7
+    elif rule.freq == "MONTHLY":
+        span = (target.year * 12 + target.month) - (dtstart.year * 12 + dtstart.month)
+    else:
+        span = target.year - dtstart.year
+    return span // rule.interval
+
+
+def _localize(value: datetime, zone: tzinfo) -> datetime:
+    return value.replace(tzinfo=zone) if value.tzinfo is None else value.astimezone(zone)
+
+
+def expand(
+    rule: RecurrenceRule,
+    start_at: datetime,
+    duration: timedelta,
+    window_start: datetime,
+    window_end: datetime,
+    zone: tzinfo,
+    limit: int = MAX_OCCURRENCES,
+) -> Iterator[datetime]:
+    """Starts of the occurrences overlapping ``[window_start, window_end)``.
+
+    ``start_at`` and the window bounds are aware datetimes; occurrences are
+    generated on the wall clock of ``zone`` and yielded in that zone.
+    """
+    local_start = start_at.astimezone(zone)
+    dtstart, clock = local_start.date(), local_start.time().replace(tzinfo=None)
+    # An occurrence starting this early can still overlap the window.
+    reach = window_start - duration
+
+    until = rule.until
+    if isinstance(until, date) and not isinstance(until, datetime):
+        until = datetime.combine(until, time.max).replace(tzinfo=zone)
+    elif isinstance(until, datetime):
+        until = _localize(until, zone)
+
+    period = 0
+    if rule.count is None:
+        period = _first_period(rule, dtstart, reach.astimezone(zone).date())
+
+    seen = produced = 0
+    while produced < limit:
+        try:
+            dates = _period_dates(rule, dtstart, period)
+        except (OverflowError, ValueError):
+            return  # past year 9999
+        period += 1
+        if not dates:
+            # Periods without candidates (e.g. BYMONTH=2;BYMONTHDAY=30) still
+            # move time forward; stop once they pass the window.
+            probe = _period_start(rule, dtstart, period)
+            if probe is None or datetime.combine(probe, time.min).replace(tzinfo=zone) >= window_end:
+                return
+            continue
+        for day in dates:
+            if day < dtstart:
+                continue
+            occurrence = datetime.combine(day, clock).replace(tzinfo=zone)
+            if until is not None and occurrence > until:
+                return
+            seen += 1
+            if rule.count is not None and seen > rule.count:
+                return
+            if occurrence >= window_end:
+                return
+            if occurrence > reach or occurrence >= window_start:
+                yield occurrence
+                produced += 1
+                if produced >= limit:
+                    return
+
+
+def _period_start(rule: RecurrenceRule, dtstart: date, period: int) -> Optional[date]:
+    step = period * rule.interval
+    try:
+        if rule.freq == "DAILY":
+            return dtstart + timedelta(days=step)
+        if rule.freq == "WEEKLY":
+            return dtstart - timedelta(days=(dtstart.weekday() - rule.wkst) % 7) + timedelta(weeks=step)
+        if rule.freq == "MONTHLY":
+            year, month = divmod(dtstart.year * 12 + dtstart.month - 1 + step, 12)
+            return date(year, month + 1, 1)
+        return date(dtstart.year + step, 1, 1)
+    except (OverflowError, ValueError):
+        return None
@@ -0,0 +1,101 @@
+"""Read-through cache for small, rarely changing reference tables.
+
+Labels, categories and users are read on almost every request (lookups by
+id, existence checks, list endpoints) but written rarely. Each table is held
+in memory as response schemas, keyed by id, and reloaded only after a write
+to it is committed. Users are cached through the public User schema, so
+password hashes never enter the cache.
+"""
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.cache import VersionedCache, has_pending_writes, table_versions
+from app.models.category import Category as CategoryModel
+from app.models.issue import Label as LabelModel
+from app.models.user import User as UserModel
+from app.schemas.category import Category
+from app.schemas.issue import Label
+from app.schemas.user import User
+
+# Tables with more rows than this are not reference data; reads fall through
+# to the database instead of pinning the whole table in memory.
+MAX_ROWS = 5000
+
+_reference_cache = VersionedCache(maxsize=8)
+_TOO_LARGE = object()
+
+
+class ReferenceTable:
+    """All rows of one table as ``schema`` instances, keyed by id."""
+
+    def __init__(self, model, schema: type[BaseModel], order_by):
+        self.model = model
+        self.schema = schema
+        self.order_by = order_by
+        self.table = model.__tablename__
+
+    def _load(self, db: Session):
+        rows = db.query(self.model).order_by(self.order_by).limit(MAX_ROWS + 1).all()
+        if len(rows) > MAX_ROWS:
+            return _TOO_LARGE
+        return {row.id: self.schema.model_validate(row) for row in rows}
+
+    def rows(self, db: Session) -> Optional[Dict[UUID, BaseModel]]:
+        """The cached rows in ``order_by`` order.
+
+        None when the table is too large to cache or ``db`` has uncommitted
+        writes to it; callers then query the database directly.
+        """
+        if has_pending_writes(db, self.table):
+            return None
+        version = table_versions.snapshot((self.table,))
+        rows = _reference_cache.get_or_compute(self.table, version, lambda: self._load(db))
+        return None if rows is _TOO_LARGE else rows
+
+    def all(self, db: Session) -> List[BaseModel]:
+        rows = self.rows(db)
+        if rows is None:
+            return [self.schema.model_validate(row) for row in db.query(self.model).order_by(self.order_by)]
+        return list(rows.values())
+
+    def get(self, db: Session, row_id: UUID) -> Optional[BaseModel]:
+        rows = self.rows(db)
+        if rows is None:
+            row = db.query(self.model).filter(self.model.id == row_id).first()
+            return self.schema.model_validate(row) if row else None
+        return rows.get(row_id)
+
+    def get_many(self, db: Session, row_ids: Iterable[UUID]) -> List[BaseModel]:
+        """Rows for the ids that exist, in the order given; unknown ids are skipped."""
+        row_ids = list(dict.fromkeys(row_ids))
+        rows = self.rows(db)
+        if rows is None:
+            found = db.query(self.model).filter(self.model.id.in_(row_ids)).all()
+            rows = {row.id: self.schema.model_validate(row) for row in found}
+        return [rows[row_id] for row_id in row_ids if row_id in rows]
+
+    def attach(self, db: Session, row_ids: Iterable[UUID]) -> list:
+        """Session-bound model instances for ``row_ids`` without a SELECT.
+
+        Meant for relationship assignment; the instances carry only the
+        columns present on the schema.
+        """
+        instances = []
+        for row in self.get_many(db, row_ids):
+            instance = self.model(**row.model_dump())
+            make_transient_to_detached(instance)
+            instances.append(db.merge(instance, load=False))
+        return instances
+
+
+labels = ReferenceTable(LabelModel, Label, LabelModel.name)
+categories = ReferenceTable(CategoryModel, Category, CategoryModel.id)
+users = ReferenceTable(UserModel, User, UserModel.name)
+
+
+def cache_stats() -> dict:
+    """Hit/miss counters of the reference cache."""
+    return _reference_cache.stats()
@@ -0,0 +1,210 @@
+"""In-process scheduler for calendar reminders.
+
+A reminder fires ``minutes_before`` an occurrence starts, for each entry of
+the event's ``reminders`` list. The scheduler keeps the fire times of the
+next LOOKAHEAD in a heap, built from the materialized occurrences (see
+app.services.calendar_occurrences), and answers "which reminders fired
+since T" from memory:
+
+- reminders whose time has come are popped off the heap into a sorted
+  list that keeps the last RETENTION of them;
+- writing an event bumps the event's generation, which invalidates its
+  entries lazily, and pushes the new ones, O(log n) each; the heap is
+  compacted once stale entries outnumber live ones;
+- nothing is persisted: after a restart the first query loads the heap
+  again, and the loaded range slides forward as time passes.
+"""
+import bisect
+import heapq
+import itertools
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.calendar import MAX_REMINDER_MINUTES, CalendarEvent, CalendarOccurrence
+from app.services.calendar_occurrences import as_utc, ensure_horizon
+
+LOOKAHEAD = timedelta(days=7)
+RETENTION = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class Reminder:
+    fire_at: datetime
+    event_id: UUID
+    created_by: UUID
+    title: str
+    occurrence_start: datetime
+    minutes_before: int
+    method: str
+    generation: int
+
+
+# (fire_at, tie-breaker, reminder)
+_Entry = Tuple[datetime, int, Reminder]
+
+
+class ReminderScheduler:
+    """Heap of upcoming reminders plus the recently fired ones."""
+
+    def __init__(self, lookahead: timedelta = LOOKAHEAD, retention: timedelta = RETENTION):
+        self.lookahead = lookahead
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._clear()
+
+    def _clear(self) -> None:
+        self._heap: List[_Entry] = []
+        self._fired: List[_Entry] = []
+        self._generations: Dict[UUID, int] = {}
+        # Current entries per event still in the heap, to count stale ones.
+        self._live: Dict[UUID, int] = {}
+        self._stale = 0
+        self._loaded_from: Optional[datetime] = None
+        self._loaded_until: Optional[datetime] = None
+
+    def reset(self) -> None:
+        """Forget everything; the next query loads the heap again."""
+        with self._lock:
+            self._clear()
+
+    def __len__(self) -> int:
+        return len(self._heap) - self._stale
+
+    def _current(self, reminder: Reminder) -> bool:
+        return self._generations.get(reminder.event_id, 0) == reminder.generation
+
+    def _load(
+        self,
+        db: Session,
+        start: datetime,
+        end: datetime,
+        event_id: Optional[UUID] = None,
+    ) -> List[Reminder]:
+        """Reminders firing in ``[start, end)``, optionally of one event."""
+        # Occurrences this far past the range can still fire inside it.
+        lead = timedelta(minutes=MAX_REMINDER_MINUTES)
+        ensure_horizon(db, start, end + lead)
+        query = (
+            select(
+                CalendarOccurrence.start_at,
+                CalendarEvent.id,
+                CalendarEvent.created_by,
+                CalendarEvent.title,
+                CalendarEvent.reminders,
+            )
+            .join(CalendarEvent, CalendarEvent.id == CalendarOccurrence.event_id)
+            .where(CalendarOccurrence.start_at >= start, CalendarOccurrence.start_at < end + lead)
+        )
+        if event_id is not None:
+            query = query.where(CalendarOccurrence.event_id == event_id)
+
+        reminders = []
+        for occurrence_start, event, created_by, title, entries in db.execute(query):
+            occurrence_start = as_utc(occurrence_start)
+            for entry in entries or ():
+                minutes = int(entry.get("minutes_before", 0))
+                fire_at = occurrence_start - timedelta(minutes=minutes)
+                if start <= fire_at < end:
+                    reminders.append(Reminder(
+                        fire_at=fire_at,
+                        event_id=event,
+                        created_by=created_by,
+                        title=title,
+                        occurrence_start=occurrence_start,
+                        minutes_before=minutes,
+                        method=entry.get("method", "in_app"),
+                        generation=self._generations.get(event, 0),
+                    ))
+        return reminders
+
+    def _push(self, reminders: List[Reminder]) -> None:
+        for reminder in reminders:
+            heapq.heappush(self._heap, (reminder.fire_at, next(self._sequence), reminder))
+            self._live[reminder.event_id] = self._live.get(reminder.event_id, 0) + 1
+
+    def _ensure_loaded(self, db: Session, now: datetime) -> None:
+        if self._loaded_until is None:
+            self._loaded_from = now - self.retention
+            self._loaded_until = now + self.lookahead
+            self._push(self._load(db, self._loaded_from, self._loaded_until))
+        elif now + self.lookahead / 2 > self._loaded_until:
+            # Slide forward: load the next slice only.
+            until = now + self.lookahead
+            self._push(self._load(db, max(self._loaded_until, now - self.retention), until))
+            self._loaded_until = until
+
+    def _advance(self, now: datetime) -> None:
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            reminder = entry[2]
+            if not self._current(reminder):
+                self._stale -= 1
+                continue
+            self._live[reminder.event_id] -= 1
+            bisect.insort(self._fired, entry)
+        cutoff = bisect.bisect_left(self._fired, (now - self.retention,))
+        del self._fired[:cutoff]
+        self._loaded_from = max(self._loaded_from, now - self.retention)
+
+    def _compact(self) -> None:
+        if self._stale > len(self._heap) // 2:
+            self._heap = [entry for entry in self._heap if self._current(entry[2])]
+            heapq.heapify(self._heap)
+            self._fired = [entry for entry in self._fired if self._current(entry[2])]
+            self._stale = 0
+
+    def _invalidate(self, event_id: UUID) -> None:
+        self._generations[event_id] = self._generations.get(event_id, 0) + 1
+        self._stale += self._live.pop(event_id, 0)
+
+    def refresh_event(self, db: Session, event_id: UUID) -> None:
+        """Replace an event's reminders after it was created or changed."""
+        with self._lock:
+            self._invalidate(event_id)
+            if self._loaded_until is not None:
+                self._push(self._load(db, self._loaded_from, self._loaded_until, event_id=event_id))
+            self._compact()
+
+    def forget_event(self, event_id: UUID) -> None:
+        """Drop a deleted event's reminders."""
+        with self._lock:
+            self._invalidate(event_id)
+            self._compact()
+
+    def due(
+        self,
+        db: Session,
+        since: datetime,
+        until: Optional[datetime] = None,
+        user_id: Optional[UUID] = None,
+        now: Optional[datetime] = None,
+    ) -> List[Reminder]:
+        """Reminders that fired in ``(since, until]``, oldest first.
+
+        The scheduler only ever advances to the current time (``now``, for
+        tests); a later ``until`` is capped to it rather than firing future
+        reminders. ``since`` is clamped to the retention window.
+        """
+        now = as_utc(now or datetime.now(timezone.utc))
+        until = min(as_utc(until), now) if until else now
+        with self._lock:
+            self._ensure_loaded(db, until)
+            self._advance(until)
+            start = bisect.bisect_right(self._fired, (as_utc(since), float("inf")))
+            return [
+                reminder
+                for _, _, reminder in self._fired[start:]
+                if reminder.fire_at <= until
+                and self._current(reminder)
+                and (user_id is None or reminder.created_by == user_id)
+            ]
+
+
+scheduler = ReminderScheduler()
@@ -0,0 +1,255 @@
+"""Money-weighted (XIRR) and time-weighted (TWR) returns for investments.
+
+Cash flows come from investment_transactions: buys are money paid into a
+position (cost plus fees) and sells are money taken out (proceeds less
+fees). The value still held on the as-of date is treated as a final inflow,
+marked at the holding's current price.
+
+There is no price history table, so the daily valuations used for TWR are
+built by carrying forward the last observed price of each symbol, which is
+the trade price on each trade date and the current price on the as-of date.
+Trades are split-adjusted first so those prices stay on one share basis.
+
+Accounts may hold trades in several currencies, so every flow is converted
+to one reporting currency at the rate of its trade date, and current prices
+at the rate of the as-of date, before anything is summed.
+"""
+import math
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import VersionedCache, table_versions
+from app.models.investment import DEFAULT_CURRENCY, Holding, TransactionType
+from app.services.corporate_actions import AdjustedTrade, load_adjusted_trades
+from app.services.fx import get_rate_table
+
+RETURNS_TABLES = ("holdings", "investment_transactions", "corporate_actions", "fx_rates")
+
+_returns_cache = VersionedCache(maxsize=128)
+
+_DAYS_PER_YEAR = 365.0
+_XIRR_TOLERANCE = 1e-9
+_XIRR_MAX_NEWTON_STEPS = 50
+_XIRR_BRACKET = (-0.9999, 1000.0)
+
+CashFlows = Tuple[Sequence[float], Sequence[float]]
+
+
+def _npv_and_derivative(rate: float, times: Sequence[float], amounts: Sequence[float]) -> Tuple[float, float]:
+    log_growth = math.log1p(rate)
+    npv = 0.0
+    derivative = 0.0
+    for t, amount in zip(times, amounts):
+        discounted = amount * math.exp(-t * log_growth)
+        npv += discounted
+        derivative -= t * discounted
+    return npv, derivative / (1.0 + rate)
+
+
+def _bisect_xirr(times: Sequence[float], amounts: Sequence[float]) -> Optional[float]:
+    low, high = _XIRR_BRACKET
+    npv_low = _npv_and_derivative(low, times, amounts)[0]
+    npv_high = _npv_and_derivative(high, times, amounts)[0]
+    if npv_low * npv_high > 0:
+        return None
+    for _ in range(200):
+        mid = (low + high) / 2.0
+        npv_mid = _npv_and_derivative(mid, times, amounts)[0]
+        if abs(npv_mid) < _XIRR_TOLERANCE or high - low < _XIRR_TOLERANCE:
+            return mid
+        if npv_low * npv_mid < 0:
+            high = mid
+        else:
+            low, npv_low = mid, npv_mid
+    return (low + high) / 2.0
+
+
+def solve_xirr_batch(series: Sequence[CashFlows], guess: float = 0.1) -> List[Optional[float]]:
+    """Solve XIRR for many cash-flow series at once.
+
+    Each series is ``(times, amounts)`` with times in years from the first
+    flow. All series take a Newton step together each round and drop out of
+    the working set once converged, so a batch costs roughly one pass over
+    all flows per round. Series that Newton cannot settle fall back to
+    bisection; series without both an outflow and an inflow have no IRR and
+    yield None.
+    """
+    rates: List[Optional[float]] = [None] * len(series)
+    current = {}
+    for index, (times, amounts) in enumerate(series):
+        if any(a > 0 for a in amounts) and any(a < 0 for a in amounts):
+            current[index] = guess
+
+    for _ in range(_XIRR_MAX_NEWTON_STEPS):
+        if not current:
+            break
+        next_round = {}
+        for index, rate in current.items():
+            times, amounts = series[index]
+            npv, derivative = _npv_and_derivative(rate, times, amounts)
+            updated = rate - npv / derivative if derivative else math.nan
+            if not math.isfinite(updated) or updated <= -1.0:
+                rates[index] = _bisect_xirr(times, amounts)
+            elif abs(updated - rate) < _XIRR_TOLERANCE:
+                rates[index] = updated
+            else:
+                next_round[index] = updated
+        current = next_round
+
+    for index in current:
+        rates[index] = _bisect_xirr(*series[index])
+    return rates
+
+
+class _Series:
+    """Cash flows and TWR state for one account or one account/symbol pair."""
+
+    __slots__ = ("flow_dates", "flow_amounts", "qty", "prices", "growth", "base", "net_invested")
+
+    def __init__(self):
+        self.flow_dates: List[date] = []
+        self.flow_amounts: List[float] = []
+        self.qty: Dict[str, float] = defaultdict(float)
+        self.prices: Dict[str, float] = {}
+        self.growth = 1.0
+        self.base = 0.0
+        self.net_invested = 0.0
+
+    def market_value(self) -> float:
+        return sum(qty * self.prices.get(symbol, 0.0) for symbol, qty in self.qty.items())
+
+    def apply_day(self, trade_date: date, trades: List[AdjustedTrade]) -> None:
+        for trade in trades:
+            self.prices[trade.symbol] = trade.price
+        # Close the sub-period that ended just before today's flows.
+        if self.base > 0:
+            self.growth *= self.market_value() / self.base
+
+        day_flow = 0.0
+        fees = 0.0
+        for trade in trades:
+            gross = trade.quantity * trade.price
+            if trade.type == TransactionType.BUY:
+                self.qty[trade.symbol] += trade.quantity
+                day_flow -= gross + trade.fees
+            else:
+                self.qty[trade.symbol] -= trade.quantity
+                day_flow += gross - trade.fees
+            fees += trade.fees
+
+        self.flow_dates.append(trade_date)
+        self.flow_amounts.append(day_flow)
+        self.net_invested -= day_flow
+        # Fees are money that left the investor but not value that was
+        # bought, so they count against the next sub-period's return.
+        value = self.market_value()
+        self.base = value + fees if value > 0 else 0.0
+
+    def close(self, as_of: date, current_prices: Dict[str, float]) -> Tuple[CashFlows, float, Optional[float]]:
+        for symbol in self.qty:
+            if symbol in current_prices:
+                self.prices[symbol] = current_prices[symbol]
+        value = self.market_value()
+        twr = self.growth * value / self.base - 1.0 if self.base > 0 else self.growth - 1.0
+
+        dates = self.flow_dates + [as_of]
+        amounts = self.flow_amounts + [value]
+        start = dates[0]
+        times = [(d - start).days / _DAYS_PER_YEAR for d in dates]
+        return (times, amounts), value, twr
+
+
+def _iter_series(accounts: Dict[UUID, _Series], symbols: Dict[Tuple[UUID, str], _Series]):
+    for account, series in accounts.items():
+        yield (account, None), series
+    for key, series in sorted(symbols.items(), key=lambda item: (str(item[0][0]), item[0][1])):
+        yield key, series
+
+
+def _compute_returns(db: Session, as_of: date, account_id: Optional[UUID], currency: str) -> dict:
+    transactions = load_adjusted_trades(db, as_of=as_of, account_id=account_id, currency=currency)
+
+    holdings_query = db.query(Holding.account_id, Holding.symbol, Holding.current_price, Holding.currency)
+    if account_id is not None:
+        holdings_query = holdings_query.filter(Holding.account_id == account_id)
+
+    rate_table = get_rate_table(db)
+    current_prices: Dict[UUID, Dict[str, float]] = defaultdict(dict)
+    for holding_account, symbol, price, price_currency in holdings_query.all():
+        current_prices[holding_account][symbol] = price * rate_table.rate(price_currency, currency, as_of)
+
+    accounts: Dict[UUID, _Series] = {}
+    symbols: Dict[Tuple[UUID, str], _Series] = {}
+
+    # Transactions are grouped per (account, date) so that same-day trades
+    # form a single cash flow and a single TWR sub-period boundary.
+    day_key = None
+    day_trades: List[AdjustedTrade] = []
+
+    def flush_day():
+        if not day_trades:
+            return
+        trade_account, trade_date = day_key
+        accounts.setdefault(trade_account, _Series()).apply_day(trade_date, day_trades)
+        by_symbol: Dict[str, List[AdjustedTrade]] = defaultdict(list)
+        for trade in day_trades:
+            by_symbol[trade.symbol].append(trade)
+        for symbol, trades in by_symbol.items():
+            symbols.setdefault((trade_account, symbol), _Series()).apply_day(trade_date, trades)
+
+    for transaction in transactions:
+        key = (transaction.account_id, transaction.trade_date)
+        if key != day_key:
+            flush_day()
+            day_key, day_trades = key, []
+        day_trades.append(transaction)
+    flush_day()
+
+    labels: List[Tuple[UUID, Optional[str]]] = []
+    flows: List[CashFlows] = []
+    summaries = []
+    for (series_account, symbol), series in _iter_series(accounts, symbols):
+        cash_flows, value, twr = series.close(as_of, current_prices.get(series_account, {}))
+        labels.append((series_account, symbol))
+        flows.append(cash_flows)
+        summaries.append((series.net_invested, value, twr))
+
+    # Every account and symbol series is solved in one batch.
+    rates = solve_xirr_batch(flows)
+
+    results = {"as_of": as_of, "currency": currency, "accounts": [], "symbols": []}
+    for (series_account, symbol), rate, (net_invested, value, twr) in zip(labels, rates, summaries):
+        entry = {
+            "account_id": series_account,
+            "symbol": symbol,
+            "xirr": rate,
+            "twr": twr,
+            "net_invested": net_invested,
+            "market_value": value,
+        }
+        results["symbols" if symbol else "accounts"].append(entry)
+    return results
+
+
+def get_returns(
+    db: Session,
+    as_of: Optional[date] = None,
+    account_id: Optional[UUID] = None,
+    currency: str = DEFAULT_CURRENCY,
+) -> dict:
+    """XIRR and TWR per account and per account/symbol as of a date.
+
+    Amounts are in ``currency``; raises FxRateMissing when a trade or price
+    cannot be converted. Results are memoized per (account, as-of date,
+    currency) and reused until holdings, transactions, corporate actions or
+    FX rates change.
+    """
+    as_of = as_of or date.today()
+    version = table_versions.snapshot(RETURNS_TABLES)
+    return _returns_cache.get_or_compute(
+        (account_id, as_of, currency), version, lambda: _compute_returns(db, as_of, account_id, currency)
+    )
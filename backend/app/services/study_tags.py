@@ -0,0 +1,177 @@
+"""Tag index, search and facet counts for study sessions.
+
+Tags live twice: in study_sessions.tags (TEXT[] with a GIN index on
+PostgreSQL, a JSON list on SQLite) and, one row per tag, in
+study_session_tags. Searches use whichever suits the dialect:
+
+- any-of / all-of: ``&&`` / ``@>`` against the GIN index on PostgreSQL,
+  the tag table on SQLite;
+- prefix: the tag table, since GIN cannot answer prefixes. PostgreSQL
+  uses LIKE 'prefix%' on a text_pattern_ops index, as a range is only a
+  prefix match under byte-order collation; SQLite's BINARY collation is
+  byte order, so there a range scan of the (tag, session) index is used.
+
+Tag counts over all sessions are cached in memory (TagFacets) and updated
+with each write's delta instead of being regrouped; when a write the cache
+did not see is detected through the table version, it reloads.
+"""
+import threading
+from collections import Counter
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, distinct, func, select, type_coerce
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from sqlalchemy.types import Text
+
+from app.core.cache import has_pending_writes, table_versions
+from app.models.study import StudySession, StudySessionTag
+
+TAG_TABLE = StudySessionTag.__tablename__
+# Sorts after every character a tag can contain; closes prefix ranges
+# under byte-order collation.
+_PREFIX_END = "\U0010ffff"
+
+
+def normalize_tags(tags: Optional[Iterable[str]]) -> List[str]:
+    """Trimmed, non-empty tags without duplicates, in first-seen order."""
+    seen = {}
+    for tag in tags or ():
+        tag = tag.strip()
+        if tag and tag not in seen:
+            seen[tag] = None
+    return list(seen)
+
+
+def set_tags(study_session: StudySession, tags: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """Set a session's tags and its tag rows; returns (removed, added)."""
+    tags = normalize_tags(tags)
+    old = set(normalize_tags(study_session.tags))
+    removed = [tag for tag in old if tag not in tags]
+    added = [tag for tag in tags if tag not in old]
+    if removed:
+        study_session.tag_rows = [row for row in study_session.tag_rows if row.tag not in removed]
+    for tag in added:
+        study_session.tag_rows.append(StudySessionTag(tag=tag))
+    study_session.tags = tags
+    return removed, added
+
+
+def _tag_table_ids(*where):
+    return select(StudySessionTag.study_session_id).where(*where)
+
+
+def tag_filters(
+    db: Session,
+    any_tags: Sequence[str] = (),
+    all_tags: Sequence[str] = (),
+    prefix: Optional[str] = None,
+) -> list:
+    """WHERE clauses on StudySession for the requested tag conditions."""
+    any_tags, all_tags = normalize_tags(any_tags), normalize_tags(all_tags)
+    filters = []
+    if db.get_bind().dialect.name == "postgresql":
+        tags = type_coerce(StudySession.tags, postgresql.ARRAY(Text))
+        if any_tags:
+            filters.append(tags.overlap(postgresql.array(any_tags, type_=Text)))
+        if all_tags:
+            filters.append(tags.contains(postgresql.array(all_tags, type_=Text)))
+    else:
+        if any_tags:
+            filters.append(StudySession.id.in_(_tag_table_ids(StudySessionTag.tag.in_(any_tags))))
+        if all_tags:
+            filters.append(
+                StudySession.id.in_(
+                    _tag_table_ids(StudySessionTag.tag.in_(all_tags))
+                    .group_by(StudySessionTag.study_session_id)
+                    .having(func.count(distinct(StudySessionTag.tag)) == len(all_tags))
+                )
+            )
+    if prefix:
+        filters.append(StudySession.id.in_(_tag_table_ids(_prefix_match(db.get_bind().dialect.name, prefix))))
+    return filters
+
+
+def _prefix_match(dialect: str, prefix: str):
+    if dialect == "postgresql":
+        escaped = prefix.replace("/", "//").replace("%", "/%").replace("_", "/_")
+        return StudySessionTag.tag.like(escaped + "%", escape="/")
+    return and_(StudySessionTag.tag >= prefix, StudySessionTag.tag < prefix + _PREFIX_END)
+
+
+def _sorted_counts(counts: Iterable[Tuple[str, int]], prefix: Optional[str], limit: Optional[int]) -> List[Tuple[str, int]]:
+    items = [(tag, count) for tag, count in counts if count > 0 and (not prefix or tag.startswith(prefix))]
+    items.sort(key=lambda item: (-item[1], item[0]))
+    return items[:limit] if limit else items
+
+
+def facet_counts(db: Session, session_ids, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+    """Tag counts over the sessions selected by the ``session_ids`` subquery."""
+    rows = db.execute(
+        select(StudySessionTag.tag, func.count())
+        .where(StudySessionTag.study_session_id.in_(session_ids))
+        .group_by(StudySessionTag.tag)
+    ).all()
+    return _sorted_counts(rows, None, limit)
+
+
+class TagFacets:
+    """Tag counts over all sessions, maintained from write deltas.
+
+    Writers commit through commit(), which applies their delta once the
+    commit is done. Counts read while a tracked write is in flight are
+    computed from the table and not cached, so a load can never already
+    contain a delta that is applied afterwards.
+    """
+
+    def __init__(self):
+        self._counts: Optional[Counter] = None
+        self._version: Optional[int] = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def counts(self, db: Session, prefix: Optional[str] = None, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        with self._lock:
+            version = table_versions.get(TAG_TABLE)
+            if self._counts is not None and self._version == version:
+                return _sorted_counts(self._counts.items(), prefix, limit)
+            cacheable = not self._in_flight and not has_pending_writes(db, TAG_TABLE)
+
+        rows = db.execute(select(StudySessionTag.tag, func.count()).group_by(StudySessionTag.tag)).all()
+        with self._lock:
+            if cacheable and not self._in_flight and table_versions.get(TAG_TABLE) == version:
+                self._counts, self._version = Counter(dict(rows)), version
+        return _sorted_counts(rows, prefix, limit)
+
+    def commit(self, db: Session, removed: Iterable[str] = (), added: Iterable[str] = ()) -> None:
+        """Commit ``db`` and apply the write's tag changes to the counts."""
+        removed, added = list(removed), list(added)
+        with self._lock:
+            self._in_flight += 1
+            before = self._version
+        try:
+            db.commit()
+        except Exception:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        with self._lock:
+            self._in_flight -= 1
+            if not removed and not added or self._counts is None:
+                return
+            # The commit bumped the tag table once; any other change means
+            # a write this cache did not see.
+            version = table_versions.get(TAG_TABLE)
+            if before is None or before != self._version or version != before + 1:
+                self._counts = self._version = None
+                return
+            self._counts.subtract(removed)
+            self._counts.update(added)
+            self._version = version
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = self._version = None
+
+
+facets = TagFacets()
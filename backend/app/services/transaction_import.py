@@ -0,0 +1,286 @@
+import csv
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models.investment import (
+    DEFAULT_CURRENCY,
+    InvestmentTransaction,
+    TransactionType,
+    transaction_content_hash,
+)
+
+DEFAULT_CHUNK_SIZE = 2000
+# Only a sample of problem rows is reported so the summary stays small no
+# matter how large the uploaded file is.
+MAX_REPORTED_ROWS = 100
+
+REQUIRED_FIELDS = ("symbol", "type", "trade_date", "quantity", "price")
+OPTIONAL_FIELDS = ("name", "fees", "currency", "memo")
+
+
+class ImportFormatError(ValueError):
+    """Raised when a file cannot be imported with the selected column mapping."""
+
+
+@dataclass(frozen=True)
+class ColumnMapping:
+    """Describes how a broker export maps onto investment transaction fields.
+
+    ``columns`` maps each transaction field to the header names it may appear
+    under; ``type_values`` maps the broker's trade-side labels to
+    TransactionType.
+    """
+
+    columns: Dict[str, Sequence[str]]
+    type_values: Dict[str, TransactionType]
+    date_formats: Sequence[str] = ("%Y-%m-%d",)
+    encoding: str = "utf-8-sig"
+    delimiter: str = ","
+
+    def resolve(self, header: Sequence[str]) -> Dict[str, int]:
+        positions = {name.strip().lower(): index for index, name in enumerate(header)}
+        resolved = {}
+        for field_name, candidates in self.columns.items():
+            for candidate in candidates:
+                index = positions.get(candidate.strip().lower())
+                if index is not None:
+                    resolved[field_name] = index
+                    break
+
+        missing = [name for name in REQUIRED_FIELDS if name not in resolved]
+        if missing:
+            raise ImportFormatError(f"Missing required columns: {', '.join(missing)}")
+        return resolved
+
+    def parse_date(self, value: str) -> date:
+        if "%Y-%m-%d" in self.date_formats:
+            # strptime dominates parse time on large files; ISO dates have a
+            # much cheaper dedicated parser.
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                pass
+        for fmt in self.date_formats:
+            try:
+                return datetime.strptime(value, fmt).date()
+            except ValueError:
+                continue
+        raise ValueError(f"Unrecognised date: {value!r}")
+
+    def parse_type(self, value: str) -> TransactionType:
+        key = value.strip()
+        transaction_type = self.type_values.get(key) or self.type_values.get(key.upper())
+        if transaction_type is None:
+            raise ValueError(f"Unrecognised transaction type: {value!r}")
+        return transaction_type
+
+    def parse_row(self, row: Sequence[str], positions: Dict[str, int]) -> dict:
+        def cell(name: str) -> Optional[str]:
+            index = positions.get(name)
+            if index is None or index >= len(row):
+                return None
+            value = row[index].strip()
+            return value or None
+
+        symbol = cell("symbol")
+        if not symbol:
+            raise ValueError("Symbol is empty")
+
+        quantity = _parse_number(cell("quantity"), "quantity")
+        price = _parse_number(cell("price"), "price")
+        if quantity <= 0 or price <= 0:
+            raise ValueError("Quantity and price must be positive")
+
+        fees_raw = cell("fees")
+        fees = _parse_number(fees_raw, "fees") if fees_raw else 0.0
+        if fees < 0:
+            raise ValueError("Fees cannot be negative")
+
+        return {
+            "symbol": symbol.upper(),
+            "name": cell("name"),
+            "type": self.parse_type(cell("type") or ""),
+            "trade_date": self.parse_date(cell("trade_date") or ""),
+            "quantity": quantity,
+            "price": price,
+            "fees": fees,
+            "currency": (cell("currency") or DEFAULT_CURRENCY).upper(),
+            "memo": cell("memo"),
+        }
+
+
+def _parse_number(value: Optional[str], field_name: str) -> float:
+    if value is None:
+        raise ValueError(f"{field_name} is empty")
+    try:
+        return float(value.replace(",", ""))
+    except ValueError as exc:
+        raise ValueError(f"Invalid {field_name}: {value!r}") from exc
+
+
+COLUMN_MAPPINGS: Dict[str, ColumnMapping] = {
+    "default": ColumnMapping(
+        columns={
+            "symbol": ("symbol",),
+            "name": ("name",),
+            "type": ("type", "transaction_type"),
+            "trade_date": ("trade_date", "date"),
+            "quantity": ("quantity", "qty"),
+            "price": ("price",),
+            "fees": ("fees", "fee"),
+            "currency": ("currency",),
+            "memo": ("memo",),
+        },
+        type_values={"BUY": TransactionType.BUY, "SELL": TransactionType.SELL},
+    ),
+    "korean_broker": ColumnMapping(
+        columns={
+            "symbol": ("종목코드",),
+            "name": ("종목명",),
+            "type": ("매매구분", "거래구분"),
+            "trade_date": ("거래일자", "체결일자"),
+            "quantity": ("수량", "체결수량"),
+            "price": ("단가", "체결단가"),
+            "fees": ("수수료",),
+            "currency": ("통화",),
+            "memo": ("비고",),
+        },
+        type_values={
+            "매수": TransactionType.BUY,
+            "매도": TransactionType.SELL,
+            "BUY": TransactionType.BUY,
+            "SELL": TransactionType.SELL,
+        },
+        date_formats=("%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d", "%Y%m%d"),
+    ),
+}
+
+
+def register_mapping(name: str, mapping: ColumnMapping) -> None:
+    """Make an additional broker export format available to the importer."""
+    COLUMN_MAPPINGS[name] = mapping
+
+
+def get_mapping(name: str) -> ColumnMapping:
+    mapping = COLUMN_MAPPINGS.get(name)
+    if mapping is None:
+        raise ImportFormatError(
+            f"Unknown column mapping '{name}'. Available: {', '.join(sorted(COLUMN_MAPPINGS))}"
+        )
+    return mapping
+
+
+@dataclass
+class ImportSummary:
+    dry_run: bool
+    total_rows: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    errors: int = 0
+    duplicate_lines: List[int] = field(default_factory=list)
+    error_details: List[dict] = field(default_factory=list)
+
+
+def _flush_chunk(db: Session, chunk: List[dict], lines: List[int], summary: ImportSummary) -> None:
+    if not chunk:
+        return
+
+    hashes = {record["content_hash"] for record in chunk}
+    existing = set(
+        db.execute(
+            select(InvestmentTransaction.content_hash)
+            .where(InvestmentTransaction.content_hash.in_(hashes))
+        ).scalars()
+    )
+
+    new_rows = []
+    for record, line in zip(chunk, lines):
+        content_hash = record["content_hash"]
+        if content_hash in existing:
+            summary.duplicates += 1
+            if len(summary.duplicate_lines) < MAX_REPORTED_ROWS:
+                summary.duplicate_lines.append(line)
+            continue
+        # Later rows in the same chunk with the same fingerprint are duplicates too.
+        existing.add(content_hash)
+        new_rows.append(record)
+
+    if new_rows:
+        db.execute(insert(InvestmentTransaction), new_rows)
+        summary.inserted += len(new_rows)
+
+
+def import_transactions(
+    db: Session,
+    account_id: UUID,
+    lines: Iterable[str],
+    mapping: ColumnMapping,
+    dry_run: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ImportSummary:
+    """Stream a broker CSV export into investment_transactions.
+
+    Rows are parsed lazily and written in chunks of ``chunk_size`` inside one
+    transaction, so memory use is bounded by the chunk rather than the file.
+    Rows whose content hash already exists (in the table or earlier in the
+    file) are skipped as duplicates. A dry run performs the same work and
+    then rolls back, so its duplicate report is exactly what a real import
+    would do.
+    """
+    reader = csv.reader(lines, delimiter=mapping.delimiter)
+    header = next(reader, None)
+    if header is None:
+        raise ImportFormatError("File is empty")
+    positions = mapping.resolve(header)
+
+    summary = ImportSummary(dry_run=dry_run)
+    chunk: List[dict] = []
+    chunk_lines: List[int] = []
+
+    try:
+        # A quoted field may span lines; report the line a row starts on.
+        next_line = reader.line_num + 1
+        for row in reader:
+            line, next_line = next_line, reader.line_num + 1
+            if not any(cell.strip() for cell in row):
+                continue
+            summary.total_rows += 1
+
+            try:
+                record = mapping.parse_row(row, positions)
+            except ValueError as exc:
+                summary.errors += 1
+                if len(summary.error_details) < MAX_REPORTED_ROWS:
+                    summary.error_details.append({"line": line, "message": str(exc)})
+                continue
+
+            record["account_id"] = account_id
+            record["content_hash"] = transaction_content_hash(
+                account_id,
+                record["symbol"],
+                record["trade_date"],
+                record["quantity"],
+                record["price"],
+            )
+            chunk.append(record)
+            chunk_lines.append(line)
+
+            if len(chunk) >= chunk_size:
+                _flush_chunk(db, chunk, chunk_lines, summary)
+                chunk, chunk_lines = [], []
+
+        _flush_chunk(db, chunk, chunk_lines, summary)
+    except Exception:
+        db.rollback()
+        raise
+
+    if dry_run:
+        db.rollback()
+    else:
+        db.commit()
+    return summary
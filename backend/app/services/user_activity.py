@@ -0,0 +1,70 @@
+"""Per-user activity summaries computed with grouped queries."""
+from datetime import date
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.cache import VersionedCache, table_versions
+from app.models.expense import Expense
+from app.models.issue import Issue, IssueStatus
+from app.services import reference_data
+
+ACTIVITY_TABLES = ("users", "expenses", "issues")
+
+_activity_cache = VersionedCache(maxsize=64)
+
+
+def _compute_activity(db: Session, from_date: Optional[date], to_date: Optional[date]) -> List[dict]:
+    expense_query = db.query(
+        Expense.created_by,
+        func.count(Expense.id),
+        func.sum(Expense.amount),
+        func.max(Expense.date),
+    )
+    if from_date:
+        expense_query = expense_query.filter(Expense.date >= from_date)
+    if to_date:
+        expense_query = expense_query.filter(Expense.date <= to_date)
+    expenses = {
+        user_id: (count, total or 0.0, last_date)
+        for user_id, count, total, last_date in expense_query.group_by(Expense.created_by)
+    }
+
+    # Issues carry no dates, so open issues are counted as they stand now.
+    open_issues: Dict[UUID, Dict[str, int]] = {}
+    issue_rows = (
+        db.query(Issue.assignee_id, Issue.status, func.count(Issue.id))
+        .filter(Issue.status != IssueStatus.CLOSED)
+        .group_by(Issue.assignee_id, Issue.status)
+    )
+    for user_id, issue_status, count in issue_rows:
+        open_issues.setdefault(user_id, {})[issue_status.value] = count
+
+    summaries = []
+    for user in reference_data.users.all(db):
+        count, total, last_date = expenses.get(user.id, (0, 0.0, None))
+        summaries.append({
+            "user_id": user.id,
+            "name": user.name,
+            "expense_count": count,
+            "expense_total": total,
+            "open_issues": open_issues.get(user.id, {}),
+            "last_activity": last_date,
+        })
+    return summaries
+
+
+def get_user_activity(
+    db: Session, from_date: Optional[date] = None, to_date: Optional[date] = None
+) -> List[dict]:
+    """Expense count and total within the period, open issues by status and the
+    date of the latest expense, for every user.
+
+    Cached per period until users, expenses or issues change.
+    """
+    version = table_versions.snapshot(ACTIVITY_TABLES)
+    return _activity_cache.get_or_compute(
+        (from_date, to_date), version, lambda: _compute_activity(db, from_date, to_date)
+    )
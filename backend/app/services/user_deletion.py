@@ -0,0 +1,214 @@
+"""Background user deletion: shared records are reassigned, personal ones deleted.
+
+Shared financial records (expenses, issues assigned to the user, fixed
+costs and their payments) are reassigned to a user the caller names. The
+user's personal data is deleted with them: their issue comments, notes and
+archived notes, calendar events and preferences, and study sessions, each
+with its dependent rows. Nothing personal changes hands.
+
+Rows are moved or deleted CHUNK_SIZE at a time, each batch in its own short
+transaction, so no single statement locks a large part of any table. The
+user row is deleted last, together with a final sweep for rows written
+while the batches ran; if a concurrent write slips in between the sweep
+and the delete, the foreign key rejects the delete and the final step is
+retried. The job result records the policy and the per-table counts.
+
+Rows written between the sweep and the delete can still be removed by the
+database's cascades, which the ORM never sees; every table the cascades
+reach is recorded as written so version-keyed caches such as the tag
+facets reload.
+"""
+from typing import Dict, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import Table, delete, exists, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.cache import note_table_writes
+from app.core.jobs import Job, jobs
+from app.models.calendar import CalendarEvent, CalendarOccurrence, UserCalendarPreference
+from app.models.expense import Expense
+from app.models.fixed_cost import FixedCost, FixedCostPayment
+from app.models.issue import Issue, IssueComment
+from app.models.note import Note, NoteArchive
+from app.models.study import StudyFollowup, StudyReference, StudySession, StudySessionTag
+from app.models.user import User
+from app.services.reminders import scheduler
+
+CHUNK_SIZE = 500
+FINAL_ATTEMPTS = 3
+POLICY = "reassign_shared_delete_personal"
+
+# (model, column referencing users.id) moved to the reassignment target.
+REASSIGNED_COLUMNS = (
+    (Expense, Expense.created_by),
+    (Issue, Issue.assignee_id),
+    (FixedCost, FixedCost.created_by),
+    (FixedCostPayment, FixedCostPayment.created_by),
+)
+# (model, column referencing users.id, dependents) deleted with the user;
+# dependents are (model, column referencing model.id), deleted first since
+# SQLite does not cascade.
+DELETED_COLUMNS = (
+    (IssueComment, IssueComment.user_id, ()),
+    (Note, Note.created_by, ()),
+    (NoteArchive, NoteArchive.created_by, ()),
+    (CalendarEvent, CalendarEvent.created_by, ((CalendarOccurrence, CalendarOccurrence.event_id),)),
+    (StudySession, StudySession.created_by, (
+        (StudySessionTag, StudySessionTag.study_session_id),
+        (StudyReference, StudyReference.study_session_id),
+        (StudyFollowup, StudyFollowup.study_session_id),
+    )),
+    (UserCalendarPreference, UserCalendarPreference.user_id, ()),
+)
+
+
+class UserInUse(Exception):
+    """Raised when the user has shared records but no one was named to take them over."""
+
+
+class InvalidReassignTarget(ValueError):
+    """Raised when the named reassignment target is missing or the user itself."""
+
+
+def _cascaded_tables(table: Table) -> Set[str]:
+    """Tables the database deletes from, directly or not, when a row of ``table`` goes."""
+    found: Set[str] = set()
+    pending = [table]
+    while pending:
+        parent = pending.pop()
+        for child in parent.metadata.sorted_tables:
+            if child.name in found:
+                continue
+            if any(fk.ondelete == "CASCADE" and fk.column.table is parent for fk in child.foreign_keys):
+                found.add(child.name)
+                pending.append(child)
+    return found
+
+
+def _owns_shared_records(db: Session, user_id: UUID) -> bool:
+    return any(
+        db.scalar(select(exists().where(column == user_id)))
+        for _, column in REASSIGNED_COLUMNS
+    )
+
+
+def _counts(db: Session, user_id: UUID, columns) -> Dict[str, int]:
+    return {
+        model.__tablename__: db.scalar(select(func.count()).select_from(model).where(column == user_id))
+        for model, column, *_ in columns
+    }
+
+
+def _reassign(db: Session, model, column, user_id: UUID, target_id: UUID, limit: Optional[int]) -> int:
+    condition = column == user_id
+    if limit is not None:
+        condition = model.id.in_(select(model.id).where(column == user_id).limit(limit).scalar_subquery())
+    return db.execute(
+        update(model)
+        .where(condition, column == user_id)
+        .values({column: target_id})
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def _delete(db: Session, model, column, dependents, user_id: UUID, limit: Optional[int]) -> int:
+    ids = select(model.id).where(column == user_id)
+    if limit is not None:
+        ids = ids.limit(limit)
+    ids = db.scalars(ids).all()
+    if not ids:
+        return 0
+    for dependent, parent_column in dependents:
+        db.execute(
+            delete(dependent).where(parent_column.in_(ids)).execution_options(synchronize_session=False)
+        )
+    return db.execute(
+        delete(model).where(model.id.in_(ids)).execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def start_user_deletion(db: Session, user_id: UUID, reassign_to: Optional[UUID] = None) -> Optional[Job]:
+    """Validate the deletion and register its job; None when the user is missing.
+
+    Raises InvalidReassignTarget when ``reassign_to`` is not another
+    existing user, and UserInUse when the user has shared records but no
+    ``reassign_to`` was given. The rows are counted by the job, not here.
+    """
+    if db.get(User, user_id) is None:
+        return None
+    if reassign_to is not None:
+        if reassign_to == user_id or db.get(User, reassign_to) is None:
+            raise InvalidReassignTarget(str(reassign_to))
+    elif _owns_shared_records(db, user_id):
+        raise UserInUse(str(user_id))
+    return jobs.create("user_deletion")
+
+
+def run_user_deletion(db: Session, job: Job, user_id: UUID, reassign_to: Optional[UUID] = None) -> None:
+    """Reassign shared records and delete personal ones in batches, then the user.
+
+    ``db`` must be a session owned by the job; it is committed per batch.
+    """
+    try:
+        reassigned = _counts(db, user_id, REASSIGNED_COLUMNS) if reassign_to is not None else {}
+        deleted = _counts(db, user_id, DELETED_COLUMNS)
+        jobs.start(job, total=sum(reassigned.values()) + sum(deleted.values()))
+        if reassign_to is not None:
+            for model, column in REASSIGNED_COLUMNS:
+                while True:
+                    moved = _reassign(db, model, column, user_id, reassign_to, CHUNK_SIZE)
+                    db.commit()
+                    jobs.advance(job, moved)
+                    if moved < CHUNK_SIZE:
+                        break
+        for model, column, dependents in DELETED_COLUMNS:
+            while True:
+                removed = _delete(db, model, column, dependents, user_id, CHUNK_SIZE)
+                db.commit()
+                jobs.advance(job, removed)
+                if removed < CHUNK_SIZE:
+                    break
+
+        for attempt in range(FINAL_ATTEMPTS):
+            try:
+                # Rows created since the batches ran are few; sweep them in
+                # the same transaction as the delete.
+                swept_reassigned: Dict[str, int] = {}
+                if reassign_to is not None:
+                    for model, column in REASSIGNED_COLUMNS:
+                        swept_reassigned[model.__tablename__] = _reassign(db, model, column, user_id, reassign_to, None)
+                swept_deleted = {
+                    model.__tablename__: _delete(db, model, column, dependents, user_id, None)
+                    for model, column, dependents in DELETED_COLUMNS
+                }
+                user = db.get(User, user_id)
+                if user is not None:
+                    db.delete(user)
+                    note_table_writes(db, *_cascaded_tables(User.__table__))
+                db.commit()
+                for table, count in swept_reassigned.items():
+                    reassigned[table] += count
+                for table, count in swept_deleted.items():
+                    deleted[table] += count
+                jobs.advance(job, sum(swept_reassigned.values()) + sum(swept_deleted.values()))
+                break
+            except IntegrityError:
+                db.rollback()
+                if attempt == FINAL_ATTEMPTS - 1:
+                    raise
+        if deleted[CalendarEvent.__tablename__]:
+            scheduler.reset()
+        jobs.finish(job, {
+            "user_id": str(user_id),
+            "policy": POLICY,
+            "reassigned_to": str(reassign_to) if reassign_to else None,
+            "reassigned": reassigned,
+            "deleted": deleted,
+        })
+    except Exception as exc:
+        db.rollback()
+        jobs.fail(job, str(exc))
+    finally:
+        db.close()
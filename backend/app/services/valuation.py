@@ -0,0 +1,108 @@
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.cache import VersionedCache, table_versions
+from app.models.investment import DEFAULT_CURRENCY, Holding, InvestmentAccount
+from app.services.fx import get_rate_table
+
+# Tables whose writes can change a valuation. Holding.current_price lives on
+# the holdings table, so price updates are covered by it as well; accounts are
+# included so a deleted account stops being served from the cache.
+VALUATION_TABLES = ("investment_accounts", "holdings", "investment_transactions", "fx_rates")
+
+_valuation_cache = VersionedCache(maxsize=512)
+
+ALL_ACCOUNTS = "all"
+
+
+def _compute_valuation(
+    db: Session,
+    account_id: Optional[UUID],
+    currency: str,
+    as_of: Optional[date],
+) -> Optional[dict]:
+    if account_id is not None:
+        exists = (
+            db.query(InvestmentAccount.id)
+            .filter(InvestmentAccount.id == account_id)
+            .first()
+        )
+        if not exists:
+            return None
+
+    query = db.query(
+        Holding.symbol,
+        Holding.currency,
+        func.max(Holding.name),
+        func.sum(Holding.qty),
+        func.sum(Holding.qty * Holding.current_price),
+        func.sum(Holding.qty * Holding.avg_price),
+    )
+    if account_id is not None:
+        query = query.filter(Holding.account_id == account_id)
+    rows = query.group_by(Holding.symbol, Holding.currency).all()
+
+    # Amounts are summed per (symbol, currency) in SQL and converted to the
+    # reporting currency column-wise, one rate lookup per currency.
+    currencies = [row[1] for row in rows]
+    rate_table = get_rate_table(db)
+    market_values = rate_table.convert([row[4] or 0.0 for row in rows], currencies, currency, as_of)
+    cost_bases = rate_table.convert([row[5] or 0.0 for row in rows], currencies, currency, as_of)
+
+    by_symbol = {}
+    for (symbol, _, name, qty, _, _), market_value, cost_basis in zip(rows, market_values, cost_bases):
+        position = by_symbol.setdefault(symbol, {
+            "symbol": symbol,
+            "name": name,
+            "qty": 0.0,
+            "market_value": 0.0,
+            "cost_basis": 0.0,
+        })
+        position["qty"] += qty or 0.0
+        position["market_value"] += market_value
+        position["cost_basis"] += cost_basis
+
+    total_value = sum(market_values)
+    total_cost = sum(cost_bases)
+
+    positions = list(by_symbol.values())
+    for position in positions:
+        position["gain"] = position["market_value"] - position["cost_basis"]
+        position["weight"] = position["market_value"] / total_value if total_value else 0.0
+    positions.sort(key=lambda position: position["market_value"], reverse=True)
+
+    return {
+        "account_id": account_id,
+        "currency": currency,
+        "market_value": total_value,
+        "cost_basis": total_cost,
+        "gain": total_value - total_cost,
+        "gain_pct": (total_value - total_cost) / total_cost if total_cost else 0.0,
+        "positions": positions,
+    }
+
+
+def get_valuation(
+    db: Session,
+    account_id: Optional[UUID] = None,
+    currency: str = DEFAULT_CURRENCY,
+    as_of: Optional[date] = None,
+) -> Optional[dict]:
+    """Aggregate holdings by symbol for one account, or for all accounts.
+
+    Amounts are reported in ``currency`` using the FX rate on or before
+    ``as_of`` (the latest rate when omitted). Returns None when the requested
+    account does not exist; raises FxRateMissing when a rate is unavailable.
+
+    Results are cached until a write to one of VALUATION_TABLES is committed,
+    so repeated reads are answered from memory without touching the database.
+    """
+    key = (account_id if account_id is not None else ALL_ACCOUNTS, currency, as_of)
+    version = table_versions.snapshot(VALUATION_TABLES)
+    return _valuation_cache.get_or_compute(
+        key, version, lambda: _compute_valuation(db, account_id, currency, as_of)
+    )
@@ -0,0 +1,195 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.api.budgets import _copy_statement
+from app.core.deps import get_db
+from app.main import app
+from app.models.category import Category, CategoryType
+from app.models.expense import Expense, ExpenseDailyTotal
+from app.models.user import User, UserRole
+
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db_session):
+    def override_get_db():
+        try:
+            yield db_session
+        finally:
+            db_session.rollback()
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+def seed_categories(db_session, *names):
+    categories = [Category(name=name, type=CategoryType.EXPENSE) for name in names]
+    db_session.add_all(categories)
+    db_session.commit()
+    return categories
+
+
+def test_list_budgets_by_month_range(client, db_session):
+    (category,) = seed_categories(db_session, "식비")
+
+    for month in ("2024-11", "2024-12", "2025-01", "2025-02"):
+        resp = client.post(
+            "/api/budgets",
+            json={"category_id": str(category.id), "month": month, "limit_amount": 100000},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["month"] == month
+
+    duplicate = client.post(
+        "/api/budgets",
+        json={"category_id": str(category.id), "month": "2025-01", "limit_amount": 1},
+    )
+    assert duplicate.status_code == 400
+
+    ranged = client.get("/api/budgets", params={"from": "2024-12", "to": "2025-01"})
+    assert ranged.status_code == 200
+    assert [b["month"] for b in ranged.json()] == ["2024-12", "2025-01"]
+
+    exact = client.get("/api/budgets", params={"month": "2025-02"}).json()
+    assert [b["month"] for b in exact] == ["2025-02"]
+
+    invalid = client.get("/api/budgets", params={"from": "2025-13"})
+    assert invalid.status_code == 422
+
+
+def test_forecast_projects_month_end_spend(client, db_session):
+    user = User(name="Tester", email="forecast@example.com", hashed_password="x", role=UserRole.ADMIN)
+    food, travel = seed_categories(db_session, "식비", "여행")
+    db_session.add(user)
+    db_session.commit()
+
+    # 10,000 a day for the first ten days of June.
+    for day in range(1, 11):
+        db_session.add(Expense(
+            category_id=food.id, date=date(2024, 6, day), amount=10000, memo="점심", created_by=user.id,
+        ))
+    db_session.commit()
+
+    for category, limit in ((food, 200000), (travel, 50000)):
+        client.post(
+            "/api/budgets",
+            json={"category_id": str(category.id), "month": "2024-06", "limit_amount": limit},
+        )
+
+    resp = client.get("/api/budgets/forecast", params={"month": "2024-06", "as_of": "2024-06-10"})
+    assert resp.status_code == 200
+    forecasts = {f["category_id"]: f for f in resp.json()}
+
+    food_forecast = forecasts[str(food.id)]
+    assert food_forecast["spent_to_date"] == 100000
+    assert food_forecast["projected"] == pytest.approx(300000)
+    assert food_forecast["projected_over"] is True
+    assert food_forecast["lower"] <= food_forecast["projected"] <= food_forecast["upper"]
+
+    travel_forecast = forecasts[str(travel.id)]
+    assert travel_forecast["projected"] == 0
+    assert travel_forecast["projected_over"] is False
+
+
+
+def daily_totals(db_session):
+    rows = db_session.query(
+        ExpenseDailyTotal.date, ExpenseDailyTotal.category_id, ExpenseDailyTotal.amount, ExpenseDailyTotal.expense_count
+    )
+    return sorted((row.date, str(row.category_id), row.amount, row.expense_count) for row in rows)
+
+
+def grouped_expenses(db_session):
+    rows = (
+        db_session.query(Expense.date, Expense.category_id, func.sum(Expense.amount), func.count())
+        .group_by(Expense.date, Expense.category_id)
+    )
+    return sorted((spend_date, str(category_id), amount, count) for spend_date, category_id, amount, count in rows)
+
+
+def test_daily_totals_follow_expense_writes(client, db_session):
+    user = User(name="Tester", email="totals@example.com", hashed_password="x", role=UserRole.ADMIN)
+    food, travel = seed_categories(db_session, "식비", "여행")
+    db_session.add(user)
+    db_session.commit()
+
+    ids = [
+        client.post("/api/expenses", json={
+            "category_id": str(food.id), "date": f"2024-06-0{day}", "amount": 1000 * day,
+            "memo": "점심", "created_by": str(user.id),
+        }).json()["id"]
+        for day in (1, 1, 2)
+    ]
+    assert daily_totals(db_session) == grouped_expenses(db_session)
+
+    client.put(f"/api/expenses/{ids[0]}", json={"category_id": str(travel.id), "date": "2024-06-03", "amount": 7000})
+    client.put(f"/api/expenses/{ids[1]}", json={"memo": "저녁"})
+    assert daily_totals(db_session) == grouped_expenses(db_session)
+
+    client.delete(f"/api/expenses/{ids[2]}")
+    assert daily_totals(db_session) == grouped_expenses(db_session)
+    assert len(daily_totals(db_session)) == 2
+
+    assert client.post(f"/api/categories/{travel.id}/merge-into/{food.id}").status_code == 200
+    assert daily_totals(db_session) == grouped_expenses(db_session)
+    assert {row[1] for row in daily_totals(db_session)} == {str(food.id)}
+
+def test_copy_budgets_skips_existing_and_adjusts_limits(client, db_session):
+    food, rent = seed_categories(db_session, "식비", "주거")
+
+    for category, month, limit in (
+        (food, "2024-06", 100000),
+        (rent, "2024-06", 500000),
+        (rent, "2024-07", 450000),
+    ):
+        client.post(
+            "/api/budgets",
+            json={"category_id": str(category.id), "month": month, "limit_amount": limit},
+        )
+
+    resp = client.post("/api/budgets/copy", params={"from": "2024-06", "to": "2024-07", "percent": 10})
+    assert resp.status_code == 200
+    assert resp.json()["copied"] == 1
+
+    july = client.get("/api/budgets", params={"month": "2024-07"}).json()
+    limits = {b["category_id"]: b["limit_amount"] for b in july}
+    assert limits == {str(food.id): pytest.approx(110000), str(rent.id): 450000}
+
+    again = client.post("/api/budgets/copy", params={"from": "2024-06", "to": "2024-07"})
+    assert again.json()["copied"] == 0
+
+
+def test_copy_statement_rounds_numeric_on_postgresql():
+    adjusted = str(_copy_statement("postgresql", "2024-06", "2024-07", 10).compile(dialect=postgresql.dialect()))
+    assert "round(CAST(" in adjusted and "AS NUMERIC)" in adjusted
+
+    exact = str(_copy_statement("postgresql", "2024-06", "2024-07", 0).compile(dialect=postgresql.dialect()))
+    assert "round" not in exact
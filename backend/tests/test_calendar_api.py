@@ -0,0 +1,237 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.deps import get_db
+from app.main import app
+from app.models.calendar import CalendarOccurrence, CalendarOccurrenceHorizon
+from app.services.reminders import scheduler
+from app.models.user import User, UserRole
+
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db_session):
+    def override_get_db():
+        try:
+            yield db_session
+        finally:
+            db_session.rollback()
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+def seed_owner(db_session, email="calendar@example.com"):
+    owner = User(name="Owner", email=email, hashed_password="x", role=UserRole.ADMIN)
+    db_session.add(owner)
+    db_session.commit()
+    return owner
+
+
+def create_event(client, owner, **overrides):
+    payload = {
+        "title": "주간 회의",
+        "start_at": "2024-01-01T09:00:00+09:00",
+        "end_at": "2024-01-01T10:00:00+09:00",
+        "created_by": str(owner.id),
+    }
+    payload.update(overrides)
+    response = client.post("/api/calendar/events", json=payload)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def occurrences(client, start, end, **params):
+    response = client.get("/api/calendar/occurrences", params={"from": start, "to": end, **params})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def materialized(db_session, event_id):
+    rows = db_session.query(CalendarOccurrence.start_at).filter(CalendarOccurrence.event_id == UUID(event_id))
+    return sorted(start_at for start_at, in rows)
+
+
+def test_occurrences_expand_only_the_requested_window(client, db_session):
+    owner = seed_owner(db_session)
+    weekly = create_event(client, owner, recurrence_rule="FREQ=WEEKLY;BYDAY=MO,WE")
+    create_event(client, owner, title="월말 정산", recurrence_rule="FREQ=MONTHLY;BYMONTHDAY=-1",
+                 start_at="2020-01-31T18:00:00+09:00", end_at="2020-01-31T19:00:00+09:00")
+    create_event(client, owner, title="지난 일정", start_at="2024-02-01T09:00:00+09:00",
+                 end_at="2024-02-01T10:00:00+09:00")
+    create_event(client, owner, title="한 번", start_at="2024-03-05T12:00:00+09:00",
+                 end_at="2024-03-05T13:00:00+09:00")
+
+    result = occurrences(client, "2024-03-01T00:00:00+09:00", "2024-03-08T00:00:00+09:00")
+    assert [(o["title"], o["start_at"]) for o in result] == [
+        ("주간 회의", "2024-03-04T09:00:00+09:00"),
+        ("한 번", "2024-03-05T12:00:00+09:00"),
+        ("주간 회의", "2024-03-06T09:00:00+09:00"),
+    ]
+    assert result[0]["event_id"] == weekly["id"]
+    assert result[0]["end_at"] == "2024-03-04T10:00:00+09:00"
+    assert result[0]["is_recurring"] is True
+
+    month_end = occurrences(client, "2024-02-29T00:00:00+09:00", "2024-03-01T00:00:00+09:00")
+    assert [(o["title"], o["start_at"]) for o in month_end] == [("월말 정산", "2024-02-29T18:00:00+09:00")]
+
+
+def test_recurrence_follows_owner_time_zone_and_count(client, db_session):
+    owner = seed_owner(db_session)
+    preferences = client.put(f"/api/calendar/preferences/{owner.id}", json={"timezone": "America/New_York"})
+    assert preferences.status_code == 200
+    assert preferences.json()["timezone"] == "America/New_York"
+
+    # Naive times are the owner's wall clock; 09:00 stays 09:00 across DST.
+    create_event(client, owner, start_at="2024-03-01T09:00:00", end_at="2024-03-01T09:30:00",
+                 recurrence_rule="FREQ=WEEKLY;COUNT=3")
+
+    result = occurrences(client, "2024-02-26T00:00:00Z", "2024-04-01T00:00:00Z")
+    assert [o["start_at"] for o in result] == [
+        "2024-03-01T09:00:00-05:00",
+        "2024-03-08T09:00:00-05:00",
+        "2024-03-15T09:00:00-04:00",
+    ]
+
+    as_viewer = occurrences(client, "2024-03-08T00:00:00", "2024-03-09T00:00:00", user_id=str(owner.id))
+    assert [o["start_at"] for o in as_viewer] == ["2024-03-08T09:00:00-05:00"]
+
+
+def test_occurrences_are_materialized_and_rebuilt_per_event(client, db_session):
+    owner = seed_owner(db_session)
+    daily = create_event(client, owner, recurrence_rule="FREQ=DAILY")
+    weekly = create_event(client, owner, title="주간", recurrence_rule="FREQ=WEEKLY")
+    window = ("2025-06-01T00:00:00+09:00", "2025-06-08T00:00:00+09:00")
+
+    assert len(occurrences(client, *window)) == 8
+    horizon = db_session.query(CalendarOccurrenceHorizon).one()
+    weekly_rows = materialized(db_session, weekly["id"])
+    assert len(weekly_rows) > 50
+
+    updated = client.put(f"/api/calendar/events/{daily['id']}", json={"recurrence_rule": "FREQ=DAILY;INTERVAL=2"})
+    assert updated.status_code == 200
+    assert [o["start_at"][:10] for o in occurrences(client, *window) if o["title"] == "주간 회의"] == [
+        "2025-06-02", "2025-06-04", "2025-06-06",
+    ]
+    # Only the edited event was rebuilt.
+    assert materialized(db_session, weekly["id"]) == weekly_rows
+
+    # A window past the horizon extends it instead of expanding on read.
+    old_end = horizon.ends_at
+    far = occurrences(client, "2030-01-01T00:00:00+09:00", "2030-01-08T00:00:00+09:00")
+    assert len(far) == 5
+    db_session.refresh(horizon)
+    assert horizon.ends_at > old_end
+
+    client.delete(f"/api/calendar/events/{daily['id']}")
+    assert materialized(db_session, daily["id"]) == []
+
+
+def test_far_future_window_is_not_truncated(client, db_session):
+    owner = seed_owner(db_session)
+    create_event(client, owner, start_at="2020-01-01T09:00:00+09:00", end_at="2020-01-01T10:00:00+09:00",
+                 recurrence_rule="FREQ=DAILY")
+
+    # Extending the horizon by ~17 years expands more than one call's limit.
+    result = occurrences(client, "2045-03-01T00:00:00+09:00", "2045-04-01T00:00:00+09:00")
+    assert len(result) == 31
+    assert result[0]["start_at"] == "2045-03-01T09:00:00+09:00"
+    assert result[-1]["start_at"] == "2045-03-31T09:00:00+09:00"
+
+    middle = occurrences(client, "2036-07-01T00:00:00+09:00", "2036-07-03T00:00:00+09:00")
+    assert [o["start_at"][:10] for o in middle] == ["2036-07-01", "2036-07-02"]
+
+
+def due_reminders(client, since, until, **params):
+    response = client.get("/api/calendar/reminders/due", params={"since": since, "until": until, **params})
+    assert response.status_code == 200, response.text
+    return [(r["fire_at"], r["minutes_before"]) for r in response.json()]
+
+
+def test_due_reminders_follow_event_writes(client, db_session):
+    scheduler.reset()
+    owner = seed_owner(db_session)
+    event = create_event(
+        client, owner,
+        start_at="2025-06-09T09:00:00+09:00", end_at="2025-06-09T10:00:00+09:00",
+        recurrence_rule="FREQ=WEEKLY",
+        reminders=[{"minutes_before": 10}, {"minutes_before": 60, "method": "push"}],
+    )
+    since, until = "2025-06-16T07:00:00+09:00", "2025-06-16T08:55:00+09:00"
+
+    assert due_reminders(client, since, until) == [
+        ("2025-06-15T23:00:00Z", 60),
+        ("2025-06-15T23:50:00Z", 10),
+    ]
+    assert due_reminders(client, "2025-06-16T08:00:00+09:00", until) == [("2025-06-15T23:50:00Z", 10)]
+    assert due_reminders(client, since, until, user_id=str(uuid4())) == []
+
+    client.put(f"/api/calendar/events/{event['id']}", json={"reminders": [{"minutes_before": 30}]})
+    assert due_reminders(client, since, until) == [("2025-06-15T23:30:00Z", 30)]
+
+    client.delete(f"/api/calendar/events/{event['id']}")
+    assert due_reminders(client, since, until) == []
+
+
+def test_future_until_does_not_fire_upcoming_reminders(client, db_session):
+    scheduler.reset()
+    owner = seed_owner(db_session)
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    start = now + timedelta(days=2)
+    create_event(client, owner, start_at=start.isoformat(), end_at=(start + timedelta(hours=1)).isoformat(),
+                 reminders=[{"minutes_before": 10}])
+
+    # A client asking far ahead gets nothing that has not fired yet...
+    assert due_reminders(client, now.isoformat(), (now + timedelta(days=10)).isoformat()) == []
+
+    # ...and the reminder still fires when its time comes.
+    later = start
+    due = scheduler.due(db_session, now, now=later)
+    assert [reminder.fire_at for reminder in due] == [start - timedelta(minutes=10)]
+
+
+def test_visibility_and_validation(client, db_session):
+    owner = seed_owner(db_session)
+    other = seed_owner(db_session, email="other@example.com")
+    create_event(client, owner, title="개인")
+    create_event(client, other, title="공유", is_shared=True)
+    create_event(client, other, title="남의 일정")
+
+    visible = occurrences(client, "2024-01-01T00:00:00+09:00", "2024-01-02T00:00:00+09:00", user_id=str(owner.id))
+    assert sorted(o["title"] for o in visible) == ["개인", "공유"]
+
+    bad_rule = client.post("/api/calendar/events", json={
+        "title": "x", "start_at": "2024-01-01T09:00:00Z", "end_at": "2024-01-01T10:00:00Z",
+        "created_by": str(owner.id), "recurrence_rule": "FREQ=HOURLY",
+    })
+    assert bad_rule.status_code == 400
+    backwards = client.get("/api/calendar/occurrences", params={"from": "2024-02-01T00:00:00Z", "to": "2024-01-01T00:00:00Z"})
+    assert backwards.status_code == 400
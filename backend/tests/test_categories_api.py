@@ -0,0 +1,144 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.deps import get_db
+from app.main import app
+from app.models.category import Category, CategoryType
+from app.models.fixed_cost import FixedCost
+from app.models.user import User, UserRole
+
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db_session):
+    def override_get_db():
+        try:
+            yield db_session
+        finally:
+            db_session.rollback()
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+def test_list_categories_supports_conditional_get(client):
+    created = client.post("/api/categories", json={"name": "교통", "type": "expense"})
+    assert created.status_code == 201
+
+    first = client.get("/api/categories")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert [c["name"] for c in first.json()] == ["교통"]
+
+    not_modified = client.get("/api/categories", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    client.post("/api/categories", json={"name": "급여", "type": "income"})
+
+    changed = client.get("/api/categories", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert sorted(c["name"] for c in changed.json()) == ["교통", "급여"]
+
+
+def test_merge_category_moves_expenses_and_combines_budgets(client, db_session):
+    user = User(name="Tester", email="merge@example.com", hashed_password="x", role=UserRole.ADMIN)
+    source = Category(name="외식", type=CategoryType.EXPENSE)
+    target = Category(name="식비", type=CategoryType.EXPENSE)
+    income = Category(name="급여", type=CategoryType.INCOME)
+    db_session.add_all([user, source, target, income])
+    db_session.commit()
+    source_id, target_id = source.id, target.id
+
+    for category, month, limit in (
+        (source, "2024-05", 100000),
+        (source, "2024-06", 50000),
+        (target, "2024-06", 200000),
+    ):
+        client.post(
+            "/api/budgets",
+            json={"category_id": str(category.id), "month": month, "limit_amount": limit},
+        )
+    for day in ("2024-06-01", "2024-06-02"):
+        client.post(
+            "/api/expenses",
+            json={"category_id": str(source.id), "date": day, "amount": 1000, "memo": "저녁"},
+        )
+
+    fixed_cost = FixedCost(
+        name="외식 구독", category_id=source_id, amount=9900, payment_day=5,
+        start_date=date(2024, 1, 1), created_by=user.id,
+    )
+    db_session.add(fixed_cost)
+    db_session.commit()
+    fixed_cost_id = fixed_cost.id
+
+    mismatched = client.post(f"/api/categories/{source.id}/merge-into/{income.id}")
+    assert mismatched.status_code == 400
+
+    resp = client.post(f"/api/categories/{source_id}/merge-into/{target_id}")
+    assert resp.status_code == 200
+    assert resp.json()["expenses_moved"] == 2
+    assert resp.json()["fixed_costs_moved"] == 1
+    assert resp.json()["budgets_moved"] == 1
+    assert resp.json()["budgets_combined"] == 1
+
+    assert client.get(f"/api/categories/{source_id}").status_code == 404
+
+    budgets = client.get("/api/budgets", params={"category_id": str(target_id)}).json()
+    assert {(b["month"], b["limit_amount"]) for b in budgets} == {
+        ("2024-05", 100000),
+        ("2024-06", 250000),
+    }
+    expenses = client.get("/api/expenses", params={"category_id": str(target_id)}).json()
+    assert len(expenses) == 2
+    assert db_session.get(FixedCost, fixed_cost_id).category_id == target_id
+
+
+def test_delete_category_refuses_while_fixed_costs_use_it(client, db_session):
+    user = User(name="Tester", email="delete@example.com", hashed_password="x", role=UserRole.ADMIN)
+    category = Category(name="통신", type=CategoryType.EXPENSE)
+    db_session.add_all([user, category])
+    db_session.commit()
+    fixed_cost = FixedCost(
+        name="휴대폰", category_id=category.id, amount=55000, payment_day=25,
+        start_date=date(2024, 1, 1), created_by=user.id,
+    )
+    db_session.add(fixed_cost)
+    db_session.commit()
+
+    resp = client.delete(f"/api/categories/{category.id}")
+    assert resp.status_code == 400
+    assert "fixed costs" in resp.json()["detail"]
+
+    db_session.delete(fixed_cost)
+    db_session.commit()
+    assert client.delete(f"/api/categories/{category.id}").status_code == 200
@@ -0,0 +1,192 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.deps import get_db
+from app.main import app
+from app.models.category import Category, CategoryType
+from app.models.user import User, UserRole
+
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db_session):
+    def override_get_db():
+        try:
+            yield db_session
+        finally:
+            db_session.rollback()
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def seed_owner(db_session):
+    owner = User(name="Owner", email="fixed@example.com", hashed_password="x", role=UserRole.ADMIN)
+    housing = Category(name="주거", type=CategoryType.EXPENSE)
+    db_session.add_all([owner, housing])
+    db_session.commit()
+    return owner, housing
+
+
+def create_fixed_cost(client, owner, category, **overrides):
+    payload = {
+        "name": "월세",
+        "category_id": str(category.id),
+        "amount": 500000,
+        "payment_day": 25,
+        "start_date": "2024-01-01",
+        "created_by": str(owner.id),
+    }
+    payload.update(overrides)
+    response = client.post("/api/fixed-costs", json=payload)
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_generate_payments_is_idempotent_and_respects_dates(client, db_session):
+    owner, housing = seed_owner(db_session)
+    rent = create_fixed_cost(client, owner, housing)
+    power = create_fixed_cost(client, owner, housing, name="전기", amount=0, is_fixed_amount=False)
+    create_fixed_cost(client, owner, housing, name="끝난 구독", end_date="2024-02-29")
+    create_fixed_cost(client, owner, housing, name="다음 달 시작", start_date="2024-04-01")
+    create_fixed_cost(client, owner, housing, name="중지", is_active=False)
+
+    first = client.post("/api/fixed-costs/generate", params={"month": "2024-03"})
+    assert first.status_code == 200
+    assert first.json() == {"month": "2024-03", "generated": 2}
+
+    again = client.post("/api/fixed-costs/generate", params={"month": "2024-03"})
+    assert again.json()["generated"] == 0
+
+    payments = client.get("/api/fixed-costs/payments", params={"month": "2024-03"}).json()
+    by_cost = {payment["fixed_cost_id"]: payment for payment in payments}
+    assert set(by_cost) == {rent["id"], power["id"]}
+    assert by_cost[rent["id"]]["scheduled_amount"] == 500000
+    assert by_cost[power["id"]]["scheduled_amount"] is None
+    assert all(payment["status"] == "scheduled" for payment in payments)
+    assert all(payment["created_by"] == str(owner.id) for payment in payments)
+
+    assert client.post("/api/fixed-costs/generate", params={"month": "2024-13"}).status_code == 422
+
+
+def test_summary_covers_month_range_and_caches_closed_months(client, db_session):
+    from app.core.cache import table_versions
+    from app.models.fixed_cost import FixedCostPayment, FixedCostPaymentStatus
+    from app.services.fixed_cost_summary import PAYMENTS_TABLE, _closed_months
+
+    owner, housing = seed_owner(db_session)
+    create_fixed_cost(client, owner, housing)
+    create_fixed_cost(client, owner, housing, name="통신", amount=50000)
+    for month in ["2024-01", "2024-02"]:
+        client.post("/api/fixed-costs/generate", params={"month": month})
+
+    january = db_session.query(FixedCostPayment).filter(FixedCostPayment.year_month == "2024-01").all()
+    for payment in january:
+        payment.status = FixedCostPaymentStatus.PAID
+        payment.actual_amount = payment.scheduled_amount
+    february_rent = (
+        db_session.query(FixedCostPayment)
+        .filter(FixedCostPayment.year_month == "2024-02", FixedCostPayment.scheduled_amount == 500000)
+        .one()
+    )
+    february_rent.status = FixedCostPaymentStatus.PAID
+    february_rent.actual_amount = 500000
+    db_session.commit()
+
+    params = {"from": "2024-01", "to": "2024-03", "created_by": str(owner.id)}
+    summary = client.get("/api/fixed-costs/summary", params=params).json()
+    assert [month["year_month"] for month in summary] == ["2024-01", "2024-02", "2024-03"]
+    assert summary[0] == {
+        "year_month": "2024-01",
+        "total_scheduled": 550000,
+        "total_paid": 550000,
+        "total_remaining": 0,
+        "paid_count": 2,
+        "total_count": 2,
+        "paid_ratio": 100.0,
+    }
+    assert summary[1]["paid_count"] == 1
+    assert summary[1]["total_remaining"] == 50000
+    assert summary[2]["total_count"] == 0
+
+    # January is settled and in the past, so it is served from the cache
+    # while its payments are unchanged, whatever happens to other months...
+    def cached_january():
+        version = table_versions.row_version(PAYMENTS_TABLE, (owner.id, "2024-01"))
+        return _closed_months.get((owner.id, "2024-01"), version)
+
+    assert cached_january()["total_paid"] == 550000
+    february_rent.actual_amount = 400000
+    db_session.commit()
+    assert cached_january() is not None
+    assert client.get("/api/fixed-costs/summary", params=params).json()[0] == summary[0]
+
+    # ...and recomputed after a committed write to one of them.
+    january[0].actual_amount = 1
+    db_session.commit()
+    assert cached_january() is None
+    fresh = client.get("/api/fixed-costs/summary", params=params).json()
+    assert fresh[0]["total_paid"] == 50001
+
+    bad_range = client.get("/api/fixed-costs/summary", params={"from": "2024-03", "to": "2024-01"})
+    assert bad_range.status_code == 400
+
+
+def test_delete_is_soft_with_payments_and_hard_without(client, db_session):
+    owner, housing = seed_owner(db_session)
+    rent = create_fixed_cost(client, owner, housing)
+    client.post("/api/fixed-costs/generate", params={"month": "2024-03"})
+    gym = create_fixed_cost(client, owner, housing, name="헬스장", amount=60000)
+
+    soft = client.delete(f"/api/fixed-costs/{rent['id']}")
+    assert soft.json() == {"id": rent["id"], "mode": "soft"}
+    hard = client.delete(f"/api/fixed-costs/{gym['id']}")
+    assert hard.json() == {"id": gym["id"], "mode": "hard"}
+
+    assert client.get("/api/fixed-costs").json() == []
+    history = client.get("/api/fixed-costs", params={"include_inactive": True}).json()
+    assert [cost["id"] for cost in history] == [rent["id"]]
+    assert history[0]["is_active"] is False
+    assert history[0]["end_date"] is not None
+
+    # Deleting again is a no-op; unknown ids are 404.
+    assert client.delete(f"/api/fixed-costs/{rent['id']}").json()["mode"] == "soft"
+    assert client.delete(f"/api/fixed-costs/{gym['id']}").status_code == 404
+
+    payments = client.get("/api/fixed-costs/payments", params={"month": "2024-03"}).json()
+    assert [payment["fixed_cost_id"] for payment in payments] == [rent["id"]]
+
+
+def test_list_for_month_uses_active_costs_in_payment_day_order(client, db_session):
+    owner, housing = seed_owner(db_session)
+    create_fixed_cost(client, owner, housing, name="관리비", payment_day=10)
+    create_fixed_cost(client, owner, housing, name="월세", payment_day=1)
+    create_fixed_cost(client, owner, housing, name="예전 보험", start_date="2023-01-01", end_date="2023-12-31")
+    create_fixed_cost(client, owner, housing, name="중지", is_active=False)
+
+    listed = client.get("/api/fixed-costs", params={"month": "2024-03", "created_by": str(owner.id)}).json()
+    assert [cost["name"] for cost in listed] == ["월세", "관리비"]
@@ -2,6 +2,7 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.core.database import Base
 from app.core.deps import get_db
@@ -12,6 +13,7 @@ SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -97,3 +99,348 @@ def test_create_list_update_delete_transaction(client):
 
     final_list = client.get("/api/investments/transactions").json()
     assert final_list == []
+
+
+def test_account_valuation_is_invalidated_by_price_updates(client):
+    account_id = client.post(
+        "/api/investments/accounts",
+        json={"name": "평가 계좌", "broker": "가상증권"},
+    ).json()["id"]
+
+    holding_resp = client.post(
+        "/api/investments/holdings",
+        json={
+            "account_id": account_id,
+            "symbol": "AAA",
+            "name": "에이",
+            "qty": 10,
+            "avg_price": 100,
+            "current_price": 150,
+        },
+    )
+    holding_id = holding_resp.json()["id"]
+    client.post(
+        "/api/investments/holdings",
+        json={
+            "account_id": account_id,
+            "symbol": "BBB",
+            "name": "비",
+            "qty": 5,
+            "avg_price": 200,
+            "current_price": 100,
+        },
+    )
+
+    valuation = client.get(f"/api/investments/accounts/{account_id}/valuation").json()
+    assert valuation["market_value"] == 2000
+    assert valuation["cost_basis"] == 2000
+    assert valuation["gain"] == 0
+    weights = {p["symbol"]: p["weight"] for p in valuation["positions"]}
+    assert weights == {"AAA": 0.75, "BBB": 0.25}
+
+    client.put(f"/api/investments/holdings/{holding_id}", json={"current_price": 250})
+
+    refreshed = client.get(f"/api/investments/accounts/{account_id}/valuation").json()
+    assert refreshed["market_value"] == 3000
+    assert refreshed["gain"] == 1000
+
+    portfolio = client.get("/api/investments/valuation").json()
+    assert portfolio["market_value"] == 3000
+
+    missing = client.get(
+        "/api/investments/accounts/00000000-0000-0000-0000-000000000000/valuation"
+    )
+    assert missing.status_code == 404
+
+
+def test_import_transactions_csv_dedupes_and_supports_dry_run(client):
+    account_id = client.post(
+        "/api/investments/accounts",
+        json={"name": "가져오기 계좌", "broker": "가상증권"},
+    ).json()["id"]
+
+    client.post(
+        "/api/investments/transactions",
+        json={
+            "account_id": account_id,
+            "symbol": "AAA",
+            "type": "BUY",
+            "trade_date": "2024-01-02",
+            "quantity": 10,
+            "price": 100,
+        },
+    )
+
+    csv_body = (
+        "거래일자,종목코드,종목명,매매구분,수량,단가,수수료\n"
+        "2024.01.02,AAA,에이,매수,10,100,0\n"
+        "2024.01.03,BBB,비,매수,\"1,000\",50,1.5\n"
+        "2024.01.03,BBB,비,매수,\"1,000\",50,1.5\n"
+        "2024.01.04,CCC,씨,보유,1,1,0\n"
+    ).encode("utf-8")
+
+    def upload(dry_run):
+        return client.post(
+            "/api/investments/transactions/import",
+            params={"account_id": account_id, "mapping": "korean_broker", "dry_run": dry_run},
+            files={"file": ("statement.csv", csv_body, "text/csv")},
+        )
+
+    preview = upload(True)
+    assert preview.status_code == 200
+    summary = preview.json()
+    assert summary["total_rows"] == 4
+    assert summary["inserted"] == 1
+    assert summary["duplicates"] == 2
+    assert summary["duplicate_lines"] == [2, 4]
+    assert summary["errors"] == 1
+    assert summary["error_details"][0]["line"] == 5
+    assert len(client.get("/api/investments/transactions").json()) == 1
+
+    applied = upload(False).json()
+    assert applied["inserted"] == 1
+    transactions = client.get("/api/investments/transactions").json()
+    assert sorted(t["symbol"] for t in transactions) == ["AAA", "BBB"]
+
+    assert upload(False).json()["inserted"] == 0
+
+
+def test_import_reports_the_line_a_multiline_row_starts_on(client):
+    account_id = client.post(
+        "/api/investments/accounts",
+        json={"name": "여러 줄 계좌", "broker": "가상증권"},
+    ).json()["id"]
+
+    csv_body = (
+        "\ufeff거래일자,종목코드,종목명,매매구분,수량,단가,수수료\r\n"
+        "2024.01.02,AAA,\"에이\r\n우선주\",매수,10,100,0\r\n"
+        "2024.01.03,BBB,비,보유,1,1,0\r\n"
+    ).encode("utf-8")
+    response = client.post(
+        "/api/investments/transactions/import",
+        params={"account_id": account_id, "mapping": "korean_broker"},
+        files={"file": ("statement.csv", csv_body, "text/csv")},
+    )
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["inserted"] == 1
+    assert summary["error_details"][0]["line"] == 4
+
+
+def test_returns_report_xirr_and_twr_per_account_and_symbol(client):
+    account_id = client.post(
+        "/api/investments/accounts",
+        json={"name": "수익률 계좌", "broker": "가상증권"},
+    ).json()["id"]
+
+    for trade_date, price in (("2023-01-01", 100), ("2024-01-01", 110)):
+        client.post(
+            "/api/investments/transactions",
+            json={
+                "account_id": account_id,
+                "symbol": "AAA",
+                "type": "BUY",
+                "trade_date": trade_date,
+                "quantity": 10,
+                "price": price,
+            },
+        )
+    client.post(
+        "/api/investments/holdings",
+        json={
+            "account_id": account_id,
+            "symbol": "AAA",
+            "name": "에이",
+            "qty": 20,
+            "avg_price": 105,
+            "current_price": 121,
+        },
+    )
+
+    resp = client.get("/api/investments/returns", params={"as_of": "2025-01-01"})
+    assert resp.status_code == 200
+    body = resp.json()
+
+    account = next(a for a in body["accounts"] if a["account_id"] == account_id)
+    assert account["net_invested"] == 2100
+    assert account["market_value"] == 2420
+    # Price went 100 -> 110 -> 121: 10% per year regardless of the cash flows.
+    assert account["twr"] == pytest.approx(0.21)
+    # 1000 * 1.1^2 + 1100 * 1.1^(366/365) ~= 2420, so XIRR sits just under 10%.
+    assert account["xirr"] == pytest.approx(0.1, abs=1e-3)
+
+    symbols = [s for s in body["symbols"] if s["account_id"] == account_id]
+    assert [s["symbol"] for s in symbols] == ["AAA"]
+    assert symbols[0]["xirr"] == pytest.approx(account["xirr"])
+
+
+def test_split_adjusts_positions_without_rewriting_transactions(client):
+    account_id = client.post(
+        "/api/investments/accounts",
+        json={"name": "분할 계좌", "broker": "가상증권"},
+    ).json()["id"]
+
+    for trade_type, trade_date, quantity, price in (
+        ("BUY", "2024-01-10", 10, 100),
+        ("SELL", "2024-03-10", 4, 60),
+    ):
+        client.post(
+            "/api/investments/transactions",
+            json={
+                "account_id": account_id,
+                "symbol": "SPLT",
+                "type": trade_type,
+                "trade_date": trade_date,
+                "quantity": quantity,
+                "price": price,
+            },
+        )
+
+    split = client.post(
+        "/api/investments/corporate-actions",
+        json={"symbol": " splt ", "type": "SPLIT", "ex_date": "2024-02-01", "ratio": 2},
+    )
+    assert split.status_code == 201
+    assert split.json()["symbol"] == "SPLT"
+
+    positions = client.get(
+        "/api/investments/positions", params={"account_id": account_id}
+    ).json()
+    assert len(positions) == 1
+    position = positions[0]
+    # 10 @ 100 before a 2:1 split is 20 @ 50; selling 4 @ 60 realises 40.
+    assert position["qty"] == 16
+    assert position["avg_cost"] == 50
+    assert position["realized_pnl"] == 40
+
+    stored = client.get(
+        "/api/investments/transactions", params={"account_id": account_id}
+    ).json()
+    assert sorted(t["quantity"] for t in stored) == [4, 10]
+
+    client.delete(f"/api/investments/corporate-actions/{split.json()['id']}")
+    unadjusted = client.get(
+        "/api/investments/positions", params={"account_id": account_id}
+    ).json()[0]
+    assert unadjusted["qty"] == 6
+
+
+def test_valuation_converts_holdings_to_reporting_currency(client):
+    account_id = client.post(
+        "/api/investments/accounts",
+        json={"name": "외화 계좌", "broker": "가상증권"},
+    ).json()["id"]
+
+    client.post(
+        "/api/investments/holdings",
+        json={
+            "account_id": account_id,
+            "symbol": "USX",
+            "name": "미국 주식",
+            "qty": 2,
+            "avg_price": 100,
+            "current_price": 150,
+            "currency": "usd",
+        },
+    )
+    client.post(
+        "/api/investments/holdings",
+        json={
+            "account_id": account_id,
+            "symbol": "KRX",
+            "name": "국내 주식",
+            "qty": 1,
+            "avg_price": 100000,
+            "current_price": 100000,
+        },
+    )
+
+    missing = client.get(f"/api/investments/accounts/{account_id}/valuation")
+    assert missing.status_code == 400
+
+    ingest = client.post(
+        "/api/investments/fx-rates/bulk",
+        json=[
+            {"date": "2024-01-02", "pair": "USDKRW", "rate": 1300},
+            {"date": "2024-06-03", "pair": "USDKRW", "rate": 1400},
+        ],
+    )
+    assert ingest.json() == {"ingested": 2}
+
+    latest = client.get(f"/api/investments/accounts/{account_id}/valuation").json()
+    assert latest["currency"] == "KRW"
+    assert latest["market_value"] == 2 * 150 * 1400 + 100000
+
+    as_of = client.get(
+        f"/api/investments/accounts/{account_id}/valuation",
+        params={"as_of": "2024-03-01"},
+    ).json()
+    assert as_of["market_value"] == 2 * 150 * 1300 + 100000
+
+    in_usd = client.get(
+        f"/api/investments/accounts/{account_id}/valuation",
+        params={"currency": "USD"},
+    ).json()
+    assert in_usd["market_value"] == pytest.approx(300 + 100000 / 1400)
+
+
+def test_returns_and_positions_convert_mixed_currencies(client):
+    account_id = client.post(
+        "/api/investments/accounts",
+        json={"name": "혼합 통화 계좌", "broker": "가상증권"},
+    ).json()["id"]
+
+    for trade_date, price, currency in (("2024-01-02", 13000, "KRW"), ("2024-06-03", 1000, "JPY")):
+        client.post(
+            "/api/investments/transactions",
+            json={
+                "account_id": account_id,
+                "symbol": "AAA",
+                "type": "BUY",
+                "trade_date": trade_date,
+                "quantity": 1,
+                "price": price,
+                "currency": currency,
+            },
+        )
+    client.post(
+        "/api/investments/holdings",
+        json={
+            "account_id": account_id,
+            "symbol": "AAA",
+            "name": "에이",
+            "qty": 2,
+            "avg_price": 1000,
+            "current_price": 1100,
+            "currency": "JPY",
+        },
+    )
+
+    params = {"account_id": account_id, "as_of": "2024-12-31"}
+    assert client.get("/api/investments/returns", params=params).status_code == 400
+    assert client.get("/api/investments/positions", params=params).status_code == 400
+
+    client.post(
+        "/api/investments/fx-rates/bulk",
+        json=[
+            {"date": "2024-01-02", "pair": "JPYKRW", "rate": 13},
+            {"date": "2024-06-03", "pair": "JPYKRW", "rate": 14},
+            {"date": "2024-12-02", "pair": "JPYKRW", "rate": 14.5},
+        ],
+    )
+
+    returns = client.get("/api/investments/returns", params=params).json()
+    assert returns["currency"] == "KRW"
+    (account,) = returns["accounts"]
+    assert account["net_invested"] == 13000 + 1000 * 14
+    assert account["market_value"] == 2 * 1100 * 14.5
+
+    (position,) = client.get("/api/investments/positions", params=params).json()
+    assert position["currency"] == "KRW"
+    assert position["cost_basis"] == 13000 + 1000 * 14
+    assert position["unrealized_pnl"] == 2 * 1100 * 14.5 - (13000 + 1000 * 14)
+
+    in_jpy = client.get("/api/investments/returns", params={**params, "currency": "jpy"}).json()
+    assert in_jpy["currency"] == "JPY"
+    assert in_jpy["accounts"][0]["net_invested"] == pytest.approx(1000 + 1000)
+    assert in_jpy["accounts"][0]["market_value"] == pytest.approx(2200)
@@ -0,0 +1,189 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.deps import get_db
+from app.main import app
+from app.models.user import User, UserRole
+
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db_session):
+    def override_get_db():
+        try:
+            yield db_session
+        finally:
+            db_session.rollback()
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+def seed_user(db_session):
+    user = User(name="Tester", email="issues@example.com", hashed_password="x", role=UserRole.ADMIN)
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def test_issue_list_paginates_by_priority_and_filters(client, db_session):
+    user = seed_user(db_session)
+    bug = client.post("/api/issues/labels", json={"name": "bug", "color": "red"}).json()
+
+    for index, priority in enumerate(["Low", "Critical", "Medium", "High", "Critical"]):
+        client.post(
+            "/api/issues",
+            json={
+                "title": f"이슈 {index}",
+                "body": "예산 화면 오류" if index % 2 else "기타",
+                "status": "Open",
+                "priority": priority,
+                "assignee_id": str(user.id),
+                "label_ids": [bug["id"]] if priority == "Critical" else [],
+            },
+        )
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api/issues", params=params).json()
+        seen.extend(page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert [issue["priority"] for issue in seen] == ["Critical", "Critical", "High", "Medium", "Low"]
+    assert len({issue["id"] for issue in seen}) == 5
+    assert all(issue["labels"] == [{"name": "bug", "color": "red"}] for issue in seen[:2])
+
+    labelled = client.get("/api/issues", params={"label_id": bug["id"]}).json()["items"]
+    assert len(labelled) == 2
+
+    high = client.get("/api/issues", params={"priority": "High"}).json()["items"]
+    assert [issue["title"] for issue in high] == ["이슈 3"]
+
+    searched = client.get("/api/issues", params={"q": "예산"}).json()["items"]
+    assert sorted(issue["title"] for issue in searched) == ["이슈 1", "이슈 3"]
+
+    # The rank follows priority changes.
+    low = seen[-1]
+    client.put(f"/api/issues/{low['id']}", json={"priority": "Critical"})
+    first = client.get("/api/issues", params={"limit": 3}).json()["items"]
+    assert low["id"] in {issue["id"] for issue in first}
+
+    assert client.get("/api/issues", params={"cursor": "garbage"}).status_code == 400
+
+
+def test_issue_label_lookups_are_served_from_reference_cache(client, db_session):
+    from sqlalchemy import event
+
+    user = seed_user(db_session)
+    bug = client.post("/api/issues/labels", json={"name": "bug", "color": "red"}).json()
+    ui = client.post("/api/issues/labels", json={"name": "ui", "color": "blue"}).json()
+    client.get("/api/issues/labels")  # warm the cache
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        created = client.post(
+            "/api/issues",
+            json={
+                "title": "캐시",
+                "body": "라벨 조회",
+                "status": "Open",
+                "priority": "Low",
+                "assignee_id": str(user.id),
+                "label_ids": [bug["id"], ui["id"]],
+            },
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert created.status_code == 200
+    assert sorted(label["name"] for label in created.json()["labels"]) == ["bug", "ui"]
+    assert not any("FROM labels" in statement and "issue_labels" not in statement for statement in statements)
+
+    stats = client.get("/api/health").json()["reference_cache"]
+    assert stats["hits"] >= 1
+
+    # A new label invalidates the cached table.
+    client.post("/api/issues/labels", json={"name": "perf", "color": "green"})
+    names = [label["name"] for label in client.get("/api/issues/labels").json()]
+    assert names == ["bug", "perf", "ui"]
+
+
+def test_issue_comments_page_by_creation_and_count_in_bulk(client, db_session):
+    user = seed_user(db_session)
+    issue = client.post(
+        "/api/issues",
+        json={"title": "댓글", "body": "내용", "status": "Open", "priority": "Low", "assignee_id": str(user.id)},
+    ).json()
+    other = client.post(
+        "/api/issues",
+        json={"title": "빈 이슈", "body": "내용", "status": "Open", "priority": "Low", "assignee_id": str(user.id)},
+    ).json()
+
+    for index in range(3):
+        created = client.post(
+            f"/api/issues/{issue['id']}/comments",
+            json={"user_id": str(user.id), "content": f"댓글 {index}"},
+        )
+        assert created.status_code == 200
+        assert created.json()["user"]["name"] == "Tester"
+
+    first = client.get(f"/api/issues/{issue['id']}/comments", params={"limit": 2}).json()
+    assert [comment["content"] for comment in first["items"]] == ["댓글 0", "댓글 1"]
+    assert first["next_cursor"]
+    second = client.get(
+        f"/api/issues/{issue['id']}/comments", params={"limit": 2, "cursor": first["next_cursor"]}
+    ).json()
+    assert [comment["content"] for comment in second["items"]] == ["댓글 2"]
+    assert second["next_cursor"] is None
+    assert all(comment["user"]["email"] == "issues@example.com" for comment in second["items"])
+
+    edited = client.put(f"/api/issues/comments/{second['items'][0]['id']}", json={"content": "수정됨"})
+    assert edited.json()["content"] == "수정됨"
+    assert client.delete(f"/api/issues/comments/{first['items'][0]['id']}").status_code == 200
+
+    counts = client.get(
+        "/api/issues/comments/counts", params=[("issue_id", issue["id"]), ("issue_id", other["id"])]
+    ).json()
+    assert counts == [{"issue_id": issue["id"], "count": 2}, {"issue_id": other["id"], "count": 0}]
+
+    missing_user = client.post(
+        f"/api/issues/{issue['id']}/comments",
+        json={"user_id": "00000000-0000-0000-0000-000000000000", "content": "x"},
+    )
+    assert missing_user.status_code == 400
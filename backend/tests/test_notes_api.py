@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.deps import get_db
+from app.main import app
+from app.models.note import Note, NoteArchive
+from app.models.user import User, UserRole
+from app.services.note_retention import NoteRetentionSchedule
+
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db_session):
+    def override_get_db():
+        try:
+            yield db_session
+        finally:
+            db_session.rollback()
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+def seed_notes(db_session):
+    owner = User(name="Owner", email="notes@example.com", hashed_password="x", role=UserRole.ADMIN)
+    db_session.add(owner)
+    db_session.commit()
+
+    now = datetime.now(timezone.utc)
+    old, recent = now - timedelta(days=30), now - timedelta(days=2)
+    notes = [
+        Note(content=f"old done {i}", is_completed=True, created_by=owner.id, created_at=old, completed_at=old)
+        for i in range(1200)
+    ]
+    notes += [
+        # No completion time recorded: kept, as the client's purge did.
+        Note(content="done without completed_at", is_completed=True, created_by=owner.id, created_at=old),
+        Note(content="old but recently done", is_completed=True, created_by=owner.id, created_at=old, completed_at=recent),
+        Note(content="old and open", is_completed=False, created_by=owner.id, created_at=old),
+        Note(content="recent done", is_completed=True, created_by=owner.id, created_at=recent, completed_at=recent),
+    ]
+    db_session.add_all(notes)
+    db_session.commit()
+    return owner
+
+
+def remaining(db_session):
+    db_session.expire_all()
+    return sorted(content for content, in db_session.query(Note.content))
+
+
+def test_purge_deletes_expired_completed_notes_in_batches(client, db_session):
+    seed_notes(db_session)
+
+    response = client.post("/api/notes/purge", params={"older_than_days": 7})
+    assert response.status_code == 202
+    job = client.get(f"/api/notes/purge-jobs/{response.json()['id']}").json()
+    assert job["status"] == "completed"
+    assert job["result"] == {"purged": 1200, "mode": "delete", "older_than_days": 7}
+    assert job["processed"] == 1200
+    assert remaining(db_session) == [
+        "done without completed_at", "old and open", "old but recently done", "recent done",
+    ]
+    assert db_session.query(NoteArchive).count() == 0
+
+
+def test_scheduled_purge_archives(client, db_session):
+    seed_notes(db_session)
+    schedule = NoteRetentionSchedule(TestingSessionLocal, timedelta(minutes=60), older_than_days=7, mode="archive")
+
+    job = schedule.run_once()
+    assert job.result["purged"] == 1200
+    assert len(remaining(db_session)) == 4
+    archived = db_session.query(NoteArchive).filter(NoteArchive.content == "old done 0").one()
+    assert archived.is_completed is True
+    assert db_session.query(NoteArchive).count() == 1200
+
+
+def test_completing_a_note_stamps_completed_at(client, db_session):
+    owner = seed_notes(db_session)
+    created = client.post("/api/notes", json={"content": "장보기", "created_by": str(owner.id)})
+    assert created.status_code == 201
+    assert created.json()["completed_at"] is None
+
+    done = client.put(f"/api/notes/{created.json()['id']}", json={"is_completed": True})
+    assert done.json()["completed_at"] is not None
+    reopened = client.put(f"/api/notes/{created.json()['id']}", json={"is_completed": False})
+    assert reopened.json()["completed_at"] is None
@@ -0,0 +1,172 @@
+from uuid import UUID
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.deps import get_db
+from app.main import app
+from app.models.study import StudyReference, StudySessionTag
+from app.models.user import User, UserRole
+from app.services.study_tags import _prefix_match, facets
+
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db_session):
+    def override_get_db():
+        try:
+            yield db_session
+        finally:
+            db_session.rollback()
+
+    app.dependency_overrides[get_db] = override_get_db
+    facets.reset()
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+def seed_sessions(client, db_session):
+    owner = User(name="Owner", email="study@example.com", hashed_password="x", role=UserRole.ADMIN)
+    db_session.add(owner)
+    db_session.commit()
+
+    ids = {}
+    for topic, tags in [
+        ("Indexes", ["postgres", "indexing", "gin"]),
+        ("Query plans", ["postgres", "planner"]),
+        ("Caching", ["python", "caching"]),
+        ("Profiling", [" python ", "perf", "python"]),
+    ]:
+        response = client.post(
+            "/api/study-sessions",
+            json={"topic": topic, "date": "2026-10-01", "tags": tags, "created_by": str(owner.id)},
+        )
+        assert response.status_code == 201
+        ids[topic] = response.json()["id"]
+    return ids
+
+
+def topics(response):
+    return sorted(item["topic"] for item in response.json()["items"])
+
+
+def test_search_by_any_all_and_prefix(client, db_session):
+    seed_sessions(client, db_session)
+
+    response = client.get("/api/study-sessions/search", params={"any": ["gin", "caching"]})
+    assert response.status_code == 200
+    assert topics(response) == ["Caching", "Indexes"]
+    assert response.json()["total"] == 2
+
+    response = client.get("/api/study-sessions/search", params={"all": ["postgres", "planner"]})
+    assert topics(response) == ["Query plans"]
+
+    response = client.get("/api/study-sessions/search", params={"prefix": "p"})
+    assert response.json()["total"] == 4
+    response = client.get("/api/study-sessions/search", params={"prefix": "pl"})
+    assert topics(response) == ["Query plans"]
+
+    # Facets count tags over the matching sessions only.
+    response = client.get("/api/study-sessions/search", params={"any": ["postgres"]})
+    assert response.json()["facets"][0] == {"tag": "postgres", "count": 2}
+    assert {facet["tag"] for facet in response.json()["facets"]} == {"postgres", "indexing", "gin", "planner"}
+
+    response = client.get("/api/study-sessions/search", params={"limit": 1, "offset": 1})
+    assert response.json()["total"] == 4
+    assert len(response.json()["items"]) == 1
+
+
+def test_tags_are_normalized_and_mirrored(client, db_session):
+    ids = seed_sessions(client, db_session)
+
+    response = client.get(f"/api/study-sessions/{ids['Profiling']}")
+    assert response.json()["tags"] == ["python", "perf"]
+    rows = db_session.scalars(select(StudySessionTag.tag)).all()
+    assert rows.count("python") == 2
+    assert len(rows) == 9
+
+
+def test_tag_facets_follow_writes(client, db_session):
+    ids = seed_sessions(client, db_session)
+
+    response = client.get("/api/study-sessions/tags")
+    assert response.json()[:2] == [{"tag": "postgres", "count": 2}, {"tag": "python", "count": 2}]
+    assert client.get("/api/study-sessions/tags", params={"prefix": "p", "limit": 3}).json() == [
+        {"tag": "postgres", "count": 2},
+        {"tag": "python", "count": 2},
+        {"tag": "perf", "count": 1},
+    ]
+
+    client.put(f"/api/study-sessions/{ids['Caching']}", json={"tags": ["caching", "redis"]})
+    client.put(f"/api/study-sessions/{ids['Query plans']}", json={"topic": "Plans"})
+    client.delete(f"/api/study-sessions/{ids['Indexes']}")
+
+    expected = {"postgres": 1, "planner": 1, "python": 1, "perf": 1, "caching": 1, "redis": 1}
+    counts = {facet["tag"]: facet["count"] for facet in client.get("/api/study-sessions/tags").json()}
+    assert counts == expected
+    assert counts == dict(
+        db_session.execute(select(StudySessionTag.tag, func.count()).group_by(StudySessionTag.tag)).all()
+    )
+
+    # A write the cache did not see is picked up through the table version.
+    db_session.add(StudySessionTag(study_session_id=UUID(ids["Caching"]), tag="extra"))
+    db_session.commit()
+    counts = {facet["tag"]: facet["count"] for facet in client.get("/api/study-sessions/tags").json()}
+    assert counts["extra"] == 1
+
+
+def test_delete_removes_references_and_followups(client, db_session):
+    ids = seed_sessions(client, db_session)
+    session_id = ids["Indexes"]
+
+    response = client.post(f"/api/study-sessions/{session_id}/references", json={"title": "GIN docs"})
+    assert response.status_code == 201
+    reference_id = response.json()["id"]
+    response = client.put(f"/api/study-sessions/references/{reference_id}", json={"url": "https://example.com"})
+    assert response.json()["url"] == "https://example.com"
+
+    response = client.post(f"/api/study-sessions/{session_id}/followups", json={"task": "Try jsonb_path_ops"})
+    followup_id = response.json()["id"]
+    response = client.put(f"/api/study-sessions/followups/{followup_id}", json={"completed": True})
+    assert response.json()["completed"] is True
+
+    session = client.get(f"/api/study-sessions/{session_id}").json()
+    assert [reference["title"] for reference in session["references"]] == ["GIN docs"]
+    assert len(session["followups"]) == 1
+
+    assert client.delete(f"/api/study-sessions/{session_id}").status_code == 204
+    assert client.get(f"/api/study-sessions/{session_id}").status_code == 404
+    assert db_session.scalar(select(func.count()).select_from(StudyReference)) == 0
+    assert client.put(f"/api/study-sessions/followups/{followup_id}", json={"completed": False}).status_code == 404
+
+
+def test_prefix_search_uses_like_on_postgresql():
+    # A >= / < range is only a prefix match under byte-order collation.
+    compiled = _prefix_match("postgresql", "c_%").compile(dialect=postgresql.dialect())
+    assert "LIKE" in str(compiled) and ">=" not in str(compiled)
+    assert list(compiled.params.values()) == ["c/_/%%"]
@@ -0,0 +1,193 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.cache import table_versions
+from app.core.database import Base
+from app.core.deps import get_db
+from app.main import app
+from app.models.category import Category, CategoryType
+from app.models.fixed_cost import FixedCost
+from app.models.note import Note
+from app.models.study import StudySession, StudySessionTag
+from app.models.user import User, UserRole
+
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db_session):
+    def override_get_db():
+        try:
+            yield db_session
+        finally:
+            db_session.rollback()
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+def test_user_activity_groups_expenses_and_open_issues(client, db_session):
+    alice = User(name="Alice", email="alice@example.com", hashed_password="x", role=UserRole.ADMIN)
+    bob = User(name="Bob", email="bob@example.com", hashed_password="x", role=UserRole.EDITOR)
+    food = Category(name="식비", type=CategoryType.EXPENSE)
+    db_session.add_all([alice, bob, food])
+    db_session.commit()
+
+    for day, amount in [("2024-03-02", 10000), ("2024-03-20", 5000), ("2024-04-01", 7000)]:
+        client.post(
+            "/api/expenses",
+            json={
+                "category_id": str(food.id),
+                "date": day,
+                "amount": amount,
+                "memo": "점심",
+                "created_by": str(alice.id),
+            },
+        )
+    for issue_status in ["Open", "In Progress", "Closed", "Open"]:
+        client.post(
+            "/api/issues",
+            json={
+                "title": "할 일",
+                "body": "내용",
+                "status": issue_status,
+                "priority": "Low",
+                "assignee_id": str(bob.id),
+            },
+        )
+
+    response = client.get("/api/users/activity", params={"from": "2024-03-01", "to": "2024-03-31"})
+    assert response.status_code == 200
+    by_name = {entry["name"]: entry for entry in response.json()}
+
+    assert by_name["Alice"]["expense_count"] == 2
+    assert by_name["Alice"]["expense_total"] == 15000
+    assert by_name["Alice"]["last_activity"] == "2024-03-20"
+    assert by_name["Alice"]["open_issues"] == {}
+
+    assert by_name["Bob"]["expense_count"] == 0
+    assert by_name["Bob"]["last_activity"] is None
+    assert by_name["Bob"]["open_issues"] == {"Open": 2, "In Progress": 1}
+
+    invalid = client.get("/api/users/activity", params={"from": "2024-04-01", "to": "2024-03-01"})
+    assert invalid.status_code == 400
+
+
+def test_delete_user_reassigns_in_batches_in_the_background(client, db_session, monkeypatch):
+    from app.services import user_deletion
+
+    monkeypatch.setattr(user_deletion, "CHUNK_SIZE", 2)
+
+    keeper = User(name="Keeper", email="keeper@example.com", hashed_password="x", role=UserRole.ADMIN)
+    leaver = User(name="Leaver", email="leaver@example.com", hashed_password="x", role=UserRole.EDITOR)
+    food = Category(name="식비", type=CategoryType.EXPENSE)
+    db_session.add_all([keeper, leaver, food])
+    db_session.commit()
+    keeper_id, leaver_id = str(keeper.id), str(leaver.id)
+
+    for day in range(1, 6):
+        client.post(
+            "/api/expenses",
+            json={
+                "category_id": str(food.id),
+                "date": f"2024-05-0{day}",
+                "amount": 1000,
+                "memo": "커피",
+                "created_by": leaver_id,
+            },
+        )
+    client.post(
+        "/api/issues",
+        json={"title": "정리", "body": "내용", "status": "Open", "priority": "Low", "assignee_id": leaver_id},
+    )
+
+    db_session.add_all([
+        FixedCost(
+            name="월세", category_id=food.id, amount=500000, payment_day=1,
+            start_date=date(2024, 1, 1), created_by=leaver.id,
+        ),
+        Note(content="개인 메모", created_by=leaver.id),
+        Note(content="남는 메모", created_by=keeper.id),
+    ])
+    session = StudySession(topic="개인 공부", tags=["sql"], created_by=leaver.id)
+    db_session.add(session)
+    db_session.flush()
+    db_session.add(StudySessionTag(study_session_id=session.id, tag="sql"))
+    db_session.commit()
+
+    # Shared records need someone named to take them over.
+    assert client.delete(f"/api/users/{leaver_id}").status_code == 400
+    assert client.delete(f"/api/users/{leaver_id}", params={"reassign_to": leaver_id}).status_code == 400
+
+    response = client.delete(f"/api/users/{leaver_id}", params={"reassign_to": keeper_id})
+    assert response.status_code == 202
+    job = response.json()
+
+    status = client.get(f"/api/users/deletion-jobs/{job['id']}").json()
+    assert status["status"] == "completed"
+    assert status["total"] == status["processed"] == 9
+    result = status["result"]
+    assert result["policy"] == "reassign_shared_delete_personal"
+    assert result["reassigned_to"] == keeper_id
+    assert result["reassigned"]["expenses"] == 5
+    assert result["reassigned"]["fixed_costs"] == 1
+    assert result["deleted"]["notes"] == 1
+    assert result["deleted"]["study_sessions"] == 1
+
+    # Personal data is deleted, never handed to another user.
+    db_session.expire_all()
+    assert db_session.query(FixedCost).one().created_by == keeper.id
+    assert [note.content for note in db_session.query(Note)] == ["남는 메모"]
+    assert db_session.query(StudySession).count() == 0
+    assert db_session.query(StudySessionTag).count() == 0
+
+    assert client.get(f"/api/users/{leaver_id}").status_code == 404
+    expenses = client.get("/api/expenses").json()
+    assert {expense["created_by"] for expense in expenses} == {keeper_id}
+    issues = client.get("/api/issues").json()["items"]
+    assert [issue["assignee_id"] for issue in issues] == [keeper_id]
+
+    # The last remaining user has no one to hand shared records to.
+    assert client.delete(f"/api/users/{keeper_id}").status_code == 400
+    assert client.get("/api/users/deletion-jobs/00000000-0000-0000-0000-000000000000").status_code == 404
+
+
+def test_delete_user_marks_cascaded_tables_written(client, db_session):
+    # On PostgreSQL the users FKs cascade into tables the ORM never sees,
+    # e.g. study_session_tags through study_sessions; their version-keyed
+    # caches must reload.
+    keeper = User(name="Keeper", email="keeper@example.com", hashed_password="x", role=UserRole.ADMIN)
+    leaver = User(name="Leaver", email="leaver@example.com", hashed_password="x", role=UserRole.EDITOR)
+    db_session.add_all([keeper, leaver])
+    db_session.commit()
+    tags_before = table_versions.get(StudySessionTag.__tablename__)
+
+    job = client.delete(f"/api/users/{leaver.id}").json()
+
+    assert client.get(f"/api/users/deletion-jobs/{job['id']}").json()["status"] == "completed"
+    assert table_versions.get(StudySessionTag.__tablename__) > tags_before